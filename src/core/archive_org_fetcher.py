@@ -14,32 +14,63 @@ No API key or authentication is required.
 from __future__ import annotations
 
 import contextlib
+import copy
+import functools
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup -- fall back to the stdlib decoder
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # optional -- large search responses are decoded in one piece
+    ijson = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 from src.models.match_result import MatchCandidate
 from src.utils.constants import (
     API_MAX_RETRIES,
+    API_RETRY_BACKOFF_MAX_SECONDS,
     API_RETRY_BACKOFF_SECONDS,
+    API_RETRY_JITTER_SECONDS,
+    API_RETRY_STATUS_CODES,
     APP_NAME,
     APP_VERSION,
     ARCHIVE_ORG_CACHE_FILENAME,
     ARCHIVE_ORG_CACHE_MAX_AGE_DAYS,
     ARCHIVE_ORG_DJ_SCREW_COLLECTION,
     ARCHIVE_ORG_DOWNLOAD_URL,
+    ARCHIVE_ORG_ITEM_CACHE_SIZE,
+    ARCHIVE_ORG_MAX_WORKERS,
     ARCHIVE_ORG_METADATA_URL,
+    ARCHIVE_ORG_POOL_SIZE,
     ARCHIVE_ORG_RATE_LIMIT,
     ARCHIVE_ORG_SEARCH_URL,
+    ARCHIVE_ORG_STREAM_PARSE_MIN_BYTES,
     ARCHIVE_ORG_TIMEOUT_SECONDS,
+    ARCHIVE_ORG_TITLE_CACHE_SIZE,
     DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST,
     DJ_SCREW_CHAPTER_FORMAT,
     MIN_API_RATE_INTERVAL,
+    SECONDS_PER_DAY,
 )
 from src.utils.logger import get_logger
 from src.utils.rate_limiter import rate_limiter
@@ -48,6 +79,11 @@ logger = get_logger("core.archive_org_fetcher")
 
 _IA_RATE = max(ARCHIVE_ORG_RATE_LIMIT, MIN_API_RATE_INTERVAL)
 
+# Metadata payloads for large chapter items run to hundreds of KB.  orjson
+# decodes the raw response bytes directly, skipping requests' charset
+# detection and the intermediate str.
+_json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
+
 # Files with these formats in archive.org are the original uploaded MP3s.
 _AUDIO_FORMATS = frozenset(
     {
@@ -66,63 +102,265 @@ _AUDIO_FORMATS = frozenset(
 # Examples:
 #   "DJ Screw - Chapter 051. 9 Fo Shit (1994)"
 #   "DJ Screw - Chapter 001. Syrup Sippers (1993)"
+# re.ASCII keeps \d and \s on the cheaper ASCII tables; the title text itself
+# is still matched by ".+?" whatever its script.
 _CHAPTER_TITLE_RE = re.compile(
     r"Chapter\s*(\d{1,3})\.\s*(.+?)(?:\s*\(\d{4}\))?\s*$",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
+# Sorts tracks without a track number after every numbered track.
+_UNNUMBERED_TRACK_SORT = 999
+
+# Cover art filenames in priority order (lowercased).  Any file with the
+# "Item Image" format ranks below all of these.
+_COVER_ART_RANKS = {
+    name: rank
+    for rank, name in enumerate(
+        (
+            "front.jpg",
+            "front.png",
+            "cover.jpg",
+            "cover.png",
+            "folder.jpg",
+            "folder.png",
+            "albumartsmall.jpg",
+        )
+    )
+}
+_ITEM_IMAGE_RANK = len(_COVER_ART_RANKS)
+
+# Fallback cleanup for item titles that don't follow the chapter pattern.
+_DJ_PREFIX_RE = re.compile(r"^DJ\s+Screw\s*[-–—:]\s*", re.IGNORECASE)  # noqa: RUF001
+_YEAR_SUFFIX_RE = re.compile(r"\s*\(\d{4}\)\s*$")
+
+# Archive.org audio filenames, used when a file entry lacks title/artist.
+_FILE_EXT_RE = re.compile(r"\.[^.]+$")
+# "101. Champ # Mike - Keep # Get"
+_IA_DOTTED_NAME_RE = re.compile(r"^(\d+)\.\s*(.+?)\s*-\s*(.+)$")
+# "01 - Artist Name - Track Title"
+_IA_DASHED_NAME_RE = re.compile(r"^(\d+)\s*-\s*(.+?)\s*-\s*(.+)$")
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled HTTP session that retries transient failures.
+
+    Retries (connection errors, timeouts, and 429/5xx responses) happen
+    inside urllib3's ``Retry``, which backs off exponentially (capped, with
+    random jitter so parallel workers don't retry in lockstep) and honors
+    ``Retry-After`` headers.
+
+    Returns:
+        Configured ``requests.Session``.
+    """
+    retry = Retry(
+        total=API_MAX_RETRIES,
+        backoff_factor=API_RETRY_BACKOFF_SECONDS,
+        backoff_max=API_RETRY_BACKOFF_MAX_SECONDS,
+        backoff_jitter=API_RETRY_JITTER_SECONDS,
+        status_forcelist=API_RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=ARCHIVE_ORG_POOL_SIZE,
+        pool_maxsize=ARCHIVE_ORG_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": f"{APP_NAME}/{APP_VERSION}"})
+    return session
+
 
 def _retry_request(
     method: str,
     url: str,
     params: dict | None = None,
-    max_retries: int = API_MAX_RETRIES,
     session: requests.Session | None = None,
+    extra_headers: dict[str, str] | None = None,
+    stream: bool = False,
 ) -> requests.Response | None:
-    """Make an HTTP request with exponential-backoff retries.
+    """Make an HTTP request, returning None on failure.
 
     Args:
         method: HTTP method ("GET").
         url: Request URL.
         params: Query parameters.
-        max_retries: Maximum number of attempts.
-        session: Optional ``requests.Session`` for connection pooling.
+        session: Optional ``requests.Session`` for connection pooling.  Retries
+            are handled by the session's adapter (see ``_build_session``).
             Falls back to a bare ``requests.request()`` if not provided.
+        extra_headers: Optional headers to send in addition to the User-Agent
+            (e.g. ``If-Modified-Since``).
+        stream: If True, defer downloading the body so it can be read
+            incrementally from ``resp.raw``.
 
     Returns:
-        Response object, or None if all retries failed.
+        Response object (including 304 Not Modified), or None if the request
+        failed or returned a 4xx/5xx status.  Client errors such as 404 are
+        reported once and never retried.
     """
     headers = {"User-Agent": f"{APP_NAME}/{APP_VERSION}"}
+    if extra_headers:
+        headers.update(extra_headers)
     requester = session or requests
-    for attempt in range(1, max_retries + 1):
-        try:
-            resp = requester.request(
-                method,
-                url,
-                params=params,
-                headers=headers,
-                timeout=ARCHIVE_ORG_TIMEOUT_SECONDS,
+    try:
+        resp = requester.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            timeout=ARCHIVE_ORG_TIMEOUT_SECONDS,
+            stream=stream,
+        )
+    except requests.RequestException as exc:
+        logger.error("archive.org request failed: %s", exc)
+        return None
+
+    if resp.status_code >= HTTPStatus.BAD_REQUEST:
+        # Transient statuses were already retried by the session's adapter;
+        # anything left (e.g. 404 for a wrong identifier) won't succeed on retry.
+        logger.warning("archive.org: %s returned HTTP %d", url, resp.status_code)
+        resp.close()
+        return None
+    return resp
+
+
+def _collection_query(collection: str, query: str | None) -> str:
+    """Build the Advanced Search ``q`` for items in *collection*."""
+    q = f"collection:{collection}"
+    if query:
+        q += f" AND ({query})"
+    return q
+
+
+# fetch_item_tracks arguments that determine its result:
+# (identifier, album_override, year_override)
+_TracksKey = tuple[str, str | None, str | None]
+
+
+@dataclass
+class _ItemMetadata:
+    """The parts of an archive.org item's metadata that track parsing uses.
+
+    Attributes:
+        metadata: Item-level metadata dict (title, year, creator, ...).
+        audio_files: File entries for the item's original audio files.
+        cover_art_url: Best cover art URL found in the file list, if any.
+    """
+
+    metadata: dict[str, Any]
+    audio_files: list[dict[str, Any]]
+    cover_art_url: str | None
+
+
+@dataclass
+class _ScrewIndex:
+    """DJ Screw chapter index stored as parallel per-field lists.
+
+    Row *i* of each list describes one chapter and ``rows`` maps a chapter
+    number to its row.  Reverse title lookup only needs the chapter titles,
+    so it scans the flat list from ``search_choices()`` rather than one dict
+    per chapter.
+    """
+
+    chapters: list[int] = field(default_factory=list)
+    identifiers: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    chapter_titles: list[str] = field(default_factory=list)
+    years: list[str] = field(default_factory=list)
+    rows: dict[int, int] = field(default_factory=dict)
+    _search: tuple[list[str], list[int]] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_entries(cls, entries: dict[int, dict[str, str]]) -> _ScrewIndex:
+        """Build an index from the ``{chapter_num: entry_dict}`` cache format."""
+        index = cls()
+        for chapter_num, entry in entries.items():
+            index.add(
+                chapter_num,
+                identifier=entry.get("identifier", ""),
+                title=entry.get("title", ""),
+                chapter_title=entry.get("chapter_title", ""),
+                year=entry.get("year", ""),
             )
-            resp.raise_for_status()
-            return resp
-        except Exception as exc:
-            wait_time = API_RETRY_BACKOFF_SECONDS * attempt
-            if attempt < max_retries:
-                logger.warning(
-                    "archive.org request failed (attempt %d/%d): %s -- retrying in %.0fs",
-                    attempt,
-                    max_retries,
-                    exc,
-                    wait_time,
-                )
-                time.sleep(wait_time)
-            else:
-                logger.error(
-                    "archive.org request failed after %d attempts: %s",
-                    max_retries,
-                    exc,
-                )
-    return None
+        return index
+
+    def __len__(self) -> int:
+        return len(self.chapters)
+
+    def add(
+        self,
+        chapter_num: int,
+        identifier: str,
+        title: str,
+        chapter_title: str,
+        year: str,
+    ) -> None:
+        """Add a chapter, replacing any existing row for the same number."""
+        row = self.rows.get(chapter_num)
+        if row is None:
+            self.rows[chapter_num] = len(self.chapters)
+            self.chapters.append(chapter_num)
+            self.identifiers.append(identifier)
+            self.titles.append(title)
+            self.chapter_titles.append(chapter_title)
+            self.years.append(year)
+        else:
+            self.identifiers[row] = identifier
+            self.titles[row] = title
+            self.chapter_titles[row] = chapter_title
+            self.years[row] = year
+        self._search = None
+
+    def entry(self, chapter_num: int) -> dict[str, str] | None:
+        """Return the entry dict for a chapter, or None if it isn't indexed."""
+        row = self.rows.get(chapter_num)
+        if row is None:
+            return None
+        return {
+            "identifier": self.identifiers[row],
+            "title": self.titles[row],
+            "chapter_title": self.chapter_titles[row],
+            "year": self.years[row],
+        }
+
+    def to_entries(self) -> dict[int, dict[str, str]]:
+        """Convert back to the ``{chapter_num: entry_dict}`` cache format."""
+        return {
+            chapter_num: {
+                "identifier": identifier,
+                "title": title,
+                "chapter_title": chapter_title,
+                "year": year,
+            }
+            for chapter_num, identifier, title, chapter_title, year in zip(
+                self.chapters,
+                self.identifiers,
+                self.titles,
+                self.chapter_titles,
+                self.years,
+                strict=True,
+            )
+        }
+
+    def search_choices(self) -> tuple[list[str], list[int]]:
+        """Return (lowercased chapter titles, chapter numbers) for fuzzy lookup.
+
+        Built on first use and reset whenever a chapter is added.  Rows
+        without a chapter title are skipped.
+        """
+        if self._search is None:
+            choices: list[str] = []
+            chapters: list[int] = []
+            for chapter_num, chapter_title in zip(self.chapters, self.chapter_titles, strict=True):
+                ct = chapter_title.lower().strip()
+                if ct:
+                    choices.append(ct)
+                    chapters.append(chapter_num)
+            self._search = (choices, chapters)
+        return self._search
 
 
 class ArchiveOrgFetcher:
@@ -144,11 +382,19 @@ class ArchiveOrgFetcher:
         """
         self._enabled = enabled
         self._cache_dir = cache_dir or Path(".")
-        # In-memory collection index: {chapter_num: {identifier, title, year}}
-        self._screw_index: dict[int, dict[str, str]] | None = None
-        # Persistent HTTP session for connection pooling
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": f"{APP_NAME}/{APP_VERSION}"})
+        # In-memory collection index (chapter number -> identifier, title, year)
+        self._screw_index: _ScrewIndex | None = None
+        # Last-Modified of the search response the index was built from
+        self._screw_index_last_modified: str | None = None
+        # Item metadata already fetched this session: identifier -> item (None = not found)
+        self._item_cache: dict[str, _ItemMetadata | None] = {}
+        # Parsed track candidates per (identifier, album_override, year_override).
+        # Every track of a chapter asks for the same list; parsing it again for
+        # each one made a chapter cost O(tracks^2) filename parses.
+        self._tracks_cache: dict[_TracksKey, tuple[MatchCandidate, ...]] = {}
+        self._item_cache_lock = threading.Lock()
+        # Persistent HTTP session for connection pooling and retries
+        self._session = _build_session()
 
     # ------------------------------------------------------------------
     # Public API
@@ -181,7 +427,7 @@ class ArchiveOrgFetcher:
         )
 
         index = self._get_screw_index()
-        entry = index.get(chapter_num)
+        entry = index.entry(chapter_num)
 
         if not entry:
             logger.info(
@@ -222,29 +468,21 @@ class ArchiveOrgFetcher:
 
         Returns:
             List of MatchCandidate objects for original audio files in the item.
+            Each call returns fresh copies, so callers may modify them.
         """
         if not self._enabled:
             return []
 
-        rate_limiter.wait("archive_org", _IA_RATE)
-        url = f"{ARCHIVE_ORG_METADATA_URL}/{identifier}"
-        resp = _retry_request("GET", url, session=self._session)
-        if resp is None:
-            return []
-
-        try:
-            data = resp.json()
-        except Exception as exc:
-            logger.error("archive.org: failed to parse metadata JSON: %s", exc)
-            return []
+        key = (identifier, album_override, year_override)
+        with self._item_cache_lock:
+            cached = self._tracks_cache.get(key)
+        if cached is not None:
+            return [copy.copy(c) for c in cached]
 
-        if not data or isinstance(data, list):
-            # Empty array means item not found
-            logger.warning("archive.org: item '%s' not found", identifier)
+        item = self._get_item(identifier)
+        if item is None:
             return []
-
-        metadata = data.get("metadata", {})
-        files = data.get("files", [])
+        metadata = item.metadata
 
         # Extract album-level info
         item_title = album_override or metadata.get("title", "")
@@ -262,38 +500,134 @@ class ArchiveOrgFetcher:
         # We normalize to "Diary of the Originator: Chapter 051 - 9 Fo Shit".
         album_name = self._normalize_album_title(item_title)
 
-        # Determine cover art URL
-        cover_art_url = self._find_cover_art_url(identifier, files)
-
-        # Filter to original audio files and build candidates
-        candidates: list[MatchCandidate] = []
-        for file_entry in files:
-            if file_entry.get("source") != "original":
-                continue
-            file_format = file_entry.get("format", "")
-            if file_format not in _AUDIO_FORMATS:
-                continue
-
-            candidate = self._parse_track_file(
+        album_artist = item_creator or DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
+        parsed = (
+            self._parse_track_file(
                 file_entry,
                 album=album_name,
-                album_artist=item_creator or DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST,
+                album_artist=album_artist,
                 year=year_int,
-                cover_art_url=cover_art_url,
+                cover_art_url=item.cover_art_url,
                 identifier=identifier,
             )
-            if candidate:
-                candidates.append(candidate)
+            for file_entry in item.audio_files
+        )
+        candidates = [candidate for candidate in parsed if candidate is not None]
 
         # Sort by track number
-        candidates.sort(key=lambda c: (c.track_number or 999, c.title))
+        candidates.sort(key=_track_sort_key)
 
         logger.info(
             "archive.org: fetched %d tracks for '%s'",
             len(candidates),
             identifier,
         )
-        return candidates
+        with self._item_cache_lock:
+            if len(self._tracks_cache) >= ARCHIVE_ORG_ITEM_CACHE_SIZE:
+                del self._tracks_cache[next(iter(self._tracks_cache))]
+            self._tracks_cache[key] = tuple(candidates)
+        return [copy.copy(c) for c in candidates]
+
+    def _get_item(self, identifier: str) -> _ItemMetadata | None:
+        """Return an item's metadata, fetching it from archive.org on a cache miss.
+
+        Only a cache miss waits on the rate limiter.  Items that archive.org
+        reports as missing are cached too; request and decode failures are
+        not, so they are retried on the next call.
+
+        Args:
+            identifier: Archive.org item identifier.
+
+        Returns:
+            The item's metadata, or None if it could not be fetched.
+        """
+        with self._item_cache_lock:
+            if identifier in self._item_cache:
+                return self._item_cache[identifier]
+
+        rate_limiter.wait("archive_org", _IA_RATE)
+        url = f"{ARCHIVE_ORG_METADATA_URL}/{identifier}"
+        resp = _retry_request("GET", url, session=self._session)
+        if resp is None:
+            return None
+
+        try:
+            data = _json_loads(resp.content)
+        except Exception as exc:
+            logger.error("archive.org: failed to parse metadata JSON: %s", exc)
+            return None
+
+        item: _ItemMetadata | None = None
+        if not data or isinstance(data, list):
+            # Empty array means item not found
+            logger.warning("archive.org: item '%s' not found", identifier)
+        else:
+            files = data.get("files", [])
+            # Keep only original audio files.  Derivatives (transcodes,
+            # thumbnails, XML) make up most of the file list, so the cheap
+            # source check runs first and short-circuits the format lookup.
+            item = _ItemMetadata(
+                metadata=data.get("metadata", {}),
+                audio_files=[
+                    file_entry
+                    for file_entry in files
+                    if file_entry.get("source") == "original"
+                    and file_entry.get("format") in _AUDIO_FORMATS
+                ],
+                cover_art_url=self._find_cover_art_url(identifier, files),
+            )
+
+        with self._item_cache_lock:
+            if len(self._item_cache) >= ARCHIVE_ORG_ITEM_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._item_cache[next(iter(self._item_cache))]
+            self._item_cache[identifier] = item
+        return item
+
+    def fetch_items_parallel(
+        self,
+        identifiers: Iterable[str],
+        max_workers: int = ARCHIVE_ORG_MAX_WORKERS,
+    ) -> dict[str, list[MatchCandidate]]:
+        """Fetch per-track metadata for many archive.org items concurrently.
+
+        Requests still pass through the shared archive.org rate limiter, but
+        the network round trips overlap instead of running back to back.
+
+        Args:
+            identifiers: Archive.org item identifiers.  Duplicates are fetched once.
+            max_workers: Maximum concurrent fetches.  Capped at the session's
+                connection pool size.
+
+        Returns:
+            Dict mapping each identifier to its list of MatchCandidates
+            (empty if the fetch failed).
+        """
+        if not self._enabled:
+            return {}
+
+        unique = list(dict.fromkeys(identifiers))
+        if not unique:
+            return {}
+
+        workers = max(1, min(max_workers, len(unique), ARCHIVE_ORG_POOL_SIZE))
+        results: dict[str, list[MatchCandidate]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            future_to_id = {pool.submit(self.fetch_item_tracks, ident): ident for ident in unique}
+            for future in as_completed(future_to_id):
+                identifier = future_to_id[future]
+                try:
+                    results[identifier] = future.result()
+                except Exception as exc:
+                    logger.error("archive.org: failed to fetch '%s': %s", identifier, exc)
+                    results[identifier] = []
+
+        logger.info(
+            "archive.org: fetched %d items with %d workers",
+            len(results),
+            workers,
+        )
+        return results
 
     def search_collection(
         self,
@@ -314,31 +648,80 @@ class ArchiveOrgFetcher:
         if not self._enabled:
             return []
 
-        rate_limiter.wait("archive_org", _IA_RATE)
+        q = _collection_query(collection, query)
+        resp = self._request_collection(collection, query, max_results)
+        if resp is None:
+            logger.debug("archive.org: search failed for '%s'", q)
+            return []
+        return self._parse_collection_docs(resp, q)
+
+    def _request_collection(
+        self,
+        collection: str,
+        query: str | None,
+        max_results: int,
+        if_modified_since: str | None = None,
+    ) -> requests.Response | None:
+        """Send an Advanced Search request for items in a collection.
+
+        Args:
+            collection: Collection identifier.
+            query: Optional additional search terms.
+            max_results: Maximum results to return.
+            if_modified_since: Optional HTTP date; when set, the server may
+                answer 304 Not Modified with an empty body.
 
-        q = f"collection:{collection}"
-        if query:
-            q += f" AND ({query})"
+        Returns:
+            Streamed response object (see ``_parse_collection_docs``), or
+            None if the request failed.
+        """
+        rate_limiter.wait("archive_org", _IA_RATE)
 
         params = {
-            "q": q,
+            "q": _collection_query(collection, query),
             "output": "json",
             "rows": max_results,
             "sort[]": "title asc",
             "fl[]": ["identifier", "title", "year"],
         }
+        extra_headers = {"If-Modified-Since": if_modified_since} if if_modified_since else None
+
+        return _retry_request(
+            "GET",
+            ARCHIVE_ORG_SEARCH_URL,
+            params=params,
+            session=self._session,
+            extra_headers=extra_headers,
+            stream=True,
+        )
 
-        resp = _retry_request("GET", ARCHIVE_ORG_SEARCH_URL, params=params, session=self._session)
-        if resp is None:
-            return []
+    @staticmethod
+    def _parse_collection_docs(resp: requests.Response, q: str) -> list[dict[str, Any]]:
+        """Decode the docs list from a streamed Advanced Search response.
+
+        Large responses are stream-parsed with ijson (when installed) so only
+        the docs are materialized, never the whole response tree.  Smaller
+        ones are cheaper to decode in one piece.  *q* is the search query,
+        for the log.
+        """
+        try:
+            size = int(resp.headers.get("Content-Length") or 0)
+        except ValueError:
+            size = 0
 
         try:
-            data = resp.json()
+            if ijson is not None and size >= ARCHIVE_ORG_STREAM_PARSE_MIN_BYTES:
+                resp.raw.decode_content = True
+                docs = list(ijson.items(resp.raw, "response.docs.item", use_float=True))
+            else:
+                data = _json_loads(resp.content)
+                docs = data.get("response", {}).get("docs", [])
         except Exception as exc:
             logger.error("archive.org: failed to parse search JSON: %s", exc)
             return []
+        finally:
+            resp.close()
 
-        docs = data.get("response", {}).get("docs", [])
         logger.debug("archive.org: search returned %d items for '%s'", len(docs), q)
         return docs
 
@@ -388,7 +771,7 @@ class ArchiveOrgFetcher:
             return []
 
         try:
-            data = resp.json()
+            data = _json_loads(resp.content)
         except Exception as exc:
             logger.error("archive.org: failed to parse search JSON: %s", exc)
             return []
@@ -423,7 +806,7 @@ class ArchiveOrgFetcher:
     # Collection index cache
     # ------------------------------------------------------------------
 
-    def _get_screw_index(self) -> dict[int, dict[str, str]]:
+    def _get_screw_index(self) -> _ScrewIndex:
         """Get or build the DJ Screw chapter index.
 
         Returns the cached in-memory index, loading from disk or fetching
@@ -434,18 +817,20 @@ class ArchiveOrgFetcher:
 
         # Try loading from disk cache
         cache_path = self._cache_dir / ARCHIVE_ORG_CACHE_FILENAME
+        stale_entries: dict[int, dict[str, str]] | None = None
+        stale_last_modified: str | None = None
         if cache_path.exists():
             try:
-                raw = json.loads(cache_path.read_text(encoding="utf-8"))
-                cached_at = raw.get("cached_at", "")
-                entries = raw.get("entries", {})
+                raw = _json_loads(cache_path.read_bytes())
+                # JSON object keys are always strings on disk
+                entries = {int(k): v for k, v in raw.get("entries", {}).items()}
 
                 # Check age
-                if cached_at:
-                    cached_dt = datetime.fromisoformat(cached_at)
-                    age_days = (datetime.now(timezone.utc) - cached_dt).days
+                age_days = self._cache_age_days(raw)
+                if age_days is not None:
                     if age_days <= ARCHIVE_ORG_CACHE_MAX_AGE_DAYS:
-                        self._screw_index = {int(k): v for k, v in entries.items()}
+                        self._screw_index = _ScrewIndex.from_entries(entries)
+                        self._screw_index_last_modified = raw.get("last_modified")
                         logger.info(
                             "archive.org: loaded DJ Screw index from cache "
                             "(%d chapters, %d days old)",
@@ -458,43 +843,96 @@ class ArchiveOrgFetcher:
                             "archive.org: cache expired (%d days old), refreshing",
                             age_days,
                         )
+                        stale_entries = entries
+                        stale_last_modified = raw.get("last_modified")
             except Exception as exc:
                 logger.warning("archive.org: failed to load cache: %s", exc)
 
-        # Fetch from archive.org
-        self._screw_index = self._build_screw_index()
+        # Fetch from archive.org, asking for a 304 if the expired cache is still current
+        index = self._build_screw_index(if_modified_since=stale_last_modified)
+        if index is None:
+            logger.info(
+                "archive.org: collection unchanged since %s, reusing cached index",
+                stale_last_modified,
+            )
+            index = _ScrewIndex.from_entries(stale_entries or {})
+            self._screw_index_last_modified = stale_last_modified
+        self._screw_index = index
 
-        # Save to disk
+        # Save to disk (refreshes cached_at after a 304 as well)
         self._save_screw_index(cache_path)
 
         return self._screw_index
 
-    def _build_screw_index(self) -> dict[int, dict[str, str]]:
-        """Fetch the full DJ Screw collection and build a chapter-number index."""
+    @staticmethod
+    def _cache_age_days(raw: dict[str, Any]) -> int | None:
+        """Return the age of a loaded index cache in whole days.
+
+        Uses the integer ``cached_at_epoch`` stamp; caches written before it
+        existed fall back to parsing the ISO ``cached_at`` string.
+
+        Args:
+            raw: Decoded cache file payload.
+
+        Returns:
+            Age in days, or None if the cache carries no timestamp.
+        """
+        cached_at_epoch = raw.get("cached_at_epoch")
+        if isinstance(cached_at_epoch, int):
+            return int(time.time() - cached_at_epoch) // SECONDS_PER_DAY
+
+        cached_at = raw.get("cached_at")
+        if cached_at:
+            return (datetime.now(timezone.utc) - datetime.fromisoformat(cached_at)).days
+        return None
+
+    def _build_screw_index(self, if_modified_since: str | None = None) -> _ScrewIndex | None:
+        """Fetch the full DJ Screw collection and build a chapter-number index.
+
+        Args:
+            if_modified_since: ``Last-Modified`` value saved with an expired
+                cache.  Sent as ``If-Modified-Since`` so an unchanged
+                collection costs a bodiless 304 instead of a full fetch.
+
+        Returns:
+            The new index, or None if the server answered 304 Not Modified.
+        """
         logger.info("archive.org: building DJ Screw collection index (one-time fetch)...")
 
-        docs = self.search_collection(
-            collection=ARCHIVE_ORG_DJ_SCREW_COLLECTION,
-            max_results=500,
-        )
+        docs: list[dict[str, Any]] = []
+        if self._enabled:
+            resp = self._request_collection(
+                ARCHIVE_ORG_DJ_SCREW_COLLECTION,
+                query=None,
+                max_results=500,
+                if_modified_since=if_modified_since,
+            )
+            if resp is not None:
+                if resp.status_code == HTTPStatus.NOT_MODIFIED:
+                    resp.close()
+                    return None
+                self._screw_index_last_modified = resp.headers.get("Last-Modified")
+                docs = self._parse_collection_docs(
+                    resp, _collection_query(ARCHIVE_ORG_DJ_SCREW_COLLECTION, None)
+                )
 
-        index: dict[int, dict[str, str]] = {}
+        index = _ScrewIndex()
+        search_title = _CHAPTER_TITLE_RE.search
         for doc in docs:
             title = doc.get("title", "")
             identifier = doc.get("identifier", "")
             year = str(doc.get("year", ""))
 
             # Extract chapter number from title
-            match = _CHAPTER_TITLE_RE.search(title)
+            match = search_title(title)
             if match:
-                chapter_num = int(match.group(1))
-                chapter_title = match.group(2).strip()
-                index[chapter_num] = {
-                    "identifier": identifier,
-                    "title": title,
-                    "chapter_title": chapter_title,
-                    "year": year,
-                }
+                index.add(
+                    int(match.group(1)),
+                    identifier=identifier,
+                    title=title,
+                    chapter_title=match.group(2).strip(),
+                    year=year,
+                )
 
         logger.info(
             "archive.org: indexed %d chapters from %d items",
@@ -519,30 +957,28 @@ class ArchiveOrgFetcher:
         if not self._enabled or not tape_title:
             return None
 
-        from rapidfuzz import fuzz
-
         index = self._get_screw_index()
         if not index:
             return None
 
+        choices, chapters = index.search_choices()
+
         needle = tape_title.lower().strip()
         best_chapter: int | None = None
         best_score = 0.0
+        best_pos = len(choices)
 
-        for chapter_num, entry in index.items():
-            ct = (entry.get("chapter_title") or "").lower().strip()
-            if not ct:
+        # Best of three scorers.  Each extractOne runs its loop in C; ties go
+        # to the earliest index entry, as with a straight scan over the index.
+        for scorer in (fuzz.ratio, fuzz.token_sort_ratio, fuzz.partial_ratio):
+            result = process.extractOne(needle, choices, scorer=scorer)
+            if result is None:
                 continue
-
-            # Weighted fuzzy comparison
-            score = max(
-                fuzz.ratio(needle, ct),
-                fuzz.token_sort_ratio(needle, ct),
-                fuzz.partial_ratio(needle, ct),
-            )
-            if score > best_score:
+            _, score, pos = result
+            if score > best_score or (score == best_score and pos < best_pos):
                 best_score = score
-                best_chapter = chapter_num
+                best_pos = pos
+                best_chapter = chapters[pos]
 
         if best_chapter is not None and best_score >= 75:
             logger.info(
@@ -564,16 +1000,24 @@ class ArchiveOrgFetcher:
         """Save the DJ Screw chapter index to disk."""
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            index = self._screw_index or {}
+            index = self._screw_index.to_entries() if self._screw_index else {}
             payload = {
                 "cached_at": datetime.now(timezone.utc).isoformat(),
+                "cached_at_epoch": int(time.time()),
                 "collection": ARCHIVE_ORG_DJ_SCREW_COLLECTION,
-                "entries": {str(k): v for k, v in index.items()},
+                "last_modified": self._screw_index_last_modified,
+                # Both encoders write the int chapter keys as JSON strings
+                "entries": index,
             }
-            cache_path.write_text(
-                json.dumps(payload, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            if orjson is not None:
+                cache_path.write_bytes(
+                    orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                cache_path.write_text(
+                    json.dumps(payload, indent=2, ensure_ascii=False),
+                    encoding="utf-8",
+                )
             logger.info("archive.org: saved index cache to %s", cache_path)
         except Exception as exc:
             logger.warning("archive.org: failed to save cache: %s", exc)
@@ -595,9 +1039,10 @@ class ArchiveOrgFetcher:
         )
 
         # Try to find the right chapter in results
+        search_title = _CHAPTER_TITLE_RE.search
         for doc in docs:
             title = doc.get("title", "")
-            match = _CHAPTER_TITLE_RE.search(title)
+            match = search_title(title)
             if match and int(match.group(1)) == chapter_num:
                 return {
                     "identifier": doc.get("identifier", ""),
@@ -660,8 +1105,8 @@ class ArchiveOrgFetcher:
         genre = file_entry.get("genre", "")
 
         # Normalize backticks to apostrophes (common in archive.org data)
-        title = title.replace("`", "'")
-        artist = artist.replace("`", "'")
+        title = _fix_backticks(title)
+        artist = _fix_backticks(artist)
 
         if not title and not artist:
             # Try to parse from filename: "101. Artist - Title.mp3"
@@ -676,29 +1121,7 @@ class ArchiveOrgFetcher:
         if not title:
             return None
 
-        # Parse track number from "101/107" or "1/19" format.
-        # Archive.org sometimes uses disc-prefixed numbering: 101 = disc 1, track 1.
-        track_number: int | None = None
-        total_tracks: int | None = None
-        disc_number: int | None = None
-        if track_str:
-            parts = track_str.split("/")
-            try:
-                raw_num = int(parts[0])
-                # If track number > 100, strip the disc prefix: 101 -> 1, 212 -> 12
-                if raw_num > 100:
-                    disc_number = raw_num // 100
-                    track_number = raw_num % 100
-                else:
-                    track_number = raw_num
-            except (ValueError, TypeError):
-                pass
-            if len(parts) > 1:
-                try:
-                    raw_total = int(parts[1])
-                    total_tracks = raw_total % 100 if raw_total > 100 else raw_total
-                except (ValueError, TypeError):
-                    pass
+        disc_number, track_number, total_tracks = _split_track_field(track_str)
 
         # Parse duration
         duration: float | None = None
@@ -723,6 +1146,7 @@ class ArchiveOrgFetcher:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=ARCHIVE_ORG_TITLE_CACHE_SIZE)
     def _normalize_album_title(ia_title: str) -> str:
         """Normalize an archive.org item title to the project's album format.
 
@@ -730,6 +1154,7 @@ class ArchiveOrgFetcher:
         Output: "Chapter 051 - 9 Fo Shit"
 
         Falls back to the raw title if it doesn't match the expected pattern.
+        Memoized, since the same item titles recur across re-scans.
 
         Args:
             ia_title: Raw title from archive.org metadata.
@@ -747,15 +1172,16 @@ class ArchiveOrgFetcher:
             )
 
         # Strip "DJ Screw - " prefix and trailing "(YYYY)" if present
-        cleaned = re.sub(r"^DJ\s+Screw\s*[-–—:]\s*", "", ia_title, flags=re.IGNORECASE)  # noqa: RUF001
-        cleaned = re.sub(r"\s*\(\d{4}\)\s*$", "", cleaned)
+        cleaned = _DJ_PREFIX_RE.sub("", ia_title)
+        cleaned = _YEAR_SUFFIX_RE.sub("", cleaned)
         return cleaned.strip() or ia_title
 
     @staticmethod
     def _find_cover_art_url(identifier: str, files: list[dict[str, Any]]) -> str | None:
         """Find the best cover art URL from an item's file list.
 
-        Looks for files named Front.jpg, cover.jpg, folder.jpg, etc.
+        Looks for files named Front.jpg, cover.jpg, folder.jpg, etc. (in that
+        order of preference), falling back to any "Item Image" file.
 
         Args:
             identifier: Archive.org item identifier.
@@ -764,28 +1190,61 @@ class ArchiveOrgFetcher:
         Returns:
             Direct download URL for the cover image, or None.
         """
-        # Priority order for cover art filenames
-        cover_names = {
-            "front.jpg",
-            "front.png",
-            "cover.jpg",
-            "cover.png",
-            "folder.jpg",
-            "folder.png",
-            "albumartsmall.jpg",
-        }
-
+        best_name: str | None = None
+        best_rank = _ITEM_IMAGE_RANK + 1
         for file_entry in files:
-            name_lower = file_entry.get("name", "").lower()
-            if name_lower in cover_names:
-                return f"{ARCHIVE_ORG_DOWNLOAD_URL}/{identifier}/{file_entry['name']}"
+            name = file_entry.get("name", "")
+            rank = _COVER_ART_RANKS.get(name.lower())
+            if rank is None:
+                if file_entry.get("format") != "Item Image":
+                    continue
+                rank = _ITEM_IMAGE_RANK
+            if rank < best_rank:
+                best_name, best_rank = name, rank
+                if rank == 0:
+                    break
+
+        if best_name is None:
+            return None
+        return f"{ARCHIVE_ORG_DOWNLOAD_URL}/{identifier}/{best_name}"
 
-        # Fallback: look for any Item Image format
-        for file_entry in files:
-            if file_entry.get("format") == "Item Image":
-                return f"{ARCHIVE_ORG_DOWNLOAD_URL}/{identifier}/{file_entry['name']}"
 
-        return None
+def _split_track_field(track_str: str) -> tuple[int | None, int | None, int | None]:
+    """Split an archive.org ``track`` field into disc, track, and total counts.
+
+    Accepts "101/107" or "1/19" style values.  Archive.org sometimes uses
+    disc-prefixed numbering: 101 = disc 1, track 1; 212 = disc 2, track 12.
+
+    Args:
+        track_str: Raw ``track`` value from a file entry (may be empty).
+
+    Returns:
+        Tuple of (disc_number, track_number, total_tracks); each is None
+        when absent or unparseable.
+    """
+    disc_number: int | None = None
+    track_number: int | None = None
+    total_tracks: int | None = None
+    if not track_str:
+        return disc_number, track_number, total_tracks
+
+    number, _, total = track_str.partition("/")
+    with contextlib.suppress(ValueError):
+        raw_num = int(number)
+        if raw_num > 100:
+            disc_number, track_number = divmod(raw_num, 100)
+        else:
+            track_number = raw_num
+    if total:
+        with contextlib.suppress(ValueError):
+            raw_total = int(total)
+            total_tracks = raw_total % 100 if raw_total > 100 else raw_total
+    return disc_number, track_number, total_tracks
+
+
+def _track_sort_key(candidate: MatchCandidate) -> tuple[int, str]:
+    """Sort key for item tracks: track number, then title; unnumbered tracks last."""
+    return (candidate.track_number or _UNNUMBERED_TRACK_SORT, candidate.title)
 
 
 def _parse_ia_filename(filename: str) -> dict[str, str] | None:
@@ -802,26 +1261,28 @@ def _parse_ia_filename(filename: str) -> dict[str, str] | None:
         Dict with keys: track, artist, title. Or None if unparseable.
     """
     # Strip extension
-    stem = re.sub(r"\.[^.]+$", "", filename)
+    stem = _FILE_EXT_RE.sub("", filename)
     if not stem:
         return None
 
-    # Pattern: "NNN. Artist - Title"
-    match = re.match(r"^(\d+)\.\s*(.+?)\s*-\s*(.+)$", stem)
+    # Patterns: "NNN. Artist - Title" or "NN - Artist - Title"
+    match = _IA_DOTTED_NAME_RE.match(stem) or _IA_DASHED_NAME_RE.match(stem)
     if match:
         return {
             "track": match.group(1),
-            "artist": match.group(2).strip().replace("`", "'"),
-            "title": match.group(3).strip().replace("`", "'"),
-        }
-
-    # Pattern: "NN - Artist - Title"
-    match = re.match(r"^(\d+)\s*-\s*(.+?)\s*-\s*(.+)$", stem)
-    if match:
-        return {
-            "track": match.group(1),
-            "artist": match.group(2).strip().replace("`", "'"),
-            "title": match.group(3).strip().replace("`", "'"),
+            "artist": _fix_backticks(match.group(2).strip()),
+            "title": _fix_backticks(match.group(3).strip()),
         }
 
     return None
+
+
+def _fix_backticks(text: str) -> str:
+    """Normalize backticks to apostrophes (common in archive.org data).
+
+    Most strings contain no backtick, so the membership test skips the
+    replace call entirely for them.
+    """
+    if "`" in text:
+        return text.replace("`", "'")
+    return text
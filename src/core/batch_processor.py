@@ -3,10 +3,16 @@ matching, scoring, tagging, and organizing pipeline."""
 
 from __future__ import annotations
 
+import functools
+import logging
 import re
+import threading
 import time
+from collections import Counter
 from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,12 +33,18 @@ from src.models.track import Track
 from src.utils.constants import (
     ACOUSTID_HIGH_CONFIDENCE,
     ACOUSTID_MEDIUM_CONFIDENCE,
+    ACOUSTID_PREFETCH_WORKERS,
+    DEFAULT_MAX_CONCURRENT_LOOKUPS,
     DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST,
+    FILENAME_PARSE_MAX_LENGTH,
+    FINGERPRINT_PROGRESS_INTERVAL_SECONDS,
+    FOLDER_TAGS_CACHE_SIZE,
     MAX_ACOUSTID_MATCHES,
-    PAUSE_CHECK_INTERVAL_SECONDS,
+    RETRY_EXISTS_CHECK_WORKERS,
     SKIP_FOLDER_NAMES,
+    TRACK_SAVE_COMMIT_INTERVAL,
 )
-from src.utils.file_utils import normalize_artist_name, smart_title_case
+from src.utils.file_utils import normalize_artist_name, normalize_folder_name, smart_title_case
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -40,6 +52,85 @@ if TYPE_CHECKING:
 
 logger = get_logger("core.batch_processor")
 
+# (acoustid_id, score, recording_id, recording_title), as returned by Fingerprinter.lookup()
+_AcoustIdMatches = list[tuple[str, float, str | None, str | None]]
+
+_RE_DISC_TRACK = re.compile(r"^(\d{1,3})-(\d{1,3})$")  # "1-04", see _parse_disc_track
+
+# Every filename shape _guess_tags_from_filename understands, as one
+# alternation tried in priority order.  Each alternative ends in its own
+# title group, so ``match.lastgroup`` names the shape that matched.  Disc and
+# track numbers are bounded to 3 digits so a long run of digits can't make
+# the engine backtrack through every split point.
+_RE_FILENAME = re.compile(
+    r"""
+    # "<first> - <title>": the first " - " splits the stem, <first> picks the shape
+      \s*(?P<num>\d{1,3})\s*\ -\ (?P<num_title>.*)                       # 01 - Title
+    | \s*(?P<dt>\d{1,3}-\d{1,3})\s*\ -\ (?P<dt_title>.*)                 # 1-04 - Title
+    | \s*(?P<dta>\d{1,3}-\d{1,3})\s+(?P<dta_artist>.+?)
+      \s*\ -\ (?P<dta_title>.*)                                          # 1-01 Artist - Title
+    | \s*(?P<na>\d{1,3})\s+(?P<na_artist>.+?)\s*\ -\ (?P<na_title>.*)    # 01 Artist - Title
+    | (?P<artist>.*?)\ -\ (?P<title>.*)                                  # Artist - Title
+    # "Artist- Title (Ft. Other)": dash with inconsistent spacing (DJ Screw style),
+    # split at the first dash, dropping a leading track number from the artist
+    | (?=.*(?:-\ |\ -))\s*(?:\d{1,3}\s+(?=[^\s-]))?
+      (?P<dash_artist>[^-]*?)\s*-\s*(?P<dash_title>.*)
+    # No separator: leading track or disc-track number, then the title
+    | (?P<lead_num>\d{1,3})\s+(?P<lead_num_title>.*)                     # 05 Hellraizer
+    | (?P<lead_dt>\d{1,3}-\d{1,3})\s+(?P<lead_dt_title>.*)               # 1-04 ambitionz
+    """,
+    re.VERBOSE,
+)
+
+
+@functools.lru_cache(maxsize=FOLDER_TAGS_CACHE_SIZE)
+def _folder_tags(parent: Path) -> tuple[str | None, str | None, str | None]:
+    """Work out the tags a track's folder implies, once per directory.
+
+    Every track in an album folder shares the answer, so it is memoized on
+    the parent path.
+
+    Args:
+        parent: The directory containing the track.
+
+    Returns:
+        ``(dj_artist, dj_album, folder_artist)``: for a DJ/compilation
+        folder structure (DJ Screw etc.) the DJ to use as album_artist and
+        the folder to use as album; otherwise the parent folder as artist.
+        Each is None when it doesn't apply or the folder is a generic one
+        from ``SKIP_FOLDER_NAMES``.
+    """
+    parent_name = parent.name
+    grandparent_name = parent.parent.name if len(parent.parts) > 2 else ""
+    parent_lower = normalize_folder_name(parent_name)
+    gp_lower = normalize_folder_name(grandparent_name)
+
+    # Check if grandparent or parent looks like a DJ/compilation artist
+    dj_artist = None
+    for folder_name, folder_lower in ((grandparent_name, gp_lower), (parent_name, parent_lower)):
+        if any(
+            v in folder_lower for v in ("dj screw", "djscrew", "screwed up click", "va dj screw")
+        ):
+            dj_artist = "DJ Screw"
+            break
+        if folder_lower.startswith("dj "):
+            dj_artist = normalize_artist_name(folder_name)
+            break
+
+    if not dj_artist:
+        folder_artist = parent_name if parent_lower not in SKIP_FOLDER_NAMES else None
+        return None, None, folder_artist
+
+    # Use the immediate parent folder as the album name (e.g. "Chapter 012 - June 27th")
+    dj_album = None
+    if parent_lower not in SKIP_FOLDER_NAMES:
+        if parent_lower != gp_lower:
+            # parent is the chapter/album, grandparent is the DJ
+            dj_album = parent_name
+        elif grandparent_name and gp_lower not in SKIP_FOLDER_NAMES:
+            dj_album = grandparent_name
+    return dj_artist, dj_album, None
+
 
 @dataclass
 class BatchStats:
@@ -104,6 +195,7 @@ class BatchProcessor:
         max_concurrent_fingerprints: int | None = None,
         track_repo: TrackRepository | None = None,
         api_cache: ApiCacheRepository | None = None,
+        max_concurrent_lookups: int | None = None,
     ) -> None:
         """Initialize the batch processor with all required components.
 
@@ -132,12 +224,16 @@ class BatchProcessor:
                 and resume-on-restart.
             api_cache: Optional ApiCacheRepository for caching API responses
                 across runs.
+            max_concurrent_lookups: Number of tracks processed in parallel in
+                the per-track (API) phase.  ``None`` uses
+                ``DEFAULT_MAX_CONCURRENT_LOOKUPS``.
         """
         self._scanner = FileScanner()
         self._tag_editor = TagEditor()
         self._fingerprinter = Fingerprinter(acoustid_api_key, api_cache=api_cache)
         self._metadata_fetcher = MetadataFetcher(discogs_token, api_cache=api_cache)
         self._max_concurrent_fingerprints = max_concurrent_fingerprints
+        self._max_concurrent_lookups = max_concurrent_lookups or DEFAULT_MAX_CONCURRENT_LOOKUPS
         self._track_repo = track_repo
         self._archive_org = ArchiveOrgFetcher(
             cache_dir=library_path or Path("."),
@@ -163,9 +259,25 @@ class BatchProcessor:
         self._progress_callback = progress_callback
         self._fpcalc_available = fpcalc_available
         self._move_unmatched = move_unmatched
-        self._paused = False
-        self._cancelled = False
+        # Set while running, cleared while paused -- workers block on wait()
+        # instead of polling.  cancel() sets it too so paused workers wake up.
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._cancel_event = threading.Event()
         self._current_result: BatchResult | None = None
+        # Album tags of the batch as they were before Phase 2, for album
+        # consistency scoring (see _process_tracks)
+        self._album_counts: Counter[str] = Counter()
+        # Phase 2 runs tracks on a thread pool: _result_lock guards the shared
+        # BatchResult stats/match_results, _apply_lock serializes tag writes
+        # and file moves so two tracks never race for the same destination.
+        self._result_lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+        # Save-as-you-go tracks waiting for the next save_batch() transaction
+        self._pending_saves: list[Track] = []
+        # AcoustID lookups started as soon as a track is fingerprinted, keyed
+        # by id(track); consumed by _process_single_track_standard.
+        self._acoustid_prefetch: dict[int, Future[_AcoustIdMatches | None]] = {}
 
     @property
     def current_result(self) -> BatchResult | None:
@@ -285,54 +397,71 @@ class BatchProcessor:
         # Detect compilation
         self._compilation_detector.detect(track)
 
-        if self._dry_run:
-            # In dry-run mode, skip all destructive operations but still
-            # preview the destination path.
-            logger.info("[DRY RUN] Would apply tags: %s - %s", track.artist, track.title)
-            if self._organizer:
-                track = self._organizer.organize(track)
-        else:
-            # SAFETY: Back up the original file BEFORE writing any tags so the
-            # backup preserves the unmodified metadata.  If matching is wrong,
-            # the user can rollback to the true original.
-            if self._organizer:
-                self._organizer.backup_before_changes(track)
-
-            # Write tags
-            if self._tag_editor.write_tags(track):
-                logger.info("Applied tags: %s - %s", track.artist, track.title)
+        # Download cover art up front so the network round-trip doesn't hold
+        # the apply lock.
+        art_data = None
+        if not self._dry_run and candidate.cover_art_url and candidate.musicbrainz_release_id:
+            art_data = self._metadata_fetcher.fetch_cover_art(candidate.musicbrainz_release_id)
+
+        with self._apply_lock:
+            if self._dry_run:
+                # In dry-run mode, skip all destructive operations but still
+                # preview the destination path.
+                logger.info("[DRY RUN] Would apply tags: %s - %s", track.artist, track.title)
+                if self._organizer:
+                    track = self._organizer.organize(track)
             else:
-                logger.warning("Failed to write tags for: %s", track.file_path)
+                # SAFETY: Back up the original file BEFORE writing any tags so the
+                # backup preserves the unmodified metadata.  If matching is wrong,
+                # the user can rollback to the true original.
+                if self._organizer:
+                    self._organizer.backup_before_changes(track)
+
+                # Write tags
+                if self._tag_editor.write_tags(track):
+                    logger.info("Applied tags: %s - %s", track.artist, track.title)
+                else:
+                    logger.warning("Failed to write tags for: %s", track.file_path)
 
-            # Download and write cover art if available
-            if candidate.cover_art_url and candidate.musicbrainz_release_id:
-                art_data = self._metadata_fetcher.fetch_cover_art(candidate.musicbrainz_release_id)
+                # Write cover art if available
                 if art_data:
                     self._tag_editor.write_cover_art(track, art_data)
                     track.cover_art_data = art_data
 
-            # Organize file
-            if self._organizer:
-                track = self._organizer.organize(track)
+                # Organize file
+                if self._organizer:
+                    track = self._organizer.organize(track)
 
         track.state = ProcessingState.COMPLETED
         return track
 
     def pause(self) -> None:
         """Pause the batch processing."""
-        self._paused = True
+        if self._cancel_event.is_set():
+            return
+        self._resume_event.clear()
         logger.info("Batch processing paused")
 
     def resume(self) -> None:
         """Resume the batch processing."""
-        self._paused = False
+        self._resume_event.set()
         logger.info("Batch processing resumed")
 
     def cancel(self) -> None:
         """Cancel the batch processing."""
-        self._cancelled = True
+        self._cancel_event.set()
+        self._resume_event.set()  # Wake anything blocked in _wait_while_paused()
         logger.info("Batch processing cancelled")
 
+    def _wait_while_paused(self) -> bool:
+        """Block until processing is resumed or cancelled.
+
+        Returns:
+            True if processing should continue, False if it was cancelled.
+        """
+        self._resume_event.wait()
+        return not self._cancel_event.is_set()
+
     # --- Private pipeline ---
 
     def _process_tracks(self, result: BatchResult) -> None:
@@ -340,121 +469,136 @@ class BatchProcessor:
 
         Processing phases:
         1. **Resume skip** -- if a TrackRepository is available, check for
-           tracks already processed in a previous run and skip them.
+           tracks already processed in a previous run and skip them, then
+           read the remaining tracks' tags.
         2. **Batch fingerprint** -- fingerprint all remaining tracks in
            parallel using a thread pool (CPU/disk only, no API calls).
-        3. **Per-track pipeline** -- sequential API lookups, scoring,
-           classification, and tagging for each track.
+        3. **Per-track pipeline** -- API lookups, scoring, classification,
+           and tagging, run for several tracks at once on a thread pool.
+           Each track enters this phase as soon as its fingerprint is done,
+           so lookups overlap the rest of step 2.
         """
-        len(result.tracks)
+        # --- Phase 0: Resume skip + tag read ---
+        work_tracks = self._skip_already_processed(result)
+        if not self._read_batch_tags(work_tracks, result):
+            logger.info("Processing cancelled while reading tags")
+            return
 
-        # --- Phase 0: Resume skip ---
-        already_done: set[str] = set()
-        if self._track_repo is not None:
-            try:
-                already_done = self._track_repo.get_processed_paths()
-            except Exception as e:
-                logger.warning("Could not load resume state: %s", e)
+        # Album consistency is scored against the batch's tags as read from
+        # disk.  Phase 2 workers rewrite tags (apply_match) concurrently, so
+        # counting the live tracks would make each score depend on which
+        # neighbours happened to finish first.
+        self._album_counts = self._scorer.count_albums(result.tracks)
+
+        # --- Phases 1 + 2, pipelined ---
+        # Each track is handed to the lookup pool as soon as its fingerprint
+        # is ready, so AcoustID/MusicBrainz round-trips overlap the remaining
+        # fpcalc work instead of waiting for the whole batch.  Lookups are
+        # I/O-bound; each service's rate limiter still spaces its requests.
+        total_work = len(work_tracks)
+        pool = ThreadPoolExecutor(max_workers=self._max_concurrent_lookups)
+        future_to_track: dict[Future[bool], Track] = {}
+        submitted: set[int] = set()  # id() of tracks already handed to the pool
+        # AcoustID has its own rate limit, so a separate pool keeps its
+        # requests flowing while the lookup workers wait on MusicBrainz.
+        prefetch_pool = ThreadPoolExecutor(max_workers=ACOUSTID_PREFETCH_WORKERS)
+
+        def _submit(track: Track) -> None:
+            submitted.add(id(track))
+            step_num = len(future_to_track) + 1
+            future = pool.submit(self._run_pipeline_step, track, result, step_num, total_work)
+            future_to_track[future] = track
+
+        handled: set[Future[bool]] = set()
+        try:
+            if self._fpcalc_available and work_tracks:
+                # Check pause/cancel before starting fingerprinting
+                if not self._wait_while_paused():
+                    logger.info("Processing cancelled before fingerprinting")
+                    return
 
-        if already_done:
-            skipped = 0
-            remaining: list[Track] = []
-            for track in result.tracks:
-                fp = str(track.file_path)
-                if fp in already_done:
-                    skipped += 1
-                    # Mark as already-done so stats are accurate
-                    track.state = ProcessingState.COMPLETED
-                else:
-                    remaining.append(track)
-            if skipped:
                 logger.info(
-                    "Resuming: skipping %d already-processed tracks (%d remaining)",
-                    skipped,
-                    len(remaining),
+                    "Phase 1: Batch fingerprinting %d tracks (lookups start as each finishes)...",
+                    total_work,
                 )
-                result.stats.total = len(result.tracks)
-            # Only process the remaining tracks
-            work_tracks = remaining
-        else:
-            work_tracks = list(result.tracks)
-
-        # --- Phase 1: Batch fingerprint (parallel, no API calls) ---
-        if self._fpcalc_available and work_tracks:
-            # Check pause/cancel before starting fingerprinting
-            while self._paused and not self._cancelled:
-                time.sleep(PAUSE_CHECK_INTERVAL_SECONDS)
-            if self._cancelled:
-                logger.info("Processing cancelled before fingerprinting")
-                return
-
-            fp_tracks = [t for t in work_tracks]  # all tracks get fingerprinted upfront
-            logger.info(
-                "Phase 1: Batch fingerprinting %d tracks...",
-                len(fp_tracks),
-            )
-
-            # Throttle GUI updates during fingerprinting to prevent the
-            # main thread from being starved by thousands of cross-thread
-            # signals.  Fire at most every 0.25 s or every 1% of total.
-            _fp_last_update = [0.0]  # mutable for closure
-            _fp_update_pct = max(1, len(fp_tracks) // 100)
 
-            def _on_fp_progress(completed: int, fp_total: int, track: Track) -> None:
-                if not self._progress_callback:
-                    return
-                now = time.monotonic()
-                is_milestone = (
-                    completed == fp_total  # always report final
-                    or completed % _fp_update_pct == 0  # ~1% intervals
-                )
-                if is_milestone or now - _fp_last_update[0] >= 0.25:
-                    _fp_last_update[0] = now
-                    self._progress_callback(
+                # Throttle GUI updates during fingerprinting to prevent the
+                # main thread from being starved by thousands of cross-thread
+                # signals.  Fire at most every 0.25 s or every 1% of total.
+                _fp_last_update = [0.0]  # mutable for closure
+                _fp_update_pct = max(1, total_work // 100)
+                progress_cb = self._progress_callback
+
+                # Runs on this thread (fingerprint_batch's as_completed loop),
+                # so the counter needs no lock.
+                def _on_fp_progress(completed: int, fp_total: int, track: Track) -> None:
+                    if track.fingerprint:
+                        result.stats.fingerprinted += 1
+                        self._prefetch_acoustid(prefetch_pool, track)
+                    _submit(track)
+                    if progress_cb is None:
+                        return
+                    # Always report the final track and ~1% milestones (cheap
+                    # integer check); between milestones only read the clock.
+                    if completed != fp_total and completed % _fp_update_pct:
+                        now = time.monotonic()
+                        if now - _fp_last_update[0] < FINGERPRINT_PROGRESS_INTERVAL_SECONDS:
+                            return
+                        _fp_last_update[0] = now
+                    progress_cb(
                         completed,
                         fp_total,
                         track,
                         f"Fingerprinting ({completed}/{fp_total})...",
                     )
 
-            self._fingerprinter.fingerprint_batch(
-                fp_tracks,
-                max_workers=self._max_concurrent_fingerprints,
-                progress_callback=_on_fp_progress,
-                cancel_check=lambda: self._paused or self._cancelled,
-            )
-            result.stats.fingerprinted = sum(1 for t in fp_tracks if t.fingerprint)
-            logger.info(
-                "Phase 1 complete: %d/%d fingerprinted",
-                result.stats.fingerprinted,
-                len(fp_tracks),
-            )
+                # All remaining tracks get fingerprinted upfront
+                self._fingerprinter.fingerprint_batch(
+                    work_tracks,
+                    max_workers=self._max_concurrent_fingerprints,
+                    progress_callback=_on_fp_progress,
+                    cancel_check=lambda: (
+                        not self._resume_event.is_set() or self._cancel_event.is_set()
+                    ),
+                )
+                logger.info(
+                    "Phase 1 complete: %d/%d fingerprinted",
+                    result.stats.fingerprinted,
+                    total_work,
+                )
 
-        # --- Phase 2: Per-track pipeline (sequential API calls) ---
-        total_work = len(work_tracks)
-        for idx, track in enumerate(work_tracks):
-            # Check pause/cancel
-            while self._paused and not self._cancelled:
-                time.sleep(PAUSE_CHECK_INTERVAL_SECONDS)
-            if self._cancelled:
-                logger.info("Processing cancelled at track %d/%d", idx + 1, total_work)
-                break
-
-            step_num = idx + 1
-            try:
-                self._process_single_track(track, result, step_num, total_work)
-            except Exception as e:
-                logger.error("Error processing %s: %s", track.file_path.name, e)
-                track.state = ProcessingState.ERROR
-                track.error_message = str(e)
-                result.stats.errors += 1
+            # Tracks fingerprinting didn't hand over (no fpcalc, or it was
+            # interrupted by pause) go through the lookup phase without one.
+            for track in work_tracks:
+                if id(track) not in submitted:
+                    _submit(track)
 
-            # --- Save-as-you-go ---
-            if self._track_repo is not None:
-                try:
-                    self._track_repo.save(track)
-                except Exception as e:
-                    logger.warning("Failed to save track state: %s", e)
+            if work_tracks:
+                logger.info(
+                    "Phase 2: Looking up %d tracks with %d workers",
+                    total_work,
+                    self._max_concurrent_lookups,
+                )
+            for future in as_completed(future_to_track):
+                handled.add(future)
+                if future.result():
+                    self._save_track_state(future_to_track[future])
+                if self._cancel_event.is_set():
+                    logger.info("Processing cancelled, dropping queued tracks")
+                    break
+        finally:
+            # Drops queued tracks on cancel; in-flight tracks are allowed to finish.
+            # The lookup pool goes first so no in-flight track is left waiting
+            # on a prefetch that was cancelled underneath it.
+            pool.shutdown(wait=True, cancel_futures=True)
+            prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._acoustid_prefetch.clear()
+
+            # Tracks that were still in flight when the loop broke out
+            for future, track in future_to_track.items():
+                if future not in handled and not future.cancelled() and future.result():
+                    self._save_track_state(track)
+            self._flush_track_saves()
 
         logger.info(
             "Batch complete: %d total, %d auto-matched, %d review, %d unmatched, %d errors",
@@ -473,6 +617,156 @@ class BatchProcessor:
                 result.stats,
             )
 
+    def _prefetch_acoustid(self, pool: ThreadPoolExecutor, track: Track) -> None:
+        """Start the AcoustID lookup for a freshly fingerprinted track.
+
+        Tracks whose folder already marks them as DJ Screw are skipped --
+        they take the archive.org fast path and never use the result.
+        """
+        if self._archive_org and self._screw_handler.is_dj_screw_track(track):
+            return
+
+        def _lookup() -> _AcoustIdMatches | None:
+            if not self._wait_while_paused():
+                return None
+            return self._fingerprinter.lookup(track)
+
+        self._acoustid_prefetch[id(track)] = pool.submit(_lookup)
+
+    def _acoustid_lookup(self, track: Track) -> _AcoustIdMatches:
+        """Return the track's AcoustID matches, using a prefetched lookup if any."""
+        prefetched = self._acoustid_prefetch.pop(id(track), None)
+        if prefetched is not None:
+            matches = prefetched.result()
+            if matches is not None:
+                return matches
+        return self._fingerprinter.lookup(track)
+
+    def _skip_already_processed(self, result: BatchResult) -> list[Track]:
+        """Mark tracks finished in a previous run as done and return the rest.
+
+        The resume set can hold every path ever processed, so it is loaded
+        here and released when this returns instead of living for the
+        whole run.
+
+        Args:
+            result: The batch whose tracks are checked.
+
+        Returns:
+            Tracks that still need processing.
+        """
+        already_done: frozenset[str] = frozenset()
+        if self._track_repo is not None:
+            try:
+                already_done = self._track_repo.get_processed_paths()
+            except Exception as e:
+                logger.warning("Could not load resume state: %s", e)
+
+        if not already_done:
+            return list(result.tracks)
+
+        skipped = [t for t in result.tracks if t.path_str in already_done]
+        if not skipped:
+            return list(result.tracks)
+
+        # Mark as already-done so stats are accurate
+        for track in skipped:
+            track.state = ProcessingState.COMPLETED
+        remaining = [t for t in result.tracks if t.path_str not in already_done]
+        logger.info(
+            "Resuming: skipping %d already-processed tracks (%d remaining)",
+            len(skipped),
+            len(remaining),
+        )
+        result.stats.total = len(result.tracks)
+        # Only process the remaining tracks
+        return remaining
+
+    def _read_batch_tags(self, tracks: list[Track], result: BatchResult) -> bool:
+        """Read every track's existing tags before any lookup starts.
+
+        Returns:
+            True if all tags were read, False if processing was cancelled.
+        """
+        total = len(tracks)
+        for step_num, track in enumerate(tracks, start=1):
+            if not self._wait_while_paused():
+                return False
+            self._emit_progress(step_num, total, track, "Reading tags...")
+            track.state = ProcessingState.SCANNING
+            try:
+                self._tag_editor.read_tags(track)
+            except Exception as e:
+                # The track still goes through the pipeline, on filename guesses
+                logger.error("Error reading tags from %s: %s", track.file_path.name, e)
+            # No worker threads are running yet, so no _result_lock
+            result.stats.scanned += 1
+        return True
+
+    def _run_pipeline_step(
+        self,
+        track: Track,
+        result: BatchResult,
+        step_num: int,
+        total: int,
+    ) -> bool:
+        """Run one track through the per-track pipeline (inside a worker thread).
+
+        Blocks while paused and skips the track once cancelled.
+
+        Returns:
+            True if the track was processed (successfully or with an error),
+            False if it was skipped because processing was cancelled.
+        """
+        if not self._wait_while_paused():
+            return False
+
+        try:
+            self._process_single_track(track, result, step_num, total)
+        except Exception as e:
+            logger.error("Error processing %s: %s", track.file_path.name, e)
+            track.state = ProcessingState.ERROR
+            track.error_message = str(e)
+            with self._result_lock:
+                result.stats.errors += 1
+        return True
+
+    def _save_track_state(self, track: Track) -> None:
+        """Persist a processed track for resume-on-restart (save-as-you-go).
+
+        Tracks are written ``TRACK_SAVE_COMMIT_INTERVAL`` at a time, each
+        group in one ``save_batch()`` transaction, rather than one commit per
+        track; ``_flush_track_saves`` writes the remainder when the batch
+        ends or is cancelled.
+        """
+        if self._track_repo is None:
+            return
+        self._pending_saves.append(track)
+        if len(self._pending_saves) >= TRACK_SAVE_COMMIT_INTERVAL:
+            self._flush_track_saves()
+
+    def _flush_track_saves(self) -> None:
+        """Write any save-as-you-go tracks still pending."""
+        if self._track_repo is None or not self._pending_saves:
+            return
+        try:
+            self._track_repo.save_batch(self._pending_saves)
+        except Exception as e:
+            logger.warning("Failed to save track state: %s", e)
+        self._pending_saves = []
+
+    def _fetch_tagged_recording(self, track: Track) -> MatchCandidate | None:
+        """Fetch the recording named by the file's own MusicBrainz recording ID tag.
+
+        Returns:
+            The MusicBrainz candidate, or None if the track carries no
+            recording ID or the fetch fails (callers fall back to fuzzy search).
+        """
+        if not track.musicbrainz_recording_id:
+            return None
+        track.state = ProcessingState.FETCHING_METADATA
+        return self._metadata_fetcher.fetch_recording(track.musicbrainz_recording_id)
+
     def _build_existing_tags_candidate(self, track: Track) -> MatchCandidate | None:
         """Create a MatchCandidate from the track's existing embedded tags.
 
@@ -522,13 +816,8 @@ class BatchProcessor:
         For all other tracks, uses the standard pipeline (fingerprint,
         MusicBrainz, Discogs, scoring).
         """
-        # Read existing tags
-        self._emit_progress(step_num, total, track, "Reading tags...")
-        track.state = ProcessingState.SCANNING
-        self._tag_editor.read_tags(track)
-        result.stats.scanned += 1
-
-        # Guess from filename if tags are missing
+        # Existing tags were read by _read_batch_tags; guess from the
+        # filename if they are missing
         if not track.has_basic_tags:
             self._guess_tags_from_filename(track)
 
@@ -562,13 +851,13 @@ class BatchProcessor:
         fingerprint phase.  If it wasn't (e.g. fpcalc not available or track
         was added after the batch phase), the lookup is safely skipped.
         """
-        acoustid_matches = []
+        acoustid_matches: _AcoustIdMatches = []
 
         # AcoustID lookup (fingerprint was already generated in batch phase)
         if track.fingerprint:
             self._emit_progress(step_num, total, track, "Looking up AcoustID...")
             track.state = ProcessingState.FINGERPRINTING
-            acoustid_matches = self._fingerprinter.lookup(track)
+            acoustid_matches = self._acoustid_lookup(track)
             if acoustid_matches:
                 best_id, _best_score, recording_id, _ = acoustid_matches[0]
                 track.acoustid = best_id
@@ -601,6 +890,12 @@ class BatchProcessor:
                     if candidate:
                         candidate.fingerprint_score = score
                         match_result.candidates.append(candidate)
+        elif (tagged := self._fetch_tagged_recording(track)) is not None:
+            # The file already names its MusicBrainz recording (e.g. tagged by
+            # Picard) -- the strongest match there is, so skip the 2-4 fuzzy
+            # MusicBrainz/Discogs searches below.
+            match_result.lookup_source = "mbid"
+            match_result.candidates.append(tagged)
         else:
             # Fuzzy search using existing tags and/or filename
             self._emit_progress(step_num, total, track, "Searching by tags...")
@@ -686,7 +981,9 @@ class BatchProcessor:
         # Score all candidates
         self._emit_progress(step_num, total, track, "Scoring matches...")
         track.state = ProcessingState.SCORING
-        match_result = self._scorer.score_match_result(track, match_result, result.tracks)
+        match_result = self._scorer.score_match_result(
+            track, match_result, album_counts=self._album_counts
+        )
 
         # Boost existing-tags confidence for well-tagged files.
         # Use the scorer's output as a floor (not a full override) so we
@@ -705,11 +1002,12 @@ class BatchProcessor:
                 bool(track.album),
             )
             # Re-sort so candidates are in the right order
-            match_result.candidates.sort(key=lambda c: c.confidence, reverse=True)
+            match_result.candidates.sort(key=attrgetter("confidence"), reverse=True)
             match_result.best_match_index = 0
 
         # Store match result keyed by file path
-        result.match_results[str(track.file_path)] = match_result
+        with self._result_lock:
+            result.match_results[track.path_str] = match_result
 
         # Classify and act
         if match_result.has_match:
@@ -723,21 +1021,25 @@ class BatchProcessor:
                 best = match_result.best_match
                 if best:
                     self.apply_match(track, best)
-                result.stats.auto_matched += 1
+                with self._result_lock:
+                    result.stats.auto_matched += 1
             else:
                 # Needs review (top picks or manual)
                 track.state = ProcessingState.NEEDS_REVIEW
                 track.confidence = best_confidence
-                result.stats.needs_review += 1
+                with self._result_lock:
+                    result.stats.needs_review += 1
                 self._emit_progress(step_num, total, track, "Needs review")
         else:
             # No match at all
             track.state = ProcessingState.UNMATCHED
-            result.stats.unmatched += 1
+            with self._result_lock:
+                result.stats.unmatched += 1
 
             if self._move_unmatched and self._organizer:
                 # Legacy behavior: move to _Unmatched folder
-                self._organizer.organize_unmatched(track)
+                with self._apply_lock:
+                    self._organizer.organize_unmatched(track)
                 self._emit_progress(step_num, total, track, "Unmatched (moved)")
             else:
                 # Default: leave in place, will be logged in report
@@ -754,7 +1056,7 @@ class BatchProcessor:
             prefix: The numeric prefix string (e.g. "1-04", "2-12").
             track: Track to update.
         """
-        m = re.match(r"^(\d+)-(\d+)$", prefix.strip())
+        m = _RE_DISC_TRACK.match(prefix.strip())
         if not m:
             return
         disc = int(m.group(1))
@@ -782,168 +1084,59 @@ class BatchProcessor:
             track: Track to update with guessed tags.
         """
 
-        stem = track.file_path.stem  # filename without extension
-
-        # Try "Artist - Title" pattern (including "01 Artist - Title")
-        if " - " in stem:
-            parts = stem.split(" - ", 1)
-            first = parts[0].strip()
-
-            if re.match(r"^\d{1,3}$", first):
-                # "01 - Title"
-                if not track.track_number:
-                    track.track_number = int(first)
-                if not track.title:
-                    track.title = parts[1].strip()
-            elif re.match(r"^\d+-\d+$", first):
-                # "1-04 - Title" -> disc 1, track 4
-                self._parse_disc_track(first, track)
-                if not track.title:
-                    track.title = parts[1].strip()
-            elif re.match(r"^(\d+-\d+)\s+(.+)$", first):
-                # "1-01 Artist Name - Title" (compilation style with disc-track)
-                m = re.match(r"^(\d+-\d+)\s+(.+)$", first)
-                if m:
-                    self._parse_disc_track(m.group(1), track)
-                    if not track.artist:
-                        track.artist = m.group(2).strip()
-                    if not track.title:
-                        track.title = parts[1].strip()
-            elif re.match(r"^(\d{1,3})\s+(.+)$", first):
-                # "01 Artist Name - Title" (compilation style)
-                m = re.match(r"^(\d{1,3})\s+(.+)$", first)
-                if m:
-                    if not track.track_number:
-                        track.track_number = int(m.group(1))
-                    if not track.artist:
-                        track.artist = m.group(2).strip()
-                    if not track.title:
-                        track.title = parts[1].strip()
-            else:
-                # "Artist - Title"
-                if not track.artist:
-                    track.artist = first
-                if not track.title:
-                    track.title = parts[1].strip()
-
-        elif "- " in stem or " -" in stem:
-            # Handle "Artist- Title (Ft. Other).mp3" (DJ Screw style, dash with inconsistent spacing)
-            dash_parts = re.split(r"\s*-\s*", stem, maxsplit=1)
-            if len(dash_parts) == 2:
-                first = dash_parts[0].strip()
-                second = dash_parts[1].strip()
-                # Strip leading track number from first part
-                num_match = re.match(r"^\d{1,3}\s+(.+)$", first)
-                if num_match is not None:
-                    first = num_match.group(1).strip()
-                if first and not track.artist:
-                    track.artist = first
-                if second and not track.title:
-                    track.title = second
-
-        elif re.match(r"^\d{1,3}\s+", stem):
-            # "01 Title" or "05 Hellraizer" or "03 2Pac Ft. Dru Down - Something"
-            m = re.match(r"^(\d{1,3})\s+(.*)", stem)
-            if m is not None:
-                if not track.track_number:
-                    track.track_number = int(m.group(1))
-                content = m.group(2).strip()
-            else:
-                content = stem
-
-            # Check if the content itself has "Artist - Title" within it
-            if " - " in content:
-                artist_part, title_part = content.split(" - ", 1)
-                if not track.artist:
-                    track.artist = artist_part.strip()
-                if not track.title:
-                    track.title = title_part.strip()
-            else:
-                if not track.title:
-                    track.title = content
-
-        elif re.match(r"^\d+-\d+\s+", stem):
-            # "1-04 ambitionz az a ridah" -> disc 1, track 4
-            m = re.match(r"^(\d+-\d+)\s+(.*)", stem)
-            if m is not None:
-                self._parse_disc_track(m.group(1), track)
-                content = m.group(2).strip()
-            else:
-                content = stem
-            if " - " in content:
-                artist_part, title_part = content.split(" - ", 1)
-                if not track.artist:
-                    track.artist = artist_part.strip()
-                if not track.title:
-                    track.title = title_part.strip()
-            else:
-                if not track.title:
-                    track.title = content
-        else:
+        # Filename without extension.  Capped so the lazy/backtracking parts of
+        # _RE_FILENAME stay cheap on pathological names (real ones are < 256).
+        file_path = track.file_path
+        stem = file_path.stem[:FILENAME_PARSE_MAX_LENGTH]
+
+        m = _RE_FILENAME.match(stem)
+        if m is None or m.lastgroup is None:
             # Just use the whole filename as title
             if not track.title:
                 track.title = stem
+        else:
+            track_number = m["num"] or m["na"] or m["lead_num"]
+            if track_number and not track.track_number:
+                track.track_number = int(track_number)
+            disc_track = m["dt"] or m["dta"] or m["lead_dt"]
+            if disc_track:
+                # "1-04" -> disc 1, track 4
+                self._parse_disc_track(disc_track, track)
+
+            artist = m["dta_artist"] or m["na_artist"] or m["artist"] or m["dash_artist"]
+            if artist and not track.artist:
+                track.artist = artist.strip()
+            title = m[m.lastgroup].strip()
+            if title and not track.title:
+                track.title = title
 
         # --- Infer album and album_artist from folder structure ---
-        parent_name = track.file_path.parent.name
-        grandparent_name = (
-            track.file_path.parent.parent.name if len(track.file_path.parts) > 3 else ""
-        )
-
-        # Check if grandparent or parent looks like a DJ/compilation artist
-        _skip_names = SKIP_FOLDER_NAMES
-        gp_lower = grandparent_name.lower().replace("_", " ").replace("-", " ").strip()
-        parent_lower = parent_name.lower().replace("_", " ").replace("-", " ").strip()
-
-        # Detect DJ Screw and similar compilation structures
-        is_dj_folder = False
-        dj_artist = None
-
-        for folder_name, folder_lower in [
-            (grandparent_name, gp_lower),
-            (parent_name, parent_lower),
-        ]:
-            if any(
-                v in folder_lower
-                for v in ("dj screw", "djscrew", "screwed up click", "va dj screw")
-            ):
-                is_dj_folder = True
-                dj_artist = "DJ Screw"
-                break
-            elif folder_lower.startswith("dj "):
-                is_dj_folder = True
-                dj_artist = normalize_artist_name(folder_name)
-                break
-
-        if is_dj_folder and dj_artist:
+        dj_artist, dj_album, folder_artist = _folder_tags(file_path.parent)
+        if dj_artist:
             if not track.album_artist:
                 track.album_artist = dj_artist
-            # Use the immediate parent folder as the album name (e.g. "Chapter 012 - June 27th")
-            if not track.album and parent_lower not in _skip_names:
-                if parent_lower != gp_lower:
-                    # parent is the chapter/album, grandparent is the DJ
-                    track.album = parent_name
-                elif grandparent_name and gp_lower not in _skip_names:
-                    track.album = grandparent_name
-        elif not track.artist:
-            # Non-compilation: try parent folder as artist
-            if parent_lower not in _skip_names:
-                track.artist = parent_name
+            if not track.album and dj_album:
+                track.album = dj_album
+        elif not track.artist and folder_artist:
+            # Non-compilation: parent folder as artist
+            track.artist = folder_artist
 
         # Clean up "(Ft. ...)" from title -- keep it, but also strip for search purposes later
         # Remove truncation artifacts (filenames cut off at char limit)
         if track.title and track.title.endswith("."):
             track.title = track.title.rstrip(".")
 
-        logger.debug(
-            "Guessed from filename: artist='%s', title='%s', album='%s', "
-            "album_artist='%s' (file: %s)",
-            track.artist,
-            track.title,
-            track.album,
-            track.album_artist,
-            track.file_path.name,
-        )
+        # Runs for every untagged file: skip building the arguments unless shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Guessed from filename: artist='%s', title='%s', album='%s', "
+                "album_artist='%s' (file: %s)",
+                track.artist,
+                track.title,
+                track.album,
+                track.album_artist,
+                file_path.name,
+            )
 
     def _normalize_metadata(self, track: Track, from_api: bool = True) -> None:
         """Normalize capitalization on track metadata.
@@ -972,12 +1165,13 @@ class BatchProcessor:
             if track.album_artist:
                 track.album_artist = normalize_artist_name(track.album_artist)
 
-        logger.debug(
-            "Normalized metadata: artist='%s', title='%s', album='%s'",
-            track.artist,
-            track.title,
-            track.album,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Normalized metadata: artist='%s', title='%s', album='%s'",
+                track.artist,
+                track.title,
+                track.album,
+            )
 
     # ------------------------------------------------------------------
     # DJ Screw fast path
@@ -1052,7 +1246,8 @@ class BatchProcessor:
             best_candidate.confidence = 98.0
             self.apply_match(track, best_candidate)
             track.state = ProcessingState.AUTO_MATCHED
-            result.stats.auto_matched += 1
+            with self._result_lock:
+                result.stats.auto_matched += 1
             self._emit_progress(
                 step_num,
                 total,
@@ -1066,21 +1261,23 @@ class BatchProcessor:
             )
             self._normalize_metadata(track, from_api=True)
             self._compilation_detector.detect(track)
-            if self._dry_run:
-                logger.info("[DRY RUN] Would write album-only tags: %s", track.file_path.name)
-                if self._organizer:
-                    track = self._organizer.organize(track)
-            else:
-                # SAFETY: backup before tag changes
-                if self._organizer:
-                    self._organizer.backup_before_changes(track)
-                if self._tag_editor.write_tags(track):
-                    logger.info("Wrote tags (album-only): %s", track.file_path.name)
-                if self._organizer:
-                    track = self._organizer.organize(track)
+            with self._apply_lock:
+                if self._dry_run:
+                    logger.info("[DRY RUN] Would write album-only tags: %s", track.file_path.name)
+                    if self._organizer:
+                        track = self._organizer.organize(track)
+                else:
+                    # SAFETY: backup before tag changes
+                    if self._organizer:
+                        self._organizer.backup_before_changes(track)
+                    if self._tag_editor.write_tags(track):
+                        logger.info("Wrote tags (album-only): %s", track.file_path.name)
+                    if self._organizer:
+                        track = self._organizer.organize(track)
             track.state = ProcessingState.AUTO_MATCHED
             track.confidence = 80.0
-            result.stats.auto_matched += 1
+            with self._result_lock:
+                result.stats.auto_matched += 1
             self._emit_progress(
                 step_num,
                 total,
@@ -1104,21 +1301,22 @@ class BatchProcessor:
         if not report:
             return None
 
-        # Collect file paths that still exist
+        # Collect file paths that still exist.  The stat() calls run in
+        # parallel: on network shares each one is a full round trip.
+        paths = [
+            Path(entry["file_path"])
+            for section in ("unmatched", "errors")
+            for entry in report.get(section, [])
+        ]
         retry_paths = []
-        for entry in report.get("unmatched", []):
-            path = Path(entry["file_path"])
-            if path.exists():
-                retry_paths.append(path)
-            else:
-                logger.debug("Skipping missing file: %s", path)
-
-        for entry in report.get("errors", []):
-            path = Path(entry["file_path"])
-            if path.exists():
-                retry_paths.append(path)
-            else:
-                logger.debug("Skipping missing file: %s", path)
+        if paths:
+            workers = min(RETRY_EXISTS_CHECK_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for path, exists in zip(paths, pool.map(Path.exists, paths), strict=True):
+                    if exists:
+                        retry_paths.append(path)
+                    else:
+                        logger.debug("Skipping missing file: %s", path)
 
         if not retry_paths:
             logger.info("No retryable files found (all missing or already processed)")
@@ -5,17 +5,19 @@ Extracted from BatchProcessor to improve separation of concerns.
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING
 
 from src.utils.constants import (
+    ALBUM_CLASSIFY_CACHE_SIZE,
     COMPILATION_INDICATORS,
     DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST,
     DJ_SCREW_FOLDER_VARIANTS,
     KNOWN_DJS,
     SCREW_ALBUM_KEYWORDS,
 )
-from src.utils.file_utils import normalize_artist_name
+from src.utils.file_utils import normalize_artist_name, normalize_folder_name
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -24,6 +26,43 @@ if TYPE_CHECKING:
 
 logger = get_logger("core.compilation_detector")
 
+# Album-name words that mark a compilation / mixtape (besides DJ names and
+# DJ Screw keywords).
+_COMPILATION_ALBUM_WORDS = (
+    "bootleg",
+    "mixtape",
+    "mix tape",
+    "compilation",
+    "best of",
+    "greatest hits",
+    "soundtrack",
+    "ost",
+)
+
+
+def _substring_re(words: frozenset[str] | tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation that finds any of ``words`` in a single scan."""
+    return re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+_SCREW_KEYWORD_RE = _substring_re(SCREW_ALBUM_KEYWORDS)
+# Everything album_looks_like_compilation() tests for, in one pattern: a
+# "Chapter N" or "DJ " prefix, or any DJ / DJ Screw / compilation keyword.
+_COMPILATION_ALBUM_RE = re.compile(
+    r"^(?:chapter\s*\d|dj )|"
+    + _substring_re(KNOWN_DJS | SCREW_ALBUM_KEYWORDS | frozenset(_COMPILATION_ALBUM_WORDS)).pattern
+)
+# Album-name words that make detect() flag a compilation by name alone
+_ALBUM_INDICATOR_RE = _substring_re(("compilation", "soundtrack", "ost", "mixed by"))
+# Folder names (normalized) that put a track in the DJ Screw catalog
+_DJ_SCREW_FOLDER_RE = _substring_re(DJ_SCREW_FOLDER_VARIANTS)
+# Spellings of DJ Screw seen in album_artist tags
+_DJ_SCREW_NAME_RE = _substring_re(("dj screw", "djscrew", "dj_screw"))
+# album_artist values normalized to "Various Artists"
+_VARIOUS_ARTISTS_ALIASES = frozenset({"various artists", "various", "va"})
+# Album prefixes for "Diary of the Originator" releases without chapter detail
+_DOTO_PREFIXES = ("d.o.t.o", "doto")
+
 
 class CompilationDetector:
     """Detects whether a track belongs to a compilation, DJ mix, or similar."""
@@ -39,7 +78,32 @@ class CompilationDetector:
         - album_artist differs from track artist and starts with 'DJ'
         - album name contains compilation keywords
         - The source folder structure indicates a DJ/compilation release
+
+        Detection only reads the fields in ``_detection_state``.  When a
+        previous run on exactly those values changed nothing, the repeat
+        call (e.g. from ``apply_match`` after the pipeline already ran it)
+        is skipped.
         """
+        before = self._detection_state(track)
+        if track.compilation_state == before:
+            return
+        self._detect(track)
+        after = self._detection_state(track)
+        track.compilation_state = after if after == before else None
+
+    @staticmethod
+    def _detection_state(track: Track) -> tuple:
+        """Snapshot of every field ``_detect`` reads or writes."""
+        return (
+            track.album_artist,
+            track.album,
+            track.artist,
+            track.original_path,
+            track.is_compilation,
+        )
+
+    def _detect(self, track: Track) -> None:
+        """Run compilation detection (see ``detect``)."""
         aa_lower = (track.album_artist or "").strip().lower()
         album_lower = (track.album or "").strip().lower()
         artist_lower = (track.artist or "").strip().lower()
@@ -56,7 +120,7 @@ class CompilationDetector:
         # Check if album_artist is a generic compilation indicator
         if aa_lower in COMPILATION_INDICATORS:
             track.is_compilation = True
-            if aa_lower in ("various artists", "various", "va"):
+            if aa_lower in _VARIOUS_ARTISTS_ALIASES:
                 track.album_artist = "Various Artists"
             logger.debug("Compilation detected (indicator): %s", track.album_artist)
             return
@@ -69,13 +133,12 @@ class CompilationDetector:
             return
 
         # Check if album name contains compilation indicators
-        for indicator in ("compilation", "soundtrack", "ost", "mixed by"):
-            if indicator in album_lower:
-                track.is_compilation = True
-                if not track.album_artist:
-                    track.album_artist = "Various Artists"
-                logger.debug("Compilation detected (album name): %s", track.album)
-                return
+        if _ALBUM_INDICATOR_RE.search(album_lower):
+            track.is_compilation = True
+            if not track.album_artist:
+                track.album_artist = "Various Artists"
+            logger.debug("Compilation detected (album name): %s", track.album)
+            return
 
         # Check if album name matches a DJ Screw pattern and normalize it
         self._screw_handler.normalize_screw_album(track)
@@ -84,7 +147,7 @@ class CompilationDetector:
             return
 
         # Check for "D.O.T.O." without chapter detail
-        if album_lower.startswith("d.o.t.o") or album_lower.startswith("doto"):
+        if album_lower.startswith(_DOTO_PREFIXES):
             track.is_compilation = True
             if not track.album_artist:
                 track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
@@ -92,20 +155,20 @@ class CompilationDetector:
             return
 
         # Check for known DJ Screw album keywords
-        for keyword in SCREW_ALBUM_KEYWORDS:
-            if keyword in album_lower:
-                track.is_compilation = True
-                if not track.album_artist:
-                    track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
-                logger.debug(
-                    "Compilation detected (Screw album keyword '%s'): %s",
-                    keyword,
-                    track.album,
-                )
-                return
+        keyword_match = _SCREW_KEYWORD_RE.search(album_lower)
+        if keyword_match:
+            track.is_compilation = True
+            if not track.album_artist:
+                track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
+            logger.debug(
+                "Compilation detected (Screw album keyword '%s'): %s",
+                keyword_match.group(0),
+                track.album,
+            )
+            return
 
         # Check if album_artist tag is "DJ Screw"
-        if "dj screw" in aa_lower or "djscrew" in aa_lower or "dj_screw" in aa_lower:
+        if _DJ_SCREW_NAME_RE.search(aa_lower):
             track.is_compilation = True
             track.album_artist = "DJ Screw"
             self._screw_handler.normalize_screw_album(track)
@@ -123,18 +186,17 @@ class CompilationDetector:
 
         parts = track.original_path.parts
         for part in parts:
-            part_lower = part.lower().replace("_", " ").replace("-", " ").strip()
-            for variant in DJ_SCREW_FOLDER_VARIANTS:
-                if variant in part_lower or part_lower.startswith(variant):
-                    track.is_compilation = True
-                    if not track.album_artist:
-                        track.album_artist = "DJ Screw"
-                    logger.debug(
-                        "Compilation detected from folder: '%s' -> album_artist='%s'",
-                        part,
-                        track.album_artist,
-                    )
-                    return
+            part_lower = normalize_folder_name(part)
+            if _DJ_SCREW_FOLDER_RE.search(part_lower):
+                track.is_compilation = True
+                if not track.album_artist:
+                    track.album_artist = "DJ Screw"
+                logger.debug(
+                    "Compilation detected from folder: '%s' -> album_artist='%s'",
+                    part,
+                    track.album_artist,
+                )
+                return
 
             if part_lower.startswith("dj ") and part_lower != (track.artist or "").lower():
                 track.is_compilation = True
@@ -148,38 +210,13 @@ class CompilationDetector:
                 return
 
     @staticmethod
+    @functools.lru_cache(maxsize=ALBUM_CLASSIFY_CACHE_SIZE)
     def album_looks_like_compilation(album: str) -> bool:
         """Quick check whether an album name looks like a compilation or mixtape.
 
         Used BEFORE the fuzzy search to decide whether to include the album
-        in the API query.
+        in the API query.  Memoized: albums repeat across every track on them.
         """
         if not album:
             return False
-        album_lower = album.strip().lower()
-
-        for dj in KNOWN_DJS:
-            if dj in album_lower:
-                return True
-
-        if re.match(r"chapter\s*\d", album_lower):
-            return True
-
-        for keyword in SCREW_ALBUM_KEYWORDS:
-            if keyword in album_lower:
-                return True
-
-        for indicator in (
-            "bootleg",
-            "mixtape",
-            "mix tape",
-            "compilation",
-            "best of",
-            "greatest hits",
-            "soundtrack",
-            "ost",
-        ):
-            if indicator in album_lower:
-                return True
-
-        return bool(album_lower.startswith("dj "))
+        return _COMPILATION_ALBUM_RE.search(album.strip().lower()) is not None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import logging
+from collections import Counter
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from src.core.fuzzy_matcher import FuzzyMatcher
@@ -9,6 +12,7 @@ from src.utils.constants import (
     ALBUM_SIMILARITY_THRESHOLD,
     DEFAULT_AUTO_APPLY_THRESHOLD,
     DEFAULT_REVIEW_THRESHOLD,
+    NEUTRAL_ALBUM_CONSISTENCY_SCORE,
     WEIGHT_ALBUM_CONSISTENCY,
     WEIGHT_ARTIST,
     WEIGHT_DURATION,
@@ -72,23 +76,42 @@ class ConfidenceScorer:
         Returns:
             Confidence score from 0.0 to 100.0.
         """
-        # Compare track tags to candidate
-        field_scores = self._fuzzy.compare_track_to_candidate(track, candidate)
+        album_score = self._calculate_album_consistency(
+            candidate.album, self.count_albums(album_tracks)
+        )
+        return self._combine_scores(
+            track,
+            candidate,
+            self._fuzzy.similarity(track.title, candidate.title),
+            self._fuzzy.similarity(track.artist, candidate.artist),
+            album_score,
+        )
 
-        # Fingerprint score (already 0.0-1.0 from AcoustID, scale to 0-100)
-        fingerprint_score = candidate.fingerprint_score * 100.0
+    def _combine_scores(
+        self,
+        track: Track,
+        candidate: MatchCandidate,
+        title_score: float,
+        artist_score: float,
+        album_score: float,
+    ) -> float:
+        """Weight one candidate's field scores into its overall confidence.
 
-        # Title similarity
-        title_score = field_scores.get("title", 0.0)
+        Args:
+            track: The original track.
+            candidate: The candidate being scored.
+            title_score: Title similarity (0-100).
+            artist_score: Artist similarity (0-100).
+            album_score: Album consistency score (0-100).
 
-        # Artist similarity
-        artist_score = field_scores.get("artist", 0.0)
+        Returns:
+            Confidence score from 0.0 to 100.0.
+        """
+        # Fingerprint score (already 0.0-1.0 from AcoustID, scale to 0-100)
+        fingerprint_score = candidate.fingerprint_score * 100.0
 
         # Duration match
-        duration_score = field_scores.get("duration", 50.0)
-
-        # Album consistency: check if other tracks in the batch match the same album
-        album_score = self._calculate_album_consistency(candidate, album_tracks)
+        duration_score = self._fuzzy.duration_similarity(track.duration, candidate.duration)
 
         # Weighted combination
         overall = (
@@ -96,25 +119,29 @@ class ConfidenceScorer:
             + title_score * WEIGHT_TITLE
             + artist_score * WEIGHT_ARTIST
             + duration_score * WEIGHT_DURATION
+            # Album consistency: do other tracks in the batch match the same album?
             + album_score * WEIGHT_ALBUM_CONSISTENCY
         )
 
         # Clamp to 0-100
         overall = max(0.0, min(100.0, overall))
 
-        logger.debug(
-            "Score for '%s' -> '%s - %s': fp=%.1f, title=%.1f, artist=%.1f, "
-            "dur=%.1f, album=%.1f => overall=%.1f",
-            track.display_title,
-            candidate.artist,
-            candidate.title,
-            fingerprint_score,
-            title_score,
-            artist_score,
-            duration_score,
-            album_score,
-            overall,
-        )
+        # Called for every candidate of every track: skip the 9-argument call
+        # (and the display_title lookup) unless debug output is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Score for '%s' -> '%s - %s': fp=%.1f, title=%.1f, artist=%.1f, "
+                "dur=%.1f, album=%.1f => overall=%.1f",
+                track.display_title,
+                candidate.artist,
+                candidate.title,
+                fingerprint_score,
+                title_score,
+                artist_score,
+                duration_score,
+                album_score,
+                overall,
+            )
 
         return overall
 
@@ -123,6 +150,8 @@ class ConfidenceScorer:
         track: Track,
         match_result: MatchResult,
         album_tracks: list[Track] | None = None,
+        *,
+        album_counts: Counter[str] | None = None,
     ) -> MatchResult:
         """Score all candidates in a MatchResult and sort by confidence.
 
@@ -130,15 +159,41 @@ class ConfidenceScorer:
             track: The original track.
             match_result: MatchResult containing candidates to score.
             album_tracks: Optional list of batch tracks for album consistency.
+            album_counts: Batch album names already counted with
+                ``count_albums``; used instead of *album_tracks* when given.
 
         Returns:
             The same MatchResult with candidates scored and sorted.
         """
-        for candidate in match_result.candidates:
-            candidate.confidence = self.score_candidate(track, candidate, album_tracks)
+        candidates = match_result.candidates
+
+        # Title and artist similarity for every candidate at once: each
+        # rapidfuzz scorer runs over the whole list in C.
+        title_scores = self._fuzzy.similarity_many(track.title, [c.title for c in candidates])
+        artist_scores = self._fuzzy.similarity_many(track.artist, [c.artist for c in candidates])
+
+        # Count the batch's albums once, and score each distinct candidate
+        # album against them once -- candidates often share a release.
+        if album_counts is None:
+            album_counts = self.count_albums(album_tracks)
+        album_scores: dict[str, float] = {}
+        for candidate, title_score, artist_score in zip(
+            candidates, title_scores, artist_scores, strict=True
+        ):
+            if not album_counts or not candidate.album:
+                # Common for MusicBrainz hits -- skip the lookup entirely
+                album_score = NEUTRAL_ALBUM_CONSISTENCY_SCORE
+            elif candidate.album in album_scores:
+                album_score = album_scores[candidate.album]
+            else:
+                album_score = self._calculate_album_consistency(candidate.album, album_counts)
+                album_scores[candidate.album] = album_score
+            candidate.confidence = self._combine_scores(
+                track, candidate, title_score, artist_score, album_score
+            )
 
         # Sort by confidence descending
-        match_result.candidates.sort(key=lambda c: c.confidence, reverse=True)
+        match_result.candidates.sort(key=attrgetter("confidence"), reverse=True)
 
         # Set best match to the highest confidence candidate
         if match_result.candidates:
@@ -164,10 +219,28 @@ class ConfidenceScorer:
         else:
             return "unmatched"
 
+    @staticmethod
+    def count_albums(album_tracks: list[Track] | None) -> Counter[str]:
+        """Count how many batch tracks carry each album name.
+
+        Tracks from the same album share the tag, so scoring against the
+        distinct names costs one similarity call per album instead of one
+        per track.
+
+        Args:
+            album_tracks: Other tracks in the batch.
+
+        Returns:
+            Counter mapping album name to number of tracks.
+        """
+        if not album_tracks:
+            return Counter()
+        return Counter(t.album for t in album_tracks if t.album)
+
     def _calculate_album_consistency(
         self,
-        candidate: MatchCandidate,
-        album_tracks: list[Track] | None,
+        album: str | None,
+        album_counts: Counter[str],
     ) -> float:
         """Check if other tracks in the batch appear to be from the same album.
 
@@ -176,28 +249,25 @@ class ConfidenceScorer:
         signal the match is correct.
 
         Args:
-            candidate: The candidate to check.
-            album_tracks: Other tracks in the batch.
+            album: The candidate's album name.
+            album_counts: Album names of the other batch tracks, with counts
+                (from ``count_albums``).
 
         Returns:
             Score from 0.0 to 100.0.
         """
-        if not album_tracks or not candidate.album:
+        if not album_counts or not album:
             # No context to compare -- return a neutral score
-            return 50.0
-
-        matches = 0
-        total = 0
-
-        for other_track in album_tracks:
-            if other_track.album:
-                total += 1
-                sim = self._fuzzy.similarity(candidate.album, other_track.album)
-                if sim >= ALBUM_SIMILARITY_THRESHOLD:
-                    matches += 1
-
-        if total == 0:
-            return 50.0
+            return NEUTRAL_ALBUM_CONSISTENCY_SCORE
+
+        albums = list(album_counts)
+        similarities = self._fuzzy.similarity_many(album, albums)
+        matches = sum(
+            album_counts[album]
+            for album, sim in zip(albums, similarities, strict=True)
+            if sim >= ALBUM_SIMILARITY_THRESHOLD
+        )
+        total = album_counts.total()
 
         # Score based on fraction of matching albums
         return (matches / total) * 100.0
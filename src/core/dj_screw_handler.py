@@ -5,7 +5,10 @@ Extracted from BatchProcessor to improve separation of concerns.
 
 from __future__ import annotations
 
+import functools
+import logging
 import re
+import sys
 from typing import TYPE_CHECKING
 
 from src.utils.constants import (
@@ -13,8 +16,9 @@ from src.utils.constants import (
     DJ_SCREW_CHAPTER_FORMAT,
     DJ_SCREW_FOLDER_VARIANTS,
     SCREW_ALBUM_KEYWORDS,
+    SCREW_CHAPTER_CACHE_SIZE,
 )
-from src.utils.file_utils import smart_title_case
+from src.utils.file_utils import normalize_folder_name, smart_title_case
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -28,6 +32,107 @@ logger = get_logger("core.dj_screw_handler")
 # Regex separator for chapter patterns: "Chapter 051-Title", "Chapter 051. Title", etc.
 _CHAPTER_SEP = r"[-–—:.\s]\s*"  # noqa: RUF001
 
+# "Chapter 51..." at the start of an album name
+_CHAPTER_PREFIX_RE = re.compile(r"^chapter\s*\d{1,3}")
+# Already-normalized format: "Chapter 051 - 9 Fo Shit"
+_CHAPTER_TITLE_RE = re.compile(r"chapter\s*(\d{1,3})\s*[-–—:.]\s*(.+?)$")  # noqa: RUF001
+# Raw "Chapter NNN" without separator or title
+_CHAPTER_ONLY_RE = re.compile(r"^chapter\s*(\d{1,3})$")
+# Folder names like "chapter 051 9 fo shit" (after normalize_folder_name)
+_FOLDER_CHAPTER_RE = re.compile(r"chapter\s*(\d{1,3})\s+(.+)")
+# "DJ Screw - <tape or chapter>"
+_SCREW_PREFIX_RE = re.compile(r"^dj\s*screw\s*[-–—:]\s*(.+)$")  # noqa: RUF001
+# "Chapter NNN - Title", with an optional trailing "bootleg"
+_SCREW_CHAPTER_RE = re.compile(rf"^chapter\s*(\d{{1,3}})\s*{_CHAPTER_SEP}(.+?)(?:\s*bootleg)?\s*$")
+# Every DJ Screw album form normalize_screw_album understands, as one
+# alternation tried in priority order.  Each alternative is wrapped in a
+# group named after the form, which closes last, so ``match.lastgroup``
+# names the form that matched.
+_SCREW_ALBUM_RE = re.compile(
+    rf"""
+    # "Diary of the Originator: Chapter NNN - Title" or "D.O.T.O. Chapter NNN - Title"
+      (?P<diary>(?:diary\s+of\s+the\s+originator|d\.?o\.?t\.?o\.?)\s*[:_]?\s*
+        chapter\s*(?P<diary_num>\d{{1,3}})\s*{_CHAPTER_SEP}(?P<diary_title>.+)$)
+    # "D.O.T.O. (Chapter NNN - Title) (Bootleg)"
+    | (?P<doto>d\.?o\.?t\.?o\.?\s*[(\[]\s*chapter\s*(?P<doto_num>\d{{1,3}})\s*[-–—:.]\s*
+        (?P<doto_title>.+?)\s*[)\]](?:\s*[(\[]?\s*bootleg\s*[)\]]?)?\s*$)
+    # "DJ Screw - Chapter NNN - Title" or "DJ Screw - Some Tape Name"
+    | (?P<screw>dj\s*screw\s*[-–—:]\s*(?P<screw_inner>.+)$)
+    # "Chapter NNN - Title" (bare chapter, no prefix)
+    | (?P<chapter>chapter\s*(?P<chapter_num>\d{{1,3}})\s*{_CHAPTER_SEP}
+        (?P<chapter_title>.+?)(?:\s*bootleg)?\s*$)
+    """,  # noqa: RUF001
+    re.VERBOSE,
+)
+# _SCREW_ALBUM_RE form -> label for the normalization debug log
+_SCREW_ALBUM_FORMS = {
+    "diary": "legacy prefix",
+    "doto": "D.O.T.O.",
+    "screw": "dj screw prefix",
+    "chapter": "chapter",
+}
+# Trailing "(1994)" on a tape title
+_YEAR_SUFFIX_RE = re.compile(r"\s*\(\d{4}\)\s*$")
+
+# Any DJ Screw album keyword, found in one scan instead of one ``in`` per keyword
+_SCREW_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(SCREW_ALBUM_KEYWORDS, key=len, reverse=True))
+)
+# Any DJ Screw folder variant, searched in a whole lowercased path at once.
+# Spaces also match the "_" and "-" that normalize_folder_name() would turn
+# into spaces; no variant contains a path separator, so no match can
+# straddle two folders.
+_SCREW_FOLDER_RE = re.compile(
+    "|".join(
+        re.escape(v).replace(r"\ ", "[ _-]")
+        for v in sorted(DJ_SCREW_FOLDER_VARIANTS, key=len, reverse=True)
+    )
+)
+
+
+@functools.lru_cache(maxsize=SCREW_CHAPTER_CACHE_SIZE)
+def _chapter_from_album(album_lower: str) -> tuple[int, str | None] | None:
+    """Parse the chapter number (and title) an album name spells out.
+
+    Memoized: every track of a chapter carries the same album.
+    """
+    # Already-normalized format: "Chapter 051 - 9 Fo Shit"
+    m = _CHAPTER_TITLE_RE.search(album_lower)
+    if m:
+        return int(m.group(1)), m.group(2).strip()
+
+    # Raw "Chapter NNN" without separator (edge case)
+    m = _CHAPTER_ONLY_RE.match(album_lower)
+    if m:
+        return int(m.group(1)), None
+    return None
+
+
+@functools.lru_cache(maxsize=SCREW_CHAPTER_CACHE_SIZE)
+def _chapter_from_folder(name: str) -> tuple[int, str] | None:
+    """Parse a "Chapter NNN Title" path component, memoized per name."""
+    m = _FOLDER_CHAPTER_RE.match(normalize_folder_name(name))
+    if m:
+        return int(m.group(1)), m.group(2).strip()
+    return None
+
+
+def _duration_similarity(track_duration: float | None, candidate_duration: float | None) -> float:
+    """Step score (0-100) for how closely an archive.org track's length agrees.
+
+    Neutral (50.0) when either duration is unknown.
+    """
+    if not track_duration or not candidate_duration:
+        return 50.0
+    diff = abs(track_duration - candidate_duration)
+    if diff <= 2.0:
+        return 100.0
+    if diff <= 10.0:
+        return 80.0
+    if diff <= 30.0:
+        return 50.0
+    return 10.0
+
 
 class DJScrewHandler:
     """Handles DJ Screw track detection, album normalization, and IA matching."""
@@ -39,6 +144,8 @@ class DJScrewHandler:
     ) -> None:
         self._archive_org = archive_org
         self._fuzzy = fuzzy
+        # Reverse tape-title lookups (a fuzzy scan of the whole index), per title
+        self._tape_chapters: dict[str, int | None] = {}
 
     # ------------------------------------------------------------------
     # Detection
@@ -58,22 +165,22 @@ class DJScrewHandler:
             return True
 
         album_lower = (track.album or "").strip().lower()
-        if re.match(r"^chapter\s*\d{1,3}", album_lower):
+        # Most tracks aren't DJ Screw: reject with a plain prefix test before regex
+        if album_lower.startswith("chapter") and _CHAPTER_PREFIX_RE.match(album_lower):
             return True
         if album_lower.startswith("dj screw"):
             return True
-        for keyword in SCREW_ALBUM_KEYWORDS:
-            if keyword in album_lower:
-                return True
+        if _SCREW_KEYWORD_RE.search(album_lower):
+            return True
 
         # Check folder path
-        if track.original_path or track.file_path:
-            path = track.original_path or track.file_path
-            for part in path.parts:
-                part_lower = part.lower().replace("_", " ").replace("-", " ").strip()
-                for variant in DJ_SCREW_FOLDER_VARIANTS:
-                    if variant in part_lower:
-                        return True
+        path = track.original_path or track.file_path
+        if path:
+            path_lower = str(path).lower()
+            # Every folder variant contains "screw": a plain substring test
+            # rejects almost every other path before the regex runs
+            if "screw" in path_lower and _SCREW_FOLDER_RE.search(path_lower):
+                return True
 
         return False
 
@@ -94,15 +201,9 @@ class DJScrewHandler:
         album = (track.album or "").strip()
         album_lower = album.lower()
 
-        # Already-normalized format: "Chapter 051 - 9 Fo Shit"
-        m = re.search(r"chapter\s*(\d{1,3})\s*[-–—:.]\s*(.+?)$", album_lower)  # noqa: RUF001
-        if m:
-            return int(m.group(1)), m.group(2).strip()
-
-        # Raw "Chapter NNN" without separator (edge case)
-        m = re.match(r"^chapter\s*(\d{1,3})$", album_lower)
-        if m:
-            return int(m.group(1)), None
+        chapter_info = _chapter_from_album(album_lower)
+        if chapter_info:
+            return chapter_info
 
         # Check album_artist to confirm it's DJ Screw even if album lacks "chapter"
         aa = (track.album_artist or "").strip().lower()
@@ -111,24 +212,25 @@ class DJScrewHandler:
 
         # DJ Screw is album_artist but album doesn't have "chapter".
         # Try the original folder name for a chapter pattern.
-        if track.original_path:
-            for part in track.original_path.parts:
-                part_lower = part.lower().replace("_", " ").replace("-", " ").strip()
-                m = re.match(r"chapter\s*(\d{1,3})\s+(.+)", part_lower)
-                if m:
-                    return int(m.group(1)), m.group(2).strip()
+        original_path = track.original_path
+        if original_path:
+            for part in original_path.parts:
+                folder_info = _chapter_from_folder(part)
+                if folder_info:
+                    return folder_info
 
         # Reverse lookup by tape title via archive.org index
         tape_title = album
-        screw_prefix = re.match(
-            r"^dj\s*screw\s*[-–—:]\s*(.+)$",  # noqa: RUF001
-            album_lower,
-        )
+        screw_prefix = _SCREW_PREFIX_RE.match(album_lower)
         if screw_prefix:
             tape_title = screw_prefix.group(1).strip()
 
         if tape_title and self._archive_org:
-            chapter_num = self._archive_org.lookup_chapter_by_title(tape_title)
+            if tape_title in self._tape_chapters:
+                chapter_num = self._tape_chapters[tape_title]
+            else:
+                chapter_num = self._archive_org.lookup_chapter_by_title(tape_title)
+                self._tape_chapters[tape_title] = chapter_num
             if chapter_num is not None:
                 return chapter_num, tape_title
 
@@ -140,11 +242,19 @@ class DJScrewHandler:
 
     @staticmethod
     def _clean_chapter_title(raw_title: str) -> str:
-        """Clean up a chapter title extracted from a regex match."""
+        """Clean up a chapter title extracted from a regex match.
+
+        Drops a trailing "(1994)", then a trailing "bootleg", then unwraps a
+        fully parenthesized title.  Plain slicing: titles are short and most
+        have none of these, so regex substitutions were mostly wasted scans.
+        """
         title = raw_title.strip()
-        title = re.sub(r"\s*\(\d{4}\)\s*$", "", title).strip()
-        title = re.sub(r"\s*bootleg\s*$", "", title, flags=re.IGNORECASE).strip()
-        title = re.sub(r"^\((.+)\)$", r"\1", title)
+        if title[-6:-5] == "(" and title[-1:] == ")" and title[-5:-1].isdecimal():
+            title = title[:-6].rstrip()
+        if title[-7:].lower() == "bootleg":
+            title = title[:-7].rstrip()
+        if len(title) > 2 and title[0] == "(" and title[-1] == ")" and "\n" not in title:
+            title = title[1:-1]
         return title
 
     def normalize_screw_album(self, track: Track) -> None:
@@ -157,99 +267,61 @@ class DJScrewHandler:
         if not album_lower:
             return
 
-        sep = _CHAPTER_SEP
-
-        # 1. "Diary of the Originator: Chapter NNN - Title" or "D.O.T.O."
-        diary_chapter = re.match(
-            r"^(?:diary\s+of\s+the\s+originator|d\.?o\.?t\.?o\.?)\s*[:_]?\s*"
-            rf"chapter\s*(\d{{1,3}})\s*{sep}(.+)$",
-            album_lower,
-        )
-        if diary_chapter:
-            chapter_num = int(diary_chapter.group(1))
-            chapter_title = smart_title_case(self._clean_chapter_title(diary_chapter.group(2)))
-            track.album = DJ_SCREW_CHAPTER_FORMAT.format(
-                chapter=chapter_num,
-                title=chapter_title,
-            )
-            track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
-            logger.debug(
-                "Screw album normalized (legacy prefix): '%s' -> '%s'",
-                album_lower,
-                track.album,
-            )
+        canonical = self._canonical_screw_album(album_lower)
+        if canonical is None:
             return
 
-        # 2. "D.O.T.O. (Chapter NNN - Title) (Bootleg)"
-        doto_match = re.match(
-            r"^d\.?o\.?t\.?o\.?\s*[(\[]\s*chapter\s*(\d{1,3})\s*[-–—:.]\s*"  # noqa: RUF001
-            r"(.+?)\s*[)\]](?:\s*[(\[]?\s*bootleg\s*[)\]]?)?\s*$",
-            album_lower,
-        )
-        if doto_match:
-            chapter_num = int(doto_match.group(1))
-            chapter_title = smart_title_case(doto_match.group(2).strip())
-            track.album = DJ_SCREW_CHAPTER_FORMAT.format(
-                chapter=chapter_num,
-                title=chapter_title,
-            )
-            track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
+        track.album, pattern = canonical
+        track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                "Screw album normalized (D.O.T.O.): '%s' -> '%s'",
+                "Screw album normalized (%s): '%s' -> '%s'",
+                pattern,
                 album_lower,
                 track.album,
             )
-            return
 
-        # 3. "DJ Screw - Chapter NNN - Title" or "DJ Screw - Some Tape Name"
-        screw_prefix = re.match(
-            r"^dj\s*screw\s*[-–—:]\s*(.+)$",  # noqa: RUF001
-            album_lower,
-        )
-        if screw_prefix:
-            track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
-            inner = screw_prefix.group(1).strip()
-            inner_chapter = re.match(
-                rf"^chapter\s*(\d{{1,3}})\s*{sep}(.+?)(?:\s*bootleg)?\s*$",
-                inner,
-            )
+    @staticmethod
+    @functools.lru_cache(maxsize=SCREW_CHAPTER_CACHE_SIZE)
+    def _canonical_screw_album(album_lower: str) -> tuple[str, str] | None:
+        """Work out the canonical album for a DJ Screw album name.
+
+        Memoized: every track of a tape carries the same album.  The result is
+        interned, so tracks whose albums spell the same tape differently
+        still end up sharing one canonical string.
+
+        Args:
+            album_lower: Stripped, lowercased album name.
+
+        Returns:
+            ``(canonical_album, pattern)`` where ``pattern`` names the form
+            that matched (for logging), or None if it isn't a DJ Screw album.
+        """
+        m = _SCREW_ALBUM_RE.match(album_lower)
+        if m is None or m.lastgroup is None:
+            return None
+        form = m.lastgroup
+
+        if form == "screw":
+            inner = m["screw_inner"].strip()
+            inner_chapter = _SCREW_CHAPTER_RE.match(inner)
             if inner_chapter:
                 chapter_num = int(inner_chapter.group(1))
-                chapter_title = smart_title_case(self._clean_chapter_title(inner_chapter.group(2)))
-                track.album = DJ_SCREW_CHAPTER_FORMAT.format(
-                    chapter=chapter_num,
-                    title=chapter_title,
-                )
+                raw_title = inner_chapter.group(2)
             else:
                 tape_title = smart_title_case(inner)
-                tape_title = re.sub(r"\s*\(\d{4}\)\s*$", "", tape_title).strip()
-                track.album = f"DJ Screw - {tape_title}"
-            logger.debug(
-                "Screw album normalized (dj screw prefix): '%s' -> '%s'",
-                album_lower,
-                track.album,
-            )
-            return
-
-        # 4. "Chapter NNN - Title" (bare chapter, no prefix)
-        screw_chapter = re.match(
-            rf"^chapter\s*(\d{{1,3}})\s*{sep}(.+?)(?:\s*bootleg)?\s*$",
-            album_lower,
-        )
-        if screw_chapter:
-            chapter_num = int(screw_chapter.group(1))
-            chapter_title = smart_title_case(self._clean_chapter_title(screw_chapter.group(2)))
-            track.album = DJ_SCREW_CHAPTER_FORMAT.format(
-                chapter=chapter_num,
-                title=chapter_title,
-            )
-            track.album_artist = DIARY_OF_THE_ORIGINATOR_ALBUM_ARTIST
-            logger.debug(
-                "Screw album normalized (chapter): '%s' -> '%s'",
-                album_lower,
-                track.album,
-            )
-            return
+                tape_title = _YEAR_SUFFIX_RE.sub("", tape_title).strip()
+                return sys.intern(f"DJ Screw - {tape_title}"), _SCREW_ALBUM_FORMS[form]
+        else:
+            chapter_num = int(m[f"{form}_num"])
+            raw_title = m[f"{form}_title"]
+
+        if form == "doto":
+            chapter_title = smart_title_case(raw_title.strip())
+        else:
+            chapter_title = smart_title_case(DJScrewHandler._clean_chapter_title(raw_title))
+        album = DJ_SCREW_CHAPTER_FORMAT.format(chapter=chapter_num, title=chapter_title)
+        return sys.intern(album), _SCREW_ALBUM_FORMS[form]
 
     # ------------------------------------------------------------------
     # Track-level matching against archive.org candidates
@@ -272,55 +344,44 @@ class DJScrewHandler:
         if not track_title and not track_artist:
             return None
 
-        best: MatchCandidate | None = None
-        best_score = 0.0
-
-        for candidate in candidates:
-            cand_title = (candidate.title or "").strip().lower()
-            cand_artist = (candidate.artist or "").strip().lower()
-
-            title_sim = self._fuzzy.similarity(track_title, cand_title)
-            artist_sim = self._fuzzy.similarity(track_artist, cand_artist) if track_artist else 50.0
-
-            dur_sim = 50.0
-            if track_duration and candidate.duration:
-                diff = abs(track_duration - candidate.duration)
-                if diff <= 2.0:
-                    dur_sim = 100.0
-                elif diff <= 10.0:
-                    dur_sim = 80.0
-                elif diff <= 30.0:
-                    dur_sim = 50.0
-                else:
-                    dur_sim = 10.0
-
-            track_num_bonus = 0.0
-            if (
-                track.track_number
-                and candidate.track_number
-                and track.track_number == candidate.track_number
-            ):
-                track_num_bonus = 15.0
-
-            score = (title_sim * 0.5) + (artist_sim * 0.2) + (dur_sim * 0.2) + track_num_bonus
-
-            if score > best_score:
-                best_score = score
-                best = candidate
+        # Score column by column: each field for every candidate, then combine.
+        # similarity_many runs each rapidfuzz scorer over the whole column in C.
+        title_sims = self._fuzzy.similarity_many(track_title, [c.title for c in candidates])
+        if track_artist:
+            artist_sims = self._fuzzy.similarity_many(track_artist, [c.artist for c in candidates])
+        else:
+            artist_sims = [50.0] * len(candidates)
+        track_number = track.track_number
+
+        scores = [
+            (title_sim * 0.5)
+            + (artist_sim * 0.2)
+            + (_duration_similarity(track_duration, candidate.duration) * 0.2)
+            + (15.0 if track_number and candidate.track_number == track_number else 0.0)
+            for candidate, title_sim, artist_sim in zip(
+                candidates, title_sims, artist_sims, strict=True
+            )
+        ]
+
+        # First candidate with the top score, as long as it scored at all
+        best_score = max(scores, default=0.0)
+        best = candidates[scores.index(best_score)] if best_score > 0 else None
 
         if best and best_score >= 45.0:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Track-level match: '%s' -> '%s - %s' (score=%.1f)",
+                    track_title,
+                    best.artist,
+                    best.title,
+                    best_score,
+                )
+            return best
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                "Track-level match: '%s' -> '%s - %s' (score=%.1f)",
+                "No track-level match for '%s' (best_score=%.1f)",
                 track_title,
-                best.artist,
-                best.title,
                 best_score,
             )
-            return best
-
-        logger.debug(
-            "No track-level match for '%s' (best_score=%.1f)",
-            track_title,
-            best_score,
-        )
         return None
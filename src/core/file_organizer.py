@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import re
+import string
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,6 +29,33 @@ if TYPE_CHECKING:
 
 logger = get_logger("core.file_organizer")
 
+# Fields each naming template is formatted with
+_FOLDER_TEMPLATE_FIELDS = frozenset({"artist", "album", "year", "disc"})
+_FILE_TEMPLATE_FIELDS = frozenset({"track", "title", "disc"})
+# Start of a field's attribute/index access: "artist.upper", "title[0]"
+_FIELD_ACCESS_RE = re.compile(r"[.\[]")
+
+
+def _template_is_valid(template: str, fields: frozenset[str]) -> bool:
+    """Check that a naming template parses and only names known fields.
+
+    Format specs are checked too, since they may nest fields
+    (``"{track:0{width}d}"``).  Positional fields (``"{}"``, ``"{0}"``) are
+    rejected: templates are always formatted by keyword.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return False
+    for _literal, name, spec, _conversion in parsed:
+        if name is None:
+            continue
+        if _FIELD_ACCESS_RE.split(name, maxsplit=1)[0] not in fields:
+            return False
+        if spec and not _template_is_valid(spec, fields):
+            return False
+    return True
+
 
 class FileOrganizer:
     """Organizes audio files into a clean directory structure.
@@ -74,10 +104,26 @@ class FileOrganizer:
                 to the *would-be* destination so callers can preview results.
         """
         self._library_path = Path(library_path)
+        # Resolved once: every directory cleanup compares against it
+        self._library_resolved = self._library_path.resolve()
         self._backup_path = Path(backup_path) if backup_path else self._library_path / "_Backups"
         self._keep_originals = keep_originals
         self._folder_template = folder_template
         self._file_template = file_template
+        # Checked once here, so a broken template falls back to the default
+        # naming without a failed format() and a warning on every track
+        self._folder_template_ok = _template_is_valid(folder_template, _FOLDER_TEMPLATE_FIELDS)
+        self._file_template_ok = _template_is_valid(file_template, _FILE_TEMPLATE_FIELDS)
+        if not self._folder_template_ok:
+            logger.warning(
+                "Folder template '%s' is invalid. Using default structure. Check your config.",
+                folder_template,
+            )
+        if not self._file_template_ok:
+            logger.warning(
+                "File template '%s' is invalid. Using default naming. Check your config.",
+                file_template,
+            )
         self._singles_folder = singles_folder
         self._unmatched_folder = unmatched_folder
         self._move_repo = move_repo
@@ -148,25 +194,27 @@ class FileOrganizer:
         # Determine destination
         dest = self._build_destination(track)
 
-        # If the file is already at its correct destination, skip entirely.
-        # This prevents re-running a scan from creating "(1)" copies.
-        if not self._dry_run:
-            try:
-                if dest.resolve() == track.file_path.resolve():
-                    logger.info("Already organized, skipping: %s", track.file_path.name)
-                    return track
-            except OSError:
-                pass
-
         # --- Dry-run: report the move without touching the filesystem ---
         if self._dry_run:
             logger.info("[DRY RUN] Would organize: %s -> %s", track.file_path.name, dest)
             track.file_path = dest
             return track
 
+        # If the file is already at its correct destination, skip entirely.
+        # This prevents re-running a scan from creating "(1)" copies.
+        # Equal paths (case-insensitively on Windows) need no realpath walk,
+        # and a destination that doesn't exist can't be the source file.
+        resolved = track.file_path.resolve()
+        dest_exists = dest.exists()
+        try:
+            if dest == track.file_path or (dest_exists and dest.resolve() == resolved):
+                logger.info("Already organized, skipping: %s", track.file_path.name)
+                return track
+        except OSError:
+            pass
+
         # Reuse a pre-existing backup (created by backup_before_changes),
         # or create one now if none exists yet.
-        resolved = track.file_path.resolve()
         backup_dest = self._pre_backups.pop(resolved, None)
         if backup_dest is None and self._keep_originals:
             backup_dest = self._backup_file(track)
@@ -174,7 +222,7 @@ class FileOrganizer:
         # Check for duplicate: if the exact destination already exists, this is
         # likely a duplicate file being organized to the same slot. Skip it
         # instead of creating a "(1)" copy.
-        if dest.exists() and dest != track.file_path:
+        if dest_exists and dest != track.file_path:
             logger.warning(
                 "Duplicate detected: '%s' would overwrite existing '%s'. "
                 "Skipping -- the file already exists in the library.",
@@ -283,28 +331,35 @@ class FileOrganizer:
 
         # Determine if this is a compilation
         is_comp = track.is_compilation
-        album_artist = sanitize_filename(track.album_artist) if track.album_artist else None
+        album_artist_tag = track.album_artist
+        album_artist = sanitize_filename(album_artist_tag) if album_artist_tag else None
 
         # For compilations, the folder uses album_artist (e.g. "DJ Screw" or "Various Artists")
         # and the filename includes the track artist
         folder_artist = album_artist if is_comp and album_artist else artist
 
         # Determine folder path
-        if track.album and track.album.lower() not in ("", "unknown album"):
+        album_tag = track.album
+        if album_tag and album_tag.lower() != "unknown album":
             # Full album track
-            try:
-                folder = self._folder_template.format(
-                    artist=folder_artist,
-                    album=album,
-                    year=year,
-                    disc=disc_num,
-                )
-            except (KeyError, ValueError) as e:
-                logger.warning(
-                    "Folder template '%s' failed (%s). Using default structure. Check your config.",
-                    self._folder_template,
-                    e,
-                )
+            folder = None
+            if self._folder_template_ok:
+                try:
+                    folder = self._folder_template.format(
+                        artist=folder_artist,
+                        album=album,
+                        year=year,
+                        disc=disc_num,
+                    )
+                except (KeyError, ValueError) as e:
+                    # Value-dependent, e.g. "{year:04d}" with "Unknown Year"
+                    logger.warning(
+                        "Folder template '%s' failed (%s). Using default structure. "
+                        "Check your config.",
+                        self._folder_template,
+                        e,
+                    )
+            if folder is None:
                 folder = f"{folder_artist}/{album} ({year})"
 
             # Multi-disc album: add a "Disc N" subfolder when the album has
@@ -326,18 +381,21 @@ class FileOrganizer:
             else:
                 filename = f"{title} - {artist}"
         elif track_num > 0:
-            try:
-                filename = self._file_template.format(
-                    track=track_num,
-                    title=title,
-                    disc=disc_num,
-                )
-            except (KeyError, ValueError) as e:
-                logger.warning(
-                    "File template '%s' failed (%s). Using default naming. Check your config.",
-                    self._file_template,
-                    e,
-                )
+            filename = None
+            if self._file_template_ok:
+                try:
+                    filename = self._file_template.format(
+                        track=track_num,
+                        title=title,
+                        disc=disc_num,
+                    )
+                except (KeyError, ValueError) as e:
+                    logger.warning(
+                        "File template '%s' failed (%s). Using default naming. Check your config.",
+                        self._file_template,
+                        e,
+                    )
+            if filename is None:
                 filename = f"{track_num:02d} - {title}"
         else:
             filename = title
@@ -510,16 +568,18 @@ class FileOrganizer:
         Returns:
             True if the directory has no meaningful contents.
         """
-        junk_found: list[Path] = []
-        for child in directory.iterdir():
-            if child.name.lower() in self._JUNK_FILENAMES:
-                junk_found.append(child)
-            else:
-                return False  # Has a real file or subdirectory
+        # scandir yields plain names, with no Path built per child
+        junk_found: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower() in self._JUNK_FILENAMES:
+                    junk_found.append(entry.path)
+                else:
+                    return False  # Has a real file or subdirectory
         # Only junk files remain -- delete them
         for junk in junk_found:
             try:
-                junk.unlink()
+                os.unlink(junk)
                 logger.debug("Removed junk file: %s", junk)
             except OSError:
                 return False
@@ -548,10 +608,10 @@ class FileOrganizer:
             stop_at: Optional boundary directory that should NOT be deleted.
                      Defaults to the library root.
         """
-        boundary = (stop_at or self._library_path).resolve()
+        boundary = stop_at.resolve() if stop_at else self._library_resolved
+        library_resolved = self._library_resolved
         try:
             current = directory.resolve()
-            library_resolved = self._library_path.resolve()
 
             # Safety check: refuse to clean up anything outside the library.
             # This prevents deleting the user's source directories.
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import contextlib
 import hashlib
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import acoustid
 
-from src.utils.constants import DEFAULT_MAX_CONCURRENT_FINGERPRINTS, MUSICBRAINZ_RATE_LIMIT
+from src.utils.constants import (
+    DEFAULT_MAX_CONCURRENT_FINGERPRINTS,
+    MUSICBRAINZ_RATE_LIMIT,
+    ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS,
+)
 from src.utils.logger import get_logger
 from src.utils.rate_limiter import rate_limiter
 
@@ -22,6 +28,47 @@ if TYPE_CHECKING:
 logger = get_logger("core.fingerprinter")
 
 
+def _is_rotational(path: Path) -> bool:
+    """Best-effort check whether *path* lives on a spinning disk.
+
+    Reads ``/sys/dev/block/<major>:<minor>/queue/rotational`` for the
+    device holding the file (Linux only).  Anything that can't be
+    determined -- other platforms, network shares, missing files -- is
+    treated as non-rotational.
+
+    Args:
+        path: A file on the storage device to inspect.
+
+    Returns:
+        True only if the kernel reports the device as rotational.
+    """
+    try:
+        dev = os.stat(path).st_dev
+        block = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}").resolve()
+    except (OSError, AttributeError):  # AttributeError: no os.major on Windows
+        return False
+    # Partitions have no queue/ directory of their own; their parent disk does.
+    for device in (block, block.parent):
+        with contextlib.suppress(OSError):
+            return (device / "queue" / "rotational").read_text().strip() == "1"
+    return False
+
+
+def default_fingerprint_workers(tracks: list[Track]) -> int:
+    """Pick a fingerprint worker count suited to the storage holding *tracks*.
+
+    Args:
+        tracks: Tracks about to be fingerprinted (the first one is probed).
+
+    Returns:
+        ``ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS`` for spinning disks,
+        otherwise ``DEFAULT_MAX_CONCURRENT_FINGERPRINTS``.
+    """
+    if tracks and _is_rotational(tracks[0].file_path):
+        return ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS
+    return DEFAULT_MAX_CONCURRENT_FINGERPRINTS
+
+
 class Fingerprinter:
     """Generates audio fingerprints and looks up AcoustID matches.
 
@@ -213,8 +260,8 @@ class Fingerprinter:
         Args:
             tracks: Tracks to fingerprint.
             max_workers: Number of parallel workers.  Defaults to
-                ``DEFAULT_MAX_CONCURRENT_FINGERPRINTS`` (auto-detected
-                from CPU core count).
+                ``default_fingerprint_workers(tracks)``: one worker on a
+                spinning disk, otherwise half the usable CPU cores.
             progress_callback: Optional ``(completed, total, track)``
                 callback invoked after each track finishes.
             cancel_check: Optional callable that returns ``True`` when
@@ -225,8 +272,8 @@ class Fingerprinter:
         Returns:
             The same list of Track objects with fingerprints populated.
         """
-        if max_workers is None:
-            max_workers = DEFAULT_MAX_CONCURRENT_FINGERPRINTS
+        if not max_workers:
+            max_workers = default_fingerprint_workers(tracks)
 
         total = len(tracks)
         if total == 0:
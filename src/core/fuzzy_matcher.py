@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from rapidfuzz import fuzz, process
@@ -10,16 +11,40 @@ from src.utils.constants import (
     DURATION_FALLOFF_MAX_SECONDS,
     DURATION_TOLERANCE_SECONDS,
     FUZZY_MATCH_THRESHOLD,
+    FUZZY_SIMILARITY_CACHE_SIZE,
 )
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from src.models.match_result import MatchCandidate
     from src.models.track import Track
 
 logger = get_logger("core.fuzzy_matcher")
 
 
+@functools.lru_cache(maxsize=FUZZY_SIMILARITY_CACHE_SIZE)
+def _weighted_similarity(a: str, b: str) -> float:
+    """Weighted fuzzy score for two already-normalized strings (memoized).
+
+    The same pairs come up again and again: duplicate files re-score the
+    same candidates, and every track on an album compares the same album
+    names.
+    """
+    if a == b:
+        return 100.0
+
+    # Weighted combination of different fuzzy methods
+    ratio = fuzz.ratio(a, b)
+    partial = fuzz.partial_ratio(a, b)
+    token_sort = fuzz.token_sort_ratio(a, b)
+
+    # Weight: token_sort handles word reordering, partial handles substrings,
+    # ratio is the strict baseline
+    return (ratio * 0.4) + (partial * 0.3) + (token_sort * 0.3)
+
+
 class FuzzyMatcher:
     """Provides fuzzy string matching for correcting misspelled tags
     and comparing metadata between track info and API results.
@@ -50,21 +75,47 @@ class FuzzyMatcher:
         if not str_a or not str_b:
             return 0.0
 
-        a = str_a.strip().lower()
-        b = str_b.strip().lower()
+        return _weighted_similarity(str_a.strip().lower(), str_b.strip().lower())
 
-        if a == b:
-            return 100.0
+    def similarity_many(self, query: str | None, choices: Sequence[str | None]) -> list[float]:
+        """Score one string against many, equivalent to ``similarity`` per choice.
+
+        Each of the three rapidfuzz scorers runs once over all choices in C
+        (``process.extract``) instead of once per pair from Python, and the
+        query is normalized only once.
 
-        # Weighted combination of different fuzzy methods
-        ratio = fuzz.ratio(a, b)
-        partial = fuzz.partial_ratio(a, b)
-        token_sort = fuzz.token_sort_ratio(a, b)
+        Args:
+            query: String to compare.
+            choices: Strings to compare against.
 
-        # Weight: token_sort handles word reordering, partial handles substrings,
-        # ratio is the strict baseline
-        score = (ratio * 0.4) + (partial * 0.3) + (token_sort * 0.3)
-        return score
+        Returns:
+            Similarity scores (0.0 - 100.0), in the same order as ``choices``.
+        """
+        scores = [0.0] * len(choices)
+        if not query or not choices:
+            return scores
+
+        a = query.strip().lower()
+        normalized = [c.strip().lower() if c else "" for c in choices]
+
+        def _run(scorer: Callable[..., float]) -> list[float]:
+            out = [0.0] * len(normalized)
+            for _choice, score, idx in process.extract(a, normalized, scorer=scorer, limit=None):
+                out[idx] = score
+            return out
+
+        ratios = _run(fuzz.ratio)
+        partials = _run(fuzz.partial_ratio)
+        token_sorts = _run(fuzz.token_sort_ratio)
+
+        for i, (raw, b) in enumerate(zip(choices, normalized, strict=True)):
+            if not raw:
+                continue
+            if a == b:
+                scores[i] = 100.0
+            else:
+                scores[i] = (ratios[i] * 0.4) + (partials[i] * 0.3) + (token_sorts[i] * 0.3)
+        return scores
 
     def is_match(self, str_a: str | None, str_b: str | None) -> bool:
         """Check if two strings are a fuzzy match above the threshold.
@@ -142,24 +193,34 @@ class FuzzyMatcher:
         scores["album"] = self.similarity(track.album, candidate.album)
 
         # Duration comparison
-        if track.duration is not None and candidate.duration is not None:
-            diff = abs(track.duration - candidate.duration)
-            if diff <= DURATION_TOLERANCE_SECONDS:
-                scores["duration"] = 100.0
-            elif diff <= DURATION_FALLOFF_MAX_SECONDS:
-                # Linear falloff from 100 to 0 between tolerance and max
-                falloff_range = DURATION_FALLOFF_MAX_SECONDS - DURATION_TOLERANCE_SECONDS
-                scores["duration"] = max(
-                    0.0, 100.0 * (1.0 - (diff - DURATION_TOLERANCE_SECONDS) / falloff_range)
-                )
-            else:
-                scores["duration"] = 0.0
-        else:
-            # If we can't compare duration, give a neutral score
-            scores["duration"] = 50.0
+        scores["duration"] = self.duration_similarity(track.duration, candidate.duration)
 
         return scores
 
+    def duration_similarity(self, duration_a: float | None, duration_b: float | None) -> float:
+        """Score how closely two durations agree (0.0 - 100.0).
+
+        Args:
+            duration_a: First duration in seconds.
+            duration_b: Second duration in seconds.
+
+        Returns:
+            100.0 within tolerance, a linear falloff up to the maximum
+            difference, then 0.0. 50.0 (neutral) if either is unknown.
+        """
+        if duration_a is None or duration_b is None:
+            # If we can't compare duration, give a neutral score
+            return 50.0
+
+        diff = abs(duration_a - duration_b)
+        if diff <= DURATION_TOLERANCE_SECONDS:
+            return 100.0
+        if diff <= DURATION_FALLOFF_MAX_SECONDS:
+            # Linear falloff from 100 to 0 between tolerance and max
+            falloff_range = DURATION_FALLOFF_MAX_SECONDS - DURATION_TOLERANCE_SECONDS
+            return max(0.0, 100.0 * (1.0 - (diff - DURATION_TOLERANCE_SECONDS) / falloff_range))
+        return 0.0
+
     def clean_tag(self, value: str | None) -> str | None:
         """Clean up a tag value by removing common noise.
 
@@ -107,6 +107,10 @@ class MetadataFetcher:
         self._api_cache = api_cache
         # Per-release cover art cache: release_id -> bytes | None
         self._cover_art_cache: dict[str, bytes | None] = {}
+        # Per-run search response cache: search cache key -> raw response.
+        # Raw responses (not candidates) are kept because callers mutate the
+        # candidates they get back (scores, confidence).
+        self._search_results: dict[str, dict] = {}
 
         # Persistent HTTP session -- reuses TCP/TLS connections across requests
         # to Discogs and Cover Art Archive, saving ~100-200ms per request.
@@ -268,6 +272,35 @@ class MetadataFetcher:
         h = hashlib.sha256(raw.encode()).hexdigest()[:16]
         return f"{prefix}:{h}"
 
+    def _get_cached_search(self, cache_key: str) -> dict | None:
+        """Look up a raw search response in the per-run cache, then the API cache.
+
+        Args:
+            cache_key: Key from ``_search_cache_key``.
+
+        Returns:
+            The cached response dict, or None on a miss.
+        """
+        cached = self._search_results.get(cache_key)
+        if cached is not None:
+            logger.debug("Search cache hit: %s", cache_key)
+            return cached
+
+        if self._api_cache is not None:
+            stored = self._api_cache.get(cache_key)
+            if stored is not None and isinstance(stored, dict):
+                logger.debug("API cache hit: %s", cache_key)
+                self._search_results[cache_key] = stored
+                return stored
+        return None
+
+    def _store_search(self, cache_key: str, result: dict) -> None:
+        """Remember a raw search response for this run and across runs."""
+        self._search_results[cache_key] = result
+        if self._api_cache is not None:
+            with contextlib.suppress(Exception):
+                self._api_cache.put(cache_key, result)
+
     def search_musicbrainz(
         self,
         title: str | None = None,
@@ -295,11 +328,9 @@ class MetadataFetcher:
 
         # --- Cache check ---
         cache_key = self._search_cache_key("mb_search", title, artist, album)
-        if self._api_cache is not None:
-            cached = self._api_cache.get(cache_key)
-            if cached is not None and isinstance(cached, dict):
-                logger.debug("API cache hit: %s", cache_key)
-                return self._parse_mb_search_results(cached)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return self._parse_mb_search_results(cached)
 
         try:
             # Build keyword arguments -- musicbrainzngs handles query
@@ -320,11 +351,7 @@ class MetadataFetcher:
             if result is None:
                 return []
 
-            # --- Cache store ---
-            if self._api_cache is not None:
-                with contextlib.suppress(Exception):
-                    self._api_cache.put(cache_key, result)
-
+            self._store_search(cache_key, result)
             return self._parse_mb_search_results(result)
 
         except musicbrainzngs.ResponseError as e:
@@ -409,11 +436,9 @@ class MetadataFetcher:
 
         # --- Cache check ---
         cache_key = self._search_cache_key("discogs_search", title, artist, album)
-        if self._api_cache is not None:
-            cached = self._api_cache.get(cache_key)
-            if cached is not None and isinstance(cached, dict):
-                logger.debug("API cache hit: %s", cache_key)
-                return self._parse_discogs_results(cached, title)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return self._parse_discogs_results(cached, title)
 
         try:
             rate_limiter.wait("discogs", _DISCOGS_RATE)
@@ -437,11 +462,7 @@ class MetadataFetcher:
             response.raise_for_status()
             data = response.json()
 
-            # --- Cache store ---
-            if self._api_cache is not None:
-                with contextlib.suppress(Exception):
-                    self._api_cache.put(cache_key, data)
-
+            self._store_search(cache_key, data)
             return self._parse_discogs_results(data, title)
 
         except requests.RequestException as e:
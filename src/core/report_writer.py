@@ -61,7 +61,7 @@ class ReportWriter:
             },
             "unmatched": [
                 {
-                    "file_path": str(t.file_path),
+                    "file_path": t.path_str,
                     "original_path": str(t.original_path) if t.original_path else None,
                     "title": t.title,
                     "artist": t.artist,
@@ -74,7 +74,7 @@ class ReportWriter:
             ],
             "needs_review": [
                 {
-                    "file_path": str(t.file_path),
+                    "file_path": t.path_str,
                     "original_path": str(t.original_path) if t.original_path else None,
                     "title": t.title,
                     "artist": t.artist,
@@ -87,7 +87,7 @@ class ReportWriter:
             ],
             "errors": [
                 {
-                    "file_path": str(t.file_path),
+                    "file_path": t.path_str,
                     "error": t.error_message,
                 }
                 for t in error_tracks
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.models.processing_state import ProcessingState
 from src.models.track import Track
+from src.utils.constants import SUPPORTED_EXTENSIONS
 from src.utils.file_utils import get_file_size_mb, is_audio_file
 from src.utils.logger import get_logger
 
@@ -153,18 +155,35 @@ class FileScanner:
     def _discover_audio_files(self, root: Path) -> Generator[Path, None, None]:
         """Recursively discover audio files under a root directory.
 
+        Walks the tree with ``os.scandir`` so file/directory checks use the
+        type cached in each directory entry instead of a ``stat`` per path,
+        and filters by extension before anything is sorted.  Symlinked
+        directories are not followed (same as ``Path.rglob``).
+
         Args:
             root: Directory to search.
 
         Yields:
-            Paths to audio files.
+            Paths to audio files, in sorted order.
         """
-        try:
-            for entry in sorted(root.rglob("*")):
-                if entry.is_file() and is_audio_file(entry):
-                    yield entry
-        except PermissionError as e:
-            logger.warning("Permission denied during scan: %s", e)
+        found: list[Path] = []
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        elif (
+                            os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                            and entry.is_file()
+                        ):
+                            found.append(Path(entry.path))
+            except PermissionError as e:
+                logger.warning("Permission denied during scan: %s", e)
+
+        yield from sorted(found)
 
     def _create_track(self, file_path: Path) -> Track:
         """Create a Track object from a file path.
@@ -94,6 +94,12 @@ class TagEditor:
             track.disc_number = self._parse_track_number(raw_discnumber)
             track.total_discs = self._parse_total_from_tag(raw_discnumber) or track.total_discs
 
+            # Recording MBID written by Picard & co. (UFID on ID3, MUSICBRAINZ_TRACKID
+            # on Vorbis, the iTunes freeform atom on MP4 -- easy mode maps them all)
+            track.musicbrainz_recording_id = (
+                self._get_tag(audio, "musicbrainz_trackid") or track.musicbrainz_recording_id
+            )
+
             logger.debug("Read tags for: %s -> %s - %s", path.name, track.artist, track.title)
 
         except (mutagen.MutagenError, OSError, ValueError) as e:
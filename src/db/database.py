@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
 from src.utils.constants import DEFAULT_DB_FILENAME
@@ -10,7 +11,7 @@ from src.utils.logger import get_logger
 
 logger = get_logger("db.database")
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 4
 
 CREATE_TABLES_SQL = """
 -- Tracks: stores all known audio files and their metadata
@@ -38,6 +39,7 @@ CREATE TABLE IF NOT EXISTS tracks (
     file_size_mb REAL,
     bitrate INTEGER,
     sample_rate INTEGER,
+    is_compilation INTEGER NOT NULL DEFAULT 0,
     state TEXT NOT NULL DEFAULT 'pending',
     confidence REAL DEFAULT 0.0,
     error_message TEXT,
@@ -116,6 +118,8 @@ class Database:
         """
         self._db_path = Path(db_path) if db_path else Path(DEFAULT_DB_FILENAME)
         self._connection: sqlite3.Connection | None = None
+        # Held by the repositories for each write transaction (see connect())
+        self._lock = threading.RLock()
 
     def connect(self) -> sqlite3.Connection:
         """Open a connection to the database and ensure schema is created.
@@ -128,10 +132,11 @@ class Database:
 
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # check_same_thread=False is safe here because:
-        # 1. WAL mode allows concurrent readers + one writer
-        # 2. Write operations (save, cache put) are serialized per-track
-        # 3. The GUI worker (QThread) needs to share the connection
+        # check_same_thread=False: the GUI worker (QThread) and the lookup
+        # pool threads share this connection.  A connection has a single
+        # transaction, so every repository write runs its whole transaction
+        # (execute through commit/rollback) while holding ``self.lock``;
+        # no repository leaves a transaction open between calls.
         self._connection = sqlite3.connect(
             str(self._db_path),
             detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
@@ -139,6 +144,10 @@ class Database:
         )
         self._connection.row_factory = sqlite3.Row
         self._connection.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only fsyncs at checkpoints, not on every commit.
+        # The database stays consistent; a power cut can lose at most the
+        # last few commits, which resume-on-restart simply redoes.
+        self._connection.execute("PRAGMA synchronous=NORMAL")
         self._connection.execute("PRAGMA foreign_keys=ON")
 
         self._ensure_schema()
@@ -159,6 +168,14 @@ class Database:
             return self.connect()
         return self._connection
 
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock serializing write transactions on the shared connection.
+
+        Pass it to every repository built on ``connection``.
+        """
+        return self._lock
+
     def _ensure_schema(self) -> None:
         """Create tables if they don't exist and run migrations if needed."""
         conn = self._connection
@@ -222,6 +239,10 @@ class Database:
             """)
             logger.info("Migration v2->v3: created api_cache table")
 
+        if from_version < 4:
+            conn.execute("ALTER TABLE tracks ADD COLUMN is_compilation INTEGER NOT NULL DEFAULT 0")
+            logger.info("Migration v3->v4: added tracks.is_compilation column")
+
         conn.execute("UPDATE schema_version SET version = ?", (to_version,))
         conn.commit()
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, cast
 
 from src.models.processing_state import ProcessingState
 from src.models.track import Track
+from src.utils.constants import API_CACHE_COMPRESS_LEVEL, API_CACHE_COMPRESS_MIN_BYTES
 from src.utils.logger import get_logger
 
 logger = get_logger("db.repositories")
@@ -60,13 +63,16 @@ class TrackRepository:
         }
     )
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock | None = None) -> None:
         """Initialize with an active database connection.
 
         Args:
             connection: SQLite connection (with Row factory enabled).
+            lock: The connection's write lock (``Database.lock``), shared by
+                every repository on the connection.
         """
         self._conn = connection
+        self._lock = lock or threading.RLock()
 
     def save(self, track: Track) -> int:
         """Insert or update a track in the database.
@@ -80,6 +86,29 @@ class TrackRepository:
         Raises:
             ValueError: If as_dict() contains keys not in the column whitelist.
         """
+        with self._lock:
+            track_id = self._write(track)
+            self._conn.commit()
+        return track_id
+
+    def save_batch(self, tracks: list[Track]) -> None:
+        """Save multiple tracks in a single transaction.
+
+        Args:
+            tracks: List of tracks to save.
+        """
+        with self._lock:
+            try:
+                for track in tracks:
+                    self._write(track)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.error("Batch save failed: %s", e)
+                raise
+
+    def _write(self, track: Track) -> int:
+        """Insert or update a track without committing; callers hold the lock."""
         data = track.as_dict()
 
         # Validate column names against the whitelist
@@ -95,7 +124,6 @@ class TrackRepository:
                 f"UPDATE tracks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 values,
             )
-            self._conn.commit()
             return track.id
 
         # Check if a row with this file_path already exists (resume scenario)
@@ -111,7 +139,6 @@ class TrackRepository:
                     f"UPDATE tracks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                     values,
                 )
-                self._conn.commit()
                 return track.id
 
         # Insert new
@@ -121,24 +148,9 @@ class TrackRepository:
             f"INSERT INTO tracks ({columns}) VALUES ({placeholders})",
             list(data.values()),
         )
-        self._conn.commit()
         track.id = cursor.lastrowid or 0
         return track.id
 
-    def save_batch(self, tracks: list[Track]) -> None:
-        """Save multiple tracks in a single transaction.
-
-        Args:
-            tracks: List of tracks to save.
-        """
-        try:
-            for track in tracks:
-                self.save(track)
-        except sqlite3.Error as e:
-            self._conn.rollback()
-            logger.error("Batch save failed: %s", e)
-            raise
-
     def get_by_id(self, track_id: int) -> Track | None:
         """Retrieve a track by its database ID.
 
@@ -211,11 +223,12 @@ class TrackRepository:
         Returns:
             True if a row was deleted.
         """
-        cursor = self._conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
+            self._conn.commit()
         return cursor.rowcount > 0
 
-    def get_processed_paths(self) -> set[str]:
+    def get_processed_paths(self) -> frozenset[str]:
         """Return the set of file paths that have already been processed.
 
         A track is considered "processed" if its state is a terminal state
@@ -223,14 +236,14 @@ class TrackRepository:
         the batch processor skip them on resume.
 
         Returns:
-            Set of file_path strings for already-processed tracks.
+            Frozen set of file_path strings for already-processed tracks.
         """
         placeholders = ", ".join("?" for _ in _TERMINAL_STATES)
         cursor = self._conn.execute(
             f"SELECT file_path FROM tracks WHERE state IN ({placeholders})",
             tuple(_TERMINAL_STATES),
         )
-        return {row["file_path"] for row in cursor.fetchall()}
+        return frozenset(row["file_path"] for row in cursor)
 
     def _row_to_track(self, row: sqlite3.Row) -> Track:
         """Convert a database row to a Track object.
@@ -263,6 +276,7 @@ class TrackRepository:
             file_size_mb=row["file_size_mb"] or 0.0,
             bitrate=row["bitrate"],
             sample_rate=row["sample_rate"],
+            is_compilation=bool(row["is_compilation"]),
             state=ProcessingState(row["state"]),
             confidence=row["confidence"] or 0.0,
             original_path=Path(row["original_path"]) if row["original_path"] else None,
@@ -275,13 +289,16 @@ class TrackRepository:
 class HistoryRepository:
     """Data access layer for change history (supports rollback)."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock | None = None) -> None:
         """Initialize with an active database connection.
 
         Args:
             connection: SQLite connection.
+            lock: The connection's write lock (``Database.lock``), shared by
+                every repository on the connection.
         """
         self._conn = connection
+        self._lock = lock or threading.RLock()
 
     def record_change(
         self,
@@ -303,12 +320,13 @@ class HistoryRepository:
         Returns:
             History entry ID.
         """
-        cursor = self._conn.execute(
-            """INSERT INTO history (track_id, action, field_name, old_value, new_value)
-               VALUES (?, ?, ?, ?, ?)""",
-            (track_id, action, field_name, old_value, new_value),
-        )
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                """INSERT INTO history (track_id, action, field_name, old_value, new_value)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (track_id, action, field_name, old_value, new_value),
+            )
+            self._conn.commit()
         return cursor.lastrowid or 0
 
     def get_history_for_track(self, track_id: int) -> list[dict[str, Any]]:
@@ -345,13 +363,16 @@ class HistoryRepository:
 class MoveHistoryRepository:
     """Data access layer for file move history (supports rollback across restarts)."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock | None = None) -> None:
         """Initialize with an active database connection.
 
         Args:
             connection: SQLite connection.
+            lock: The connection's write lock (``Database.lock``), shared by
+                every repository on the connection.
         """
         self._conn = connection
+        self._lock = lock or threading.RLock()
 
     def record_move(
         self,
@@ -369,12 +390,13 @@ class MoveHistoryRepository:
         Returns:
             Move history entry ID.
         """
-        cursor = self._conn.execute(
-            """INSERT INTO move_history (original_path, current_path, backup_path)
-               VALUES (?, ?, ?)""",
-            (original_path, current_path, backup_path),
-        )
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                """INSERT INTO move_history (original_path, current_path, backup_path)
+                   VALUES (?, ?, ?)""",
+                (original_path, current_path, backup_path),
+            )
+            self._conn.commit()
         return cursor.lastrowid or 0
 
     def get_all(self) -> list[dict[str, Any]]:
@@ -411,8 +433,9 @@ class MoveHistoryRepository:
         Returns:
             True if a row was deleted.
         """
-        cursor = self._conn.execute("DELETE FROM move_history WHERE id = ?", (entry_id,))
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM move_history WHERE id = ?", (entry_id,))
+            self._conn.commit()
         return cursor.rowcount > 0
 
     def remove_by_current_path(self, current_path: str) -> bool:
@@ -424,24 +447,28 @@ class MoveHistoryRepository:
         Returns:
             True if a row was deleted.
         """
-        cursor = self._conn.execute(
-            "DELETE FROM move_history WHERE current_path = ?",
-            (current_path,),
-        )
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM move_history WHERE current_path = ?",
+                (current_path,),
+            )
+            self._conn.commit()
         return cursor.rowcount > 0
 
 
 class ProcessingRunRepository:
     """Data access layer for batch processing run records."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock | None = None) -> None:
         """Initialize with an active database connection.
 
         Args:
             connection: SQLite connection.
+            lock: The connection's write lock (``Database.lock``), shared by
+                every repository on the connection.
         """
         self._conn = connection
+        self._lock = lock or threading.RLock()
 
     def start_run(self, source_path: str, total_files: int) -> int:
         """Record the start of a processing run.
@@ -453,12 +480,13 @@ class ProcessingRunRepository:
         Returns:
             Run ID.
         """
-        cursor = self._conn.execute(
-            """INSERT INTO processing_runs (source_path, total_files)
-               VALUES (?, ?)""",
-            (source_path, total_files),
-        )
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                """INSERT INTO processing_runs (source_path, total_files)
+                   VALUES (?, ?)""",
+                (source_path, total_files),
+            )
+            self._conn.commit()
         return cursor.lastrowid or 0
 
     def complete_run(
@@ -478,14 +506,15 @@ class ProcessingRunRepository:
             unmatched: Number unmatched.
             errors: Number of errors.
         """
-        self._conn.execute(
-            """UPDATE processing_runs
-               SET auto_matched = ?, needs_review = ?, unmatched = ?,
-                   errors = ?, completed_at = CURRENT_TIMESTAMP
-               WHERE id = ?""",
-            (auto_matched, needs_review, unmatched, errors, run_id),
-        )
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(
+                """UPDATE processing_runs
+                   SET auto_matched = ?, needs_review = ?, unmatched = ?,
+                       errors = ?, completed_at = CURRENT_TIMESTAMP
+                   WHERE id = ?""",
+                (auto_matched, needs_review, unmatched, errors, run_id),
+            )
+            self._conn.commit()
 
     def get_runs(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get recent processing runs.
@@ -508,20 +537,25 @@ class ApiCacheRepository:
 
     Avoids redundant network calls on resume / re-runs.  Each entry is
     keyed by a string (e.g. ``mb_recording:<mbid>``) and stores the raw
-    API response as JSON.
+    API response as JSON -- gzip-compressed (as a BLOB) once the body is
+    larger than ``API_CACHE_COMPRESS_MIN_BYTES``.  Plain-text rows written
+    by older versions are still read.
 
     Entries older than ``max_age_days`` are pruned on ``prune()``.
     """
 
     DEFAULT_MAX_AGE_DAYS = 30
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock | None = None) -> None:
         """Initialize with an active database connection.
 
         Args:
             connection: SQLite connection (with Row factory enabled).
+            lock: The connection's write lock (``Database.lock``), shared by
+                every repository on the connection.
         """
         self._conn = connection
+        self._lock = lock or threading.RLock()
 
     # --- Public API ---
 
@@ -534,16 +568,20 @@ class ApiCacheRepository:
         Returns:
             Deserialized JSON (dict or list), or ``None`` on miss.
         """
-        cursor = self._conn.execute(
-            "SELECT response_json FROM api_cache WHERE cache_key = ?",
-            (cache_key,),
-        )
-        row = cursor.fetchone()
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT response_json FROM api_cache WHERE cache_key = ?",
+                (cache_key,),
+            )
+            row = cursor.fetchone()
         if row is None:
             return None
+        raw = row["response_json"]
         try:
-            return cast("dict[str, Any] | list[Any]", json.loads(row["response_json"]))
-        except (json.JSONDecodeError, TypeError):
+            if isinstance(raw, bytes):
+                raw = gzip.decompress(raw)
+            return cast("dict[str, Any] | list[Any]", json.loads(raw))
+        except (json.JSONDecodeError, TypeError, UnicodeDecodeError, OSError, EOFError):
             return None
 
     def put(self, cache_key: str, data: dict | list) -> None:
@@ -556,12 +594,17 @@ class ApiCacheRepository:
             cache_key: The cache key.
             data: JSON-serializable response data.
         """
-        self._conn.execute(
-            """INSERT OR REPLACE INTO api_cache (cache_key, response_json, created_at)
-               VALUES (?, ?, CURRENT_TIMESTAMP)""",
-            (cache_key, json.dumps(data, ensure_ascii=False)),
-        )
-        self._conn.commit()
+        text = json.dumps(data, ensure_ascii=False)
+        body: str | bytes = text
+        if len(text) > API_CACHE_COMPRESS_MIN_BYTES:
+            body = gzip.compress(text.encode(), compresslevel=API_CACHE_COMPRESS_LEVEL)
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO api_cache (cache_key, response_json, created_at)
+                   VALUES (?, ?, CURRENT_TIMESTAMP)""",
+                (cache_key, body),
+            )
+            self._conn.commit()
 
     def prune(self, max_age_days: int | None = None) -> int:
         """Delete cache entries older than *max_age_days*.
@@ -573,11 +616,12 @@ class ApiCacheRepository:
             Number of rows deleted.
         """
         days = max_age_days if max_age_days is not None else self.DEFAULT_MAX_AGE_DAYS
-        cursor = self._conn.execute(
-            "DELETE FROM api_cache WHERE created_at < datetime('now', ?)",
-            (f"-{days} days",),
-        )
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM api_cache WHERE created_at < datetime('now', ?)",
+                (f"-{days} days",),
+            )
+            self._conn.commit()
         deleted = cursor.rowcount
         if deleted:
             logger.info("Pruned %d expired API cache entries", deleted)
@@ -523,7 +523,7 @@ class MainWindow(QMainWindow):
         review_items = []
         for track in result.tracks:
             if track.state.needs_user_action():
-                match_key = str(track.file_path)
+                match_key = track.path_str
                 match_result = result.match_results.get(match_key)
                 if match_result:
                     review_items.append((track, match_result))
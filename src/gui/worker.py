@@ -97,6 +97,7 @@ class ProcessingWorker(QObject):
             track_repo = self._config.get("_track_repo")
             api_cache = self._config.get("_api_cache")
             max_fp = self._config.get("max_concurrent_fingerprints")
+            max_lookups = self._config.get("max_concurrent_lookups")
             self._processor = BatchProcessor(
                 acoustid_api_key=acoustid_key,
                 discogs_token=discogs_token or None,
@@ -112,6 +113,7 @@ class ProcessingWorker(QObject):
                 move_repo=move_repo,
                 dry_run=self._dry_run,
                 max_concurrent_fingerprints=max_fp,
+                max_concurrent_lookups=max_lookups,
                 track_repo=track_repo,
                 api_cache=api_cache,
             )
@@ -285,9 +285,9 @@ def main() -> None:
 
     db = Database()
     db.connect()
-    move_repo = MoveHistoryRepository(db.connection)
-    track_repo = TrackRepository(db.connection)
-    api_cache = ApiCacheRepository(db.connection)
+    move_repo = MoveHistoryRepository(db.connection, db.lock)
+    track_repo = TrackRepository(db.connection, db.lock)
+    api_cache = ApiCacheRepository(db.connection, db.lock)
     api_cache.prune()  # Clean up expired cache entries on startup
     logger.info("Database initialized: %s", db._db_path)
 
@@ -16,6 +16,7 @@ from src.utils.constants import (
     DEFAULT_FILE_TEMPLATE,
     DEFAULT_FOLDER_TEMPLATE,
     DEFAULT_MAX_CONCURRENT_FINGERPRINTS,
+    DEFAULT_MAX_CONCURRENT_LOOKUPS,
     DEFAULT_REVIEW_THRESHOLD,
     DEFAULT_SINGLES_FOLDER,
     DEFAULT_THEME,
@@ -53,6 +54,7 @@ class AppConfig:
         archive_org_rate_limit: Seconds between Internet Archive requests.
         archive_org_enabled: Whether to use Internet Archive as a metadata source.
         max_concurrent_fingerprints: Number of parallel fingerprint operations.
+        max_concurrent_lookups: Number of tracks whose API lookups run in parallel.
         batch_size: Files per processing batch.
         theme: GUI theme ("dark" or "light").
         window_width: Initial GUI window width.
@@ -92,6 +94,7 @@ class AppConfig:
 
     # --- Processing ---
     max_concurrent_fingerprints: int = DEFAULT_MAX_CONCURRENT_FINGERPRINTS
+    max_concurrent_lookups: int = DEFAULT_MAX_CONCURRENT_LOOKUPS
     batch_size: int = DEFAULT_BATCH_SIZE
 
     # --- GUI ---
@@ -76,7 +76,8 @@ class MatchResult:
         candidates: List of match candidates, ordered by confidence (highest first).
         best_match_index: Index of the selected/best candidate, or None.
         acoustid_id: AcoustID identifier that was used for the lookup.
-        lookup_source: Primary source used for the lookup ('fingerprint' or 'fuzzy').
+        lookup_source: Primary source used for the lookup ('fingerprint', 'mbid'
+            for a recording ID already in the file's tags, or 'fuzzy').
     """
 
     candidates: list[MatchCandidate] = field(default_factory=list)
@@ -89,6 +89,11 @@ class Track:
     # --- Database ---
     id: int | None = None
 
+    # --- Compilation detection (internal) ---
+    # Inputs of the last CompilationDetector.detect() run that changed nothing,
+    # so a repeat call on the same tags can be skipped.
+    compilation_state: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Ensure file_path is a Path object and extract format."""
         if isinstance(self.file_path, str):
@@ -98,6 +103,15 @@ class Track:
         if self.file_format is None and self.file_path.suffix:
             self.file_format = self.file_path.suffix.lstrip(".").lower()
 
+    @property
+    def path_str(self) -> str:
+        """The file path as a string -- the key used for match results and resume state.
+
+        Computed from ``file_path`` on each access (``Path`` caches its own
+        string form), so it stays correct after the organizer moves the file.
+        """
+        return str(self.file_path)
+
     @property
     def display_title(self) -> str:
         """Human-readable title, falling back to filename."""
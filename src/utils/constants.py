@@ -32,6 +32,7 @@ WEIGHT_TITLE = 0.20
 WEIGHT_ARTIST = 0.20
 WEIGHT_DURATION = 0.10
 WEIGHT_ALBUM_CONSISTENCY = 0.10
+NEUTRAL_ALBUM_CONSISTENCY_SCORE = 50.0  # No album (or no batch context) to compare
 
 # --- Duration Match Tolerance ---
 DURATION_TOLERANCE_SECONDS = 3.0
@@ -48,28 +49,50 @@ MIN_API_RATE_INTERVAL = 1.5  # Conservative floor for all API calls (seconds)
 # --- API Retry / Timeout ---
 API_MAX_RETRIES = 3
 API_RETRY_BACKOFF_SECONDS = 3.0  # Base wait between retries (multiplied by attempt)
+API_RETRY_BACKOFF_MAX_SECONDS = 30.0  # Cap on exponential backoff (archive.org)
+API_RETRY_JITTER_SECONDS = 1.5  # Max random extra wait so parallel retries don't align
+API_RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})  # Transient HTTP errors
 API_TIMEOUT_SECONDS = 10  # Default HTTP request timeout
 COVER_ART_TIMEOUT_SECONDS = 15  # Cover art download timeout
 
+# --- API Response Cache (SQLite) ---
+API_CACHE_COMPRESS_MIN_BYTES = 512  # Smaller JSON bodies are stored as plain text
+API_CACHE_COMPRESS_LEVEL = 1  # gzip level: fastest, still ~5x smaller for JSON
+
 # --- AcoustID ---
 MAX_ACOUSTID_MATCHES = 3  # Maximum AcoustID results to fetch metadata for (reduced from 5)
 ACOUSTID_HIGH_CONFIDENCE = 0.95  # Score above which only top 1 match is fetched
 ACOUSTID_MEDIUM_CONFIDENCE = 0.85  # Score above which only top 2 matches are fetched
+ACOUSTID_PREFETCH_WORKERS = 2  # Lookups started ahead of the per-track pipeline
 
 # --- Processing ---
-PAUSE_CHECK_INTERVAL_SECONDS = 0.5  # Sleep interval when paused
+FINGERPRINT_PROGRESS_INTERVAL_SECONDS = 0.25  # Min gap between off-milestone GUI updates
+TRACK_SAVE_COMMIT_INTERVAL = 100  # Save-as-you-go: tracks per database commit
+RETRY_EXISTS_CHECK_WORKERS = 32  # Parallel stat() calls when re-checking report paths
 DEFAULT_BATCH_SIZE = 50
-# Auto-detect: use half the logical cores, minimum 2, so the GUI and OS stay responsive.
-# Users can override via max_concurrent_fingerprints in config.yaml.
+# Auto-detect: use half the cores this process may run on, minimum 2, so the GUI
+# and OS stay responsive.  Users can override via max_concurrent_fingerprints in
+# config.yaml.
 import os as _os  # noqa: E402
 
-DEFAULT_MAX_CONCURRENT_FINGERPRINTS = max(2, (_os.cpu_count() or 4) // 2)
+_USABLE_CPUS = (
+    len(_os.sched_getaffinity(0)) if hasattr(_os, "sched_getaffinity") else _os.cpu_count() or 4
+)
+DEFAULT_MAX_CONCURRENT_FINGERPRINTS = max(2, _USABLE_CPUS // 2)
+# On a spinning disk parallel fpcalc reads thrash the head; read one file at a time.
+ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS = 1
+# Phase 2 is I/O-bound (HTTP round-trips), so a small pool overlaps lookups
+# against different services; per-service rate limits still apply.
+DEFAULT_MAX_CONCURRENT_LOOKUPS = 4
 
 # --- File Organization ---
 DEFAULT_FOLDER_TEMPLATE = "{artist}/{album} ({year})"
 DEFAULT_FILE_TEMPLATE = "{track:02d} - {title}"
 DEFAULT_SINGLES_FOLDER = "Singles"
 DEFAULT_UNMATCHED_FOLDER = "_Unmatched"
+NAME_CASE_CACHE_SIZE = 8192  # Memoized title-case / artist-name normalizations
+FOLDER_NAME_CACHE_SIZE = 4096  # Memoized normalize_folder_name() results
+SANITIZE_FILENAME_CACHE_SIZE = 8192  # Memoized sanitize_filename() results
 
 # --- ID3 Tag Constants ---
 ID3_ENCODING_UTF8 = 3
@@ -96,8 +119,11 @@ MUSICBRAINZ_CONTACT = (
 
 # --- Fuzzy Matching ---
 FUZZY_MATCH_THRESHOLD = 80  # Minimum score (0-100) for a fuzzy match to be considered valid
+FUZZY_SIMILARITY_CACHE_SIZE = 8192  # Memoized (normalized) string-pair similarity scores
 
 # --- Filename Parsing ---
+FILENAME_PARSE_MAX_LENGTH = 512  # Characters of a filename stem fed to the tag-guessing regex
+FOLDER_TAGS_CACHE_SIZE = 4096  # Album folders whose implied artist/album tags are memoized
 # Folder names to skip when inferring artist/album from path
 SKIP_FOLDER_NAMES = frozenset(
     {
@@ -180,9 +206,17 @@ DJ_SCREW_FOLDER_VARIANTS = frozenset(
     }
 )
 
+ALBUM_CLASSIFY_CACHE_SIZE = 4096  # Memoized compilation / DJ Screw album-name checks
+SCREW_CHAPTER_CACHE_SIZE = 4096  # Memoized chapter parses of album and folder names
+
 # --- Internet Archive ---
 ARCHIVE_ORG_RATE_LIMIT = 1.0  # Seconds between archive.org requests
 ARCHIVE_ORG_TIMEOUT_SECONDS = 15  # HTTP request timeout for archive.org
+ARCHIVE_ORG_POOL_SIZE = 32  # Pooled keep-alive connections per archive.org host
+ARCHIVE_ORG_MAX_WORKERS = 8  # Concurrent item fetches in fetch_items_parallel()
+ARCHIVE_ORG_ITEM_CACHE_SIZE = 256  # Items whose metadata is kept in memory per session
+ARCHIVE_ORG_TITLE_CACHE_SIZE = 512  # Memoized album-title normalizations
+ARCHIVE_ORG_STREAM_PARSE_MIN_BYTES = 256 * 1024  # Stream-parse search responses above this size
 ARCHIVE_ORG_DJ_SCREW_COLLECTION = "dj-screw-discography"
 ARCHIVE_ORG_SEARCH_URL = "https://archive.org/advancedsearch.php"
 ARCHIVE_ORG_METADATA_URL = "https://archive.org/metadata"
@@ -198,3 +232,4 @@ MAX_TOTAL_PATH_LENGTH = 255
 # --- Report Strings ---
 REPORT_TITLE = "Fingerprint Flow -- Unmatched & Review Report"
 SECONDS_PER_MINUTE = 60
+SECONDS_PER_DAY = 86400
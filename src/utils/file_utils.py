@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import shutil
 from pathlib import Path
 
-from src.utils.constants import MAX_TOTAL_PATH_LENGTH, SUPPORTED_EXTENSIONS
+from src.utils.constants import (
+    FOLDER_NAME_CACHE_SIZE,
+    MAX_TOTAL_PATH_LENGTH,
+    NAME_CASE_CACHE_SIZE,
+    SANITIZE_FILENAME_CACHE_SIZE,
+    SUPPORTED_EXTENSIONS,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger("utils.file_utils")
@@ -126,6 +133,27 @@ _ARTIST_OVERRIDES = {
 }
 
 
+# Separators that folder names use in place of spaces ("DJ_Screw", "va-dj-screw")
+_FOLDER_SEPARATORS = str.maketrans({"_": " ", "-": " "})
+
+
+@functools.lru_cache(maxsize=FOLDER_NAME_CACHE_SIZE)
+def normalize_folder_name(name: str) -> str:
+    """Lowercase a folder name and turn ``_``/``-`` separators into spaces.
+
+    Memoized: the same library, artist and album folders appear in the path
+    of every track beneath them.
+
+    Args:
+        name: A single path component.
+
+    Returns:
+        The normalized, stripped name used for folder keyword matching.
+    """
+    return name.lower().translate(_FOLDER_SEPARATORS).strip()
+
+
+@functools.lru_cache(maxsize=NAME_CASE_CACHE_SIZE)
 def smart_title_case(text: str) -> str:
     """Apply intelligent title case to a string.
 
@@ -136,6 +164,8 @@ def smart_title_case(text: str) -> str:
     - Known artist names use their official capitalization
     - Words already in ALL CAPS with 2+ chars are left alone (intentional)
 
+    Results are memoized, since album names repeat for every track on the album.
+
     Args:
         text: Raw string to title-case.
 
@@ -155,7 +185,6 @@ def smart_title_case(text: str) -> str:
     last_idx = len(words) - 1
 
     for i, word in enumerate(words):
-        word.lower()
         word_stripped = word.strip("()[].,!?'\"")
         stripped_lower = word_stripped.lower()
 
@@ -178,10 +207,12 @@ def smart_title_case(text: str) -> str:
     return " ".join(result)
 
 
+@functools.lru_cache(maxsize=NAME_CASE_CACHE_SIZE)
 def normalize_artist_name(name: str) -> str:
     """Normalize an artist name with proper capitalization.
 
     Checks known artist overrides first, then applies smart title case.
+    Results are memoized -- artist names repeat heavily across a library.
 
     Args:
         name: Raw artist name.
@@ -295,12 +326,15 @@ _WINDOWS_RESERVED_NAMES = frozenset(
 MAX_COMPONENT_LENGTH = 240
 
 
+@functools.lru_cache(maxsize=SANITIZE_FILENAME_CACHE_SIZE)
 def sanitize_filename(name: str) -> str:
     """Remove or replace characters that are invalid in filenames.
 
     Also guards against Windows reserved device names (CON, PRN, AUX, NUL,
     COM1-COM9, LPT1-LPT9) and enforces a maximum component length.
 
+    Memoized: every track of an album sanitizes the same artist and album.
+
     Args:
         name: Raw filename string.
 
@@ -44,23 +44,21 @@ class RateLimiter:
         """
         lock = self._get_lock(service_name)
 
+        # Reserve the next free slot under the lock so concurrent callers for
+        # the same service are spaced min_interval apart instead of all
+        # waking from the same stale timestamp.
         with lock:
             now = time.monotonic()
-            last = self._last_call.get(service_name, 0.0)
-            elapsed = now - last
-            sleep_time = 0.0
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
+            last = self._last_call.get(service_name)
+            slot = now if last is None else max(now, last + min_interval)
+            self._last_call[service_name] = slot
+            sleep_time = slot - now
 
         # Sleep OUTSIDE the lock so other services aren't blocked
         if sleep_time > 0:
             logger.debug("Rate limit: sleeping %.2fs for %s", sleep_time, service_name)
             time.sleep(sleep_time)
 
-        # Re-acquire to stamp the actual call time
-        with lock:
-            self._last_call[service_name] = time.monotonic()
-
 
 # Global singleton for shared rate limiting across modules
 rate_limiter = RateLimiter()
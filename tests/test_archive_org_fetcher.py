@@ -0,0 +1,377 @@
+"""Tests for ArchiveOrgFetcher -- archive.org metadata parsing and index cache."""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from src.core.archive_org_fetcher import (
+    ArchiveOrgFetcher,
+    _parse_ia_filename,
+    _ScrewIndex,
+    _split_track_field,
+)
+from src.utils.constants import (
+    API_MAX_RETRIES,
+    ARCHIVE_ORG_CACHE_FILENAME,
+    ARCHIVE_ORG_POOL_SIZE,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ITEM_METADATA = {
+    "metadata": {
+        "title": "DJ Screw - Chapter 051. 9 Fo Shit (1994)",
+        "year": "1994",
+        "creator": "DJ Screw",
+    },
+    "files": [
+        {"name": "Front.jpg", "source": "original", "format": "JPEG"},
+        {
+            "name": "102. Big Moe - Barre Baby.mp3",
+            "source": "original",
+            "format": "VBR MP3",
+            "title": "Barre Baby",
+            "artist": "Big Moe",
+            "track": "102/107",
+            "length": "301.5",
+        },
+        {
+            "name": "101. Champ `n Mike - Keep `n Get.mp3",
+            "source": "original",
+            "format": "VBR MP3",
+            "track": "101/107",
+        },
+        {
+            "name": "101. Champ `n Mike - Keep `n Get.ogg",
+            "source": "derivative",
+            "format": "Ogg Vorbis",
+        },
+    ],
+}
+
+
+def _response(payload: object) -> MagicMock:
+    resp = MagicMock()
+    resp.content = json.dumps(payload).encode("utf-8")
+    resp.status_code = 200
+    resp.headers = {}
+    return resp
+
+
+@pytest.fixture
+def fetcher(tmp_path: Path) -> ArchiveOrgFetcher:
+    f = ArchiveOrgFetcher(cache_dir=tmp_path)
+    f._session = MagicMock()
+    return f
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.core.archive_org_fetcher.rate_limiter.wait", lambda *a: None)
+
+
+class TestFetchItemTracks:
+    def test_parses_original_audio_files(self, fetcher: ArchiveOrgFetcher):
+        fetcher._session.request.return_value = _response(ITEM_METADATA)
+        candidates = fetcher.fetch_item_tracks("DJScrewChapter051")
+
+        assert [c.track_number for c in candidates] == [1, 2]
+        first = candidates[0]
+        assert first.title == "Keep 'n Get"
+        assert first.artist == "Champ 'n Mike"
+        assert first.disc_number == 1
+        assert first.total_tracks == 7
+        assert first.album == "Chapter 051 - 9 Fo Shit"
+        assert first.year == 1994
+        assert first.cover_art_url is not None
+        assert first.cover_art_url.endswith("/DJScrewChapter051/Front.jpg")
+        assert candidates[1].duration == pytest.approx(301.5)
+
+    def test_item_not_found(self, fetcher: ArchiveOrgFetcher):
+        fetcher._session.request.return_value = _response([])
+        assert fetcher.fetch_item_tracks("missing") == []
+
+    def test_invalid_json(self, fetcher: ArchiveOrgFetcher):
+        resp = _response({})
+        resp.content = b"<html>not json</html>"
+        fetcher._session.request.return_value = resp
+        assert fetcher.fetch_item_tracks("broken") == []
+
+    def test_repeat_fetch_served_from_cache(
+        self, fetcher: ArchiveOrgFetcher, monkeypatch: pytest.MonkeyPatch
+    ):
+        waits: list[str] = []
+        monkeypatch.setattr(
+            "src.core.archive_org_fetcher.rate_limiter.wait", lambda name, _: waits.append(name)
+        )
+        fetcher._session.request.return_value = _response(ITEM_METADATA)
+        first = fetcher.fetch_item_tracks("DJScrewChapter051")
+        second = fetcher.fetch_item_tracks("DJScrewChapter051", album_override="Other")
+
+        assert fetcher._session.request.call_count == 1
+        assert len(waits) == 1
+        assert [c.title for c in second] == [c.title for c in first]
+        assert second[0].album == "Other"
+
+    def test_repeat_fetch_reuses_parsed_tracks(
+        self, fetcher: ArchiveOrgFetcher, monkeypatch: pytest.MonkeyPatch
+    ):
+        fetcher._session.request.return_value = _response(ITEM_METADATA)
+        first = fetcher.fetch_item_tracks("DJScrewChapter051")
+        parses: list[dict] = []
+        monkeypatch.setattr(fetcher, "_parse_track_file", lambda entry, **_: parses.append(entry))
+
+        first[0].confidence = 98.0
+        second = fetcher.fetch_item_tracks("DJScrewChapter051")
+
+        assert parses == []
+        assert [c.title for c in second] == [c.title for c in first]
+        # Callers get their own copies; changing one does not leak into the cache
+        assert second[0].confidence == 0.0
+
+    def test_failed_fetch_not_cached(self, fetcher: ArchiveOrgFetcher):
+        fetcher._session.request.side_effect = [
+            requests.ConnectionError("offline"),
+            _response(ITEM_METADATA),
+        ]
+        assert fetcher.fetch_item_tracks("DJScrewChapter051") == []
+        assert len(fetcher.fetch_item_tracks("DJScrewChapter051")) == 2
+
+    def test_disabled(self, tmp_path: Path):
+        f = ArchiveOrgFetcher(cache_dir=tmp_path, enabled=False)
+        assert f.fetch_item_tracks("anything") == []
+
+
+class TestParseHelpers:
+    def test_dotted_filename(self):
+        assert _parse_ia_filename("101. Champ `n Mike - Keep `n Get.mp3") == {
+            "track": "101",
+            "artist": "Champ 'n Mike",
+            "title": "Keep 'n Get",
+        }
+
+    def test_dashed_filename(self):
+        parsed = _parse_ia_filename("01 - Artist Name - Track Title.mp3")
+        assert parsed == {"track": "01", "artist": "Artist Name", "title": "Track Title"}
+
+    def test_unparseable_filename(self):
+        assert _parse_ia_filename("cover.jpg") is None
+
+    @pytest.mark.parametrize(
+        ("track_str", "expected"),
+        [
+            ("101/107", (1, 1, 7)),
+            ("212/219", (2, 12, 19)),
+            ("3/19", (None, 3, 19)),
+            ("7", (None, 7, None)),
+            ("x/12", (None, None, 12)),
+            ("", (None, None, None)),
+        ],
+    )
+    def test_split_track_field(self, track_str: str, expected: tuple):
+        assert _split_track_field(track_str) == expected
+
+    def test_normalize_chapter_title(self):
+        title = "DJ Screw - Chapter 051. 9 Fo Shit (1994)"
+        assert ArchiveOrgFetcher._normalize_album_title(title) == "Chapter 051 - 9 Fo Shit"
+
+    def test_normalize_non_chapter_title(self):
+        title = "DJ Screw - Only Rollin Red (1996)"
+        assert ArchiveOrgFetcher._normalize_album_title(title) == "Only Rollin Red"
+
+
+class TestSearchCollection:
+    def test_returns_docs(self, fetcher: ArchiveOrgFetcher):
+        docs = [{"identifier": "a", "title": "DJ Screw - Chapter 001. Syrup Sippers (1993)"}]
+        fetcher._session.request.return_value = _response({"response": {"docs": docs}})
+        assert fetcher.search_collection("dj-screw-discography") == docs
+
+    def test_logs_the_query(self, fetcher: ArchiveOrgFetcher, monkeypatch: pytest.MonkeyPatch):
+        logger = MagicMock()
+        monkeypatch.setattr("src.core.archive_org_fetcher.logger", logger)
+        fetcher._session.request.return_value = _response({"response": {"docs": []}})
+
+        fetcher.search_collection("dj-screw-discography", query="title:syrup")
+
+        assert "collection:dj-screw-discography AND (title:syrup)" in logger.debug.call_args.args
+
+
+class TestParseCollectionDocs:
+    def test_large_response_is_stream_parsed(self, monkeypatch: pytest.MonkeyPatch):
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("src.core.archive_org_fetcher.ARCHIVE_ORG_STREAM_PARSE_MIN_BYTES", 10)
+        body = json.dumps({"response": {"docs": [{"identifier": "a", "year": 1994}]}})
+        resp = MagicMock()
+        resp.headers = {"Content-Length": str(len(body))}
+        resp.raw = io.BytesIO(body.encode("utf-8"))
+        docs = ArchiveOrgFetcher._parse_collection_docs(resp, "collection:x")
+        assert docs == [{"identifier": "a", "year": 1994}]
+        resp.close.assert_called_once()
+
+
+class TestScrewIndexCache:
+    def test_save_and_reload_round_trip(self, tmp_path: Path):
+        index = {
+            51: {
+                "identifier": "DJScrewChapter051",
+                "title": "DJ Screw - Chapter 051. 9 Fo Shit (1994)",
+                "chapter_title": "9 Fo Shit",
+                "year": "1994",
+            }
+        }
+        writer = ArchiveOrgFetcher(cache_dir=tmp_path)
+        writer._screw_index = _ScrewIndex.from_entries(index)
+        writer._save_screw_index(tmp_path / ARCHIVE_ORG_CACHE_FILENAME)
+
+        reader = ArchiveOrgFetcher(cache_dir=tmp_path)
+        reader._session = MagicMock()
+        assert reader._get_screw_index().to_entries() == index
+        reader._session.request.assert_not_called()
+
+    def test_epoch_stamp_takes_precedence(self, tmp_path: Path):
+        (tmp_path / ARCHIVE_ORG_CACHE_FILENAME).write_text(
+            json.dumps(
+                {
+                    "cached_at": "2000-01-01T00:00:00+00:00",
+                    "cached_at_epoch": int(time.time()),
+                    "entries": {"51": {"identifier": "DJScrewChapter051"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        f = ArchiveOrgFetcher(cache_dir=tmp_path)
+        f._session = MagicMock()
+        assert len(f._get_screw_index()) == 1
+        f._session.request.assert_not_called()
+
+    def test_expired_cache_revalidated_with_304(self, tmp_path: Path):
+        cache_path = tmp_path / ARCHIVE_ORG_CACHE_FILENAME
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "cached_at": "2000-01-01T00:00:00+00:00",
+                    "last_modified": last_modified,
+                    "entries": {"51": {"identifier": "DJScrewChapter051"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+
+        f = ArchiveOrgFetcher(cache_dir=tmp_path)
+        f._session = MagicMock()
+        f._session.request.return_value = not_modified
+        index = f._get_screw_index()
+
+        entry = index.entry(51)
+        assert entry is not None
+        assert entry["identifier"] == "DJScrewChapter051"
+        sent_headers = f._session.request.call_args.kwargs["headers"]
+        assert sent_headers["If-Modified-Since"] == last_modified
+        saved = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert not saved["cached_at"].startswith("2000-")
+        assert saved["last_modified"] == last_modified
+
+
+class TestScrewIndex:
+    def test_add_replaces_existing_chapter(self):
+        index = _ScrewIndex()
+        index.add(51, identifier="old", title="t", chapter_title="9 Fo Shit", year="1994")
+        index.add(51, identifier="new", title="t", chapter_title="9 Fo Shit", year="1994")
+        assert len(index) == 1
+        entry = index.entry(51)
+        assert entry is not None
+        assert entry["identifier"] == "new"
+
+    def test_missing_chapter(self):
+        assert _ScrewIndex().entry(1) is None
+
+
+class TestLookupChapterByTitle:
+    @pytest.fixture
+    def indexed(self, tmp_path: Path) -> ArchiveOrgFetcher:
+        f = ArchiveOrgFetcher(cache_dir=tmp_path)
+        f._screw_index = _ScrewIndex.from_entries(
+            {
+                1: {"identifier": "a", "chapter_title": "Syrup Sippers"},
+                51: {"identifier": "b", "chapter_title": "9 Fo Shit"},
+                208: {"identifier": "c", "chapter_title": "Only Rollin Red"},
+                300: {"identifier": "d", "chapter_title": ""},
+            }
+        )
+        return f
+
+    def test_exact_title(self, indexed: ArchiveOrgFetcher):
+        assert indexed.lookup_chapter_by_title("Only Rollin Red") == 208
+
+    def test_case_and_whitespace_insensitive(self, indexed: ArchiveOrgFetcher):
+        assert indexed.lookup_chapter_by_title("  syrup SIPPERS ") == 1
+
+    def test_no_match(self, indexed: ArchiveOrgFetcher):
+        assert indexed.lookup_chapter_by_title("Abbey Road") is None
+
+
+class TestSession:
+    def test_adapter_pools_and_retries(self, tmp_path: Path):
+        f = ArchiveOrgFetcher(cache_dir=tmp_path)
+        adapter = f._session.get_adapter("https://archive.org/metadata/x")
+        assert adapter._pool_maxsize == ARCHIVE_ORG_POOL_SIZE
+        assert adapter.max_retries.total == API_MAX_RETRIES
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.backoff_jitter > 0
+
+    def test_client_error_not_retried(self, fetcher: ArchiveOrgFetcher):
+        resp = _response({})
+        resp.status_code = 404
+        fetcher._session.request.return_value = resp
+        assert fetcher.fetch_item_tracks("WrongIdentifier") == []
+        assert fetcher._session.request.call_count == 1
+
+    def test_request_error_returns_empty(self, fetcher: ArchiveOrgFetcher):
+        fetcher._session.request.side_effect = requests.ConnectionError("offline")
+        assert fetcher.fetch_item_tracks("DJScrewChapter051") == []
+
+
+class TestFetchItemsParallel:
+    def test_maps_each_identifier(self, fetcher: ArchiveOrgFetcher):
+        fetcher._session.request.return_value = _response(ITEM_METADATA)
+        results = fetcher.fetch_items_parallel(["a", "b", "a"], max_workers=2)
+        assert set(results) == {"a", "b"}
+        assert all(len(tracks) == 2 for tracks in results.values())
+        assert fetcher._session.request.call_count == 2
+
+    def test_empty(self, fetcher: ArchiveOrgFetcher):
+        assert fetcher.fetch_items_parallel([]) == {}
+
+
+class TestFindCoverArtUrl:
+    def test_prefers_front_over_earlier_cover(self):
+        files = [{"name": "cover.jpg"}, {"name": "Front.jpg"}]
+        url = ArchiveOrgFetcher._find_cover_art_url("item", files)
+        assert url is not None
+        assert url.endswith("/item/Front.jpg")
+
+    def test_named_cover_beats_item_image(self):
+        files = [{"name": "scan.jpg", "format": "Item Image"}, {"name": "folder.png"}]
+        url = ArchiveOrgFetcher._find_cover_art_url("item", files)
+        assert url is not None
+        assert url.endswith("/item/folder.png")
+
+    def test_item_image_fallback(self):
+        files = [{"name": "track.mp3"}, {"name": "scan.jpg", "format": "Item Image"}]
+        url = ArchiveOrgFetcher._find_cover_art_url("item", files)
+        assert url is not None
+        assert url.endswith("/item/scan.jpg")
+
+    def test_no_image(self):
+        assert ArchiveOrgFetcher._find_cover_art_url("item", [{"name": "a.mp3"}]) is None
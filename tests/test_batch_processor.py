@@ -0,0 +1,383 @@
+"""Tests for BatchProcessor -- per-track pipeline orchestration."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import batch_processor as bp_module
+from src.core.batch_processor import BatchProcessor, BatchResult
+from src.models.match_result import MatchCandidate
+from src.models.processing_state import ProcessingState
+from src.models.track import Track
+
+
+@pytest.fixture
+def processor() -> BatchProcessor:
+    """Create a BatchProcessor with fingerprinting disabled and 4 lookup workers."""
+    return BatchProcessor("test-key", fpcalc_available=False, max_concurrent_lookups=4)
+
+
+def _result(count: int) -> BatchResult:
+    tracks = [Track(file_path=Path(f"/music/track{i:02d}.mp3")) for i in range(count)]
+    result = BatchResult(tracks=tracks)
+    result.stats.total = count
+    return result
+
+
+class TestParallelPipeline:
+    def test_every_track_processed_once(self, processor: BatchProcessor):
+        result = _result(20)
+        seen: list[Path] = []
+        lock = threading.Lock()
+
+        def _fake(track: Track, res: BatchResult, step: int, total: int) -> None:
+            with lock:
+                seen.append(track.file_path)
+            with processor._result_lock:
+                res.stats.unmatched += 1
+
+        processor._process_single_track = _fake  # type: ignore[method-assign]
+        processor._process_tracks(result)
+
+        assert sorted(seen) == sorted(t.file_path for t in result.tracks)
+        assert result.stats.unmatched == 20
+
+    def test_album_consistency_uses_tags_read_before_lookups(self, processor: BatchProcessor):
+        result = _result(4)
+
+        def _read_tags(track: Track) -> Track:
+            track.title = f"Song {track.file_path.stem}"
+            track.artist = "UGK"
+            track.album = "Ridin Dirty"
+            return track
+
+        processor._tag_editor.read_tags = _read_tags  # type: ignore[method-assign]
+        fetcher = MagicMock()
+        fetcher.search_musicbrainz.side_effect = lambda title, artist, album=None: [
+            MatchCandidate(title=title, artist=artist, album="Ridin Dirty", source="musicbrainz")
+        ]
+        fetcher.search_discogs.return_value = []
+        processor._metadata_fetcher = fetcher
+        processor._archive_org = None  # type: ignore[assignment]
+        # What apply_match does to a track's tags mid-batch
+        processor.apply_match = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda track, candidate: setattr(track, "album", "Retagged")
+        )
+        counts: list[dict[str, int]] = []
+        score = processor._scorer.score_match_result
+
+        def _score(track, match_result, album_tracks=None, *, album_counts=None):
+            counts.append(dict(album_counts))
+            return score(track, match_result, album_tracks, album_counts=album_counts)
+
+        processor._scorer.score_match_result = _score  # type: ignore[method-assign]
+        processor._process_tracks(result)
+
+        assert counts == [{"Ridin Dirty": 4}] * 4
+        assert result.stats.scanned == 4
+
+    def test_errors_are_counted(self, processor: BatchProcessor):
+        result = _result(6)
+        processor._process_single_track = MagicMock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("boom")
+        )
+        processor._process_tracks(result)
+
+        assert result.stats.errors == 6
+        assert all(t.state == ProcessingState.ERROR for t in result.tracks)
+
+    def test_completed_tracks_are_saved(self):
+        repo = MagicMock()
+        repo.get_processed_paths.return_value = frozenset()
+        processor = BatchProcessor("test-key", fpcalc_available=False, track_repo=repo)
+        processor._process_single_track = MagicMock()  # type: ignore[method-assign]
+        result = _result(5)
+
+        processor._process_tracks(result)
+
+        # One transaction for the whole (sub-interval) batch, not one per track
+        repo.save_batch.assert_called_once()
+        saved = repo.save_batch.call_args.args[0]
+        assert sorted(t.file_path for t in saved) == sorted(t.file_path for t in result.tracks)
+        repo.save.assert_not_called()
+
+    def test_resume_skips_processed_paths(self):
+        repo = MagicMock()
+        repo.get_processed_paths.return_value = frozenset({"/music/track01.mp3"})
+        processor = BatchProcessor("test-key", fpcalc_available=False, track_repo=repo)
+        result = _result(3)
+
+        remaining = processor._skip_already_processed(result)
+
+        assert [t.file_path.name for t in remaining] == ["track00.mp3", "track02.mp3"]
+        assert result.tracks[1].state == ProcessingState.COMPLETED
+
+    def test_cancel_skips_remaining_tracks(self):
+        processor = BatchProcessor("test-key", fpcalc_available=False, max_concurrent_lookups=1)
+        calls: list[Track] = []
+
+        def _fake(track: Track, res: BatchResult, step: int, total: int) -> None:
+            calls.append(track)
+            processor.cancel()
+
+        processor._process_single_track = _fake  # type: ignore[method-assign]
+        processor._process_tracks(_result(10))
+
+        assert len(calls) == 1
+
+    def test_lookups_start_while_fingerprinting(self):
+        processor = BatchProcessor("test-key", fpcalc_available=True)
+        started = threading.Event()
+        overlapped: list[bool] = []
+
+        def _fake_batch(tracks, max_workers, progress_callback, cancel_check):
+            for done, track in enumerate(tracks, start=1):
+                track.fingerprint = "AQAA"
+                progress_callback(done, len(tracks), track)
+                if done == 1:
+                    # The first track's lookup runs before the rest are fingerprinted
+                    overlapped.append(started.wait(timeout=5))
+            return tracks
+
+        def _fake(track: Track, res: BatchResult, step: int, total: int) -> None:
+            started.set()
+
+        processor._fingerprinter.fingerprint_batch = _fake_batch  # type: ignore[method-assign]
+        processor._process_single_track = _fake  # type: ignore[method-assign]
+        result = _result(3)
+        processor._process_tracks(result)
+
+        assert overlapped == [True]
+        assert result.stats.fingerprinted == 3
+
+
+class TestAcoustIdPrefetch:
+    @staticmethod
+    def _fake_batch(tracks, max_workers, progress_callback, cancel_check):
+        for done, track in enumerate(tracks, start=1):
+            track.fingerprint = "AQAA"
+            track.duration = 180.0
+            progress_callback(done, len(tracks), track)
+        return tracks
+
+    def test_pipeline_uses_prefetched_lookup(self):
+        processor = BatchProcessor("test-key", fpcalc_available=True)
+        lookup = MagicMock(return_value=[("acid", 0.99, "rec", "Title")])
+        processor._fingerprinter.fingerprint_batch = self._fake_batch  # type: ignore[method-assign]
+        processor._fingerprinter.lookup = lookup  # type: ignore[method-assign]
+        matches: list[list] = []
+
+        def _fake(track: Track, res: BatchResult, step: int, total: int) -> None:
+            matches.append(processor._acoustid_lookup(track))
+
+        processor._process_single_track = _fake  # type: ignore[method-assign]
+        processor._process_tracks(_result(3))
+
+        # One lookup per track: the pipeline consumed the prefetch, not a second call
+        assert lookup.call_count == 3
+        assert all(m[0][2] == "rec" for m in matches)
+        assert processor._acoustid_prefetch == {}
+
+    def test_dj_screw_folder_is_not_prefetched(self):
+        processor = BatchProcessor("test-key", fpcalc_available=True)
+        processor._fingerprinter.lookup = MagicMock(return_value=[])  # type: ignore[method-assign]
+        track = Track(file_path=Path("/music/DJ Screw/Chapter 012/01.mp3"), fingerprint="AQAA")
+        pool = MagicMock()
+
+        processor._prefetch_acoustid(pool, track)
+
+        pool.submit.assert_not_called()
+
+
+class TestTaggedRecordingId:
+    def test_existing_mbid_skips_fuzzy_search(self, processor: BatchProcessor):
+        fetcher = MagicMock()
+        fetcher.fetch_recording.return_value = MatchCandidate(
+            title="Sitting Sidewayz", artist="Paul Wall", album="The Peoples Champ", source="mb"
+        )
+        processor._metadata_fetcher = fetcher
+        track = Track(
+            file_path=Path("/music/sidewayz.mp3"),
+            title="Sitting Sidewayz",
+            artist="Paul Wall",
+            musicbrainz_recording_id="rec-1",
+        )
+        result = BatchResult(tracks=[track])
+
+        processor._process_single_track_standard(track, result, 1, 1)
+
+        fetcher.fetch_recording.assert_called_once_with("rec-1")
+        fetcher.search_musicbrainz.assert_not_called()
+        fetcher.search_discogs.assert_not_called()
+        assert result.match_results[track.path_str].lookup_source == "mbid"
+
+    def test_failed_mbid_fetch_falls_back_to_search(self, processor: BatchProcessor):
+        fetcher = MagicMock()
+        fetcher.fetch_recording.return_value = None
+        fetcher.search_musicbrainz.return_value = []
+        fetcher.search_discogs.return_value = []
+        processor._metadata_fetcher = fetcher
+        processor._archive_org = None  # type: ignore[assignment]
+        track = Track(file_path=Path("/music/x.mp3"), title="X", musicbrainz_recording_id="gone")
+
+        processor._process_single_track_standard(track, BatchResult(tracks=[track]), 1, 1)
+
+        fetcher.search_musicbrainz.assert_called()
+
+
+class TestPauseResume:
+    def test_paused_worker_resumes_on_event(self, processor: BatchProcessor):
+        processor.pause()
+        outcome: list[bool] = []
+        waiter = threading.Thread(target=lambda: outcome.append(processor._wait_while_paused()))
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert waiter.is_alive()
+
+        processor.resume()
+        waiter.join(timeout=5)
+
+        assert outcome == [True]
+
+    def test_cancel_wakes_paused_worker(self, processor: BatchProcessor):
+        processor.pause()
+        outcome: list[bool] = []
+        waiter = threading.Thread(target=lambda: outcome.append(processor._wait_while_paused()))
+        waiter.start()
+
+        processor.cancel()
+        waiter.join(timeout=5)
+
+        assert outcome == [False]
+        # Pausing after a cancel must not block anything again
+        processor.pause()
+        assert processor._wait_while_paused() is False
+
+
+class TestGuessTagsFromFilename:
+    @pytest.mark.parametrize(
+        ("stem", "artist", "title", "disc", "track_no"),
+        [
+            ("Artist - Title", "Artist", "Title", None, None),
+            ("01 - Title", "Folder Artist", "Title", None, 1),
+            ("1-04 - Title", "Folder Artist", "Title", 1, 4),
+            ("1-01 Artist Name - Title", "Artist Name", "Title", 1, 1),
+            ("07 Artist Name - Title", "Artist Name", "Title", None, 7),
+            (
+                "Big Moe- Barre Baby (Ft. Big Pokey)",
+                "Big Moe",
+                "Barre Baby (Ft. Big Pokey)",
+                None,
+                None,
+            ),
+            ("03 Fat Pat -Tops Drop", "Fat Pat", "Tops Drop", None, None),
+            ("05 Hellraizer", "Folder Artist", "Hellraizer", None, 5),
+            ("2-12 ambitionz az a ridah", "Folder Artist", "ambitionz az a ridah", 2, 12),
+            ("Just A Title", "Folder Artist", "Just A Title", None, None),
+            ("01 -Intro", "01", "Intro", None, None),
+            ("1234 Title", "Folder Artist", "1234 Title", None, None),
+            ("Truncated Titl...", "Folder Artist", "Truncated Titl", None, None),
+        ],
+    )
+    def test_filename_shapes(
+        self,
+        processor: BatchProcessor,
+        stem: str,
+        artist: str,
+        title: str,
+        disc: int | None,
+        track_no: int | None,
+    ):
+        track = Track(file_path=Path(f"/library/Folder Artist/{stem}.mp3"))
+
+        processor._guess_tags_from_filename(track)
+
+        assert (track.artist, track.title, track.disc_number, track.track_number) == (
+            artist,
+            title,
+            disc,
+            track_no,
+        )
+
+    def test_existing_tags_are_kept(self, processor: BatchProcessor):
+        track = Track(
+            file_path=Path("/library/Folder Artist/1-04 Someone - Else.mp3"),
+            artist="Tagged",
+            track_number=9,
+        )
+
+        processor._guess_tags_from_filename(track)
+
+        assert (track.artist, track.title, track.disc_number, track.track_number) == (
+            "Tagged",
+            "Else",
+            1,
+            9,
+        )
+
+    @pytest.mark.parametrize(
+        "stem",
+        ["1" * 50_000, "1-" * 25_000, "01 " + " " * 50_000 + "x", "a" + " " * 50_000 + "-"],
+    )
+    def test_pathological_stems_parse_quickly(self, processor: BatchProcessor, stem: str):
+        track = Track(file_path=Path("/library/Folder Artist") / f"{stem}.mp3")
+
+        start = time.perf_counter()
+        processor._guess_tags_from_filename(track)
+
+        assert time.perf_counter() - start < 1.0
+
+    def test_four_digit_numbers_are_not_disc_track(self, processor: BatchProcessor):
+        track = Track(file_path=Path("/library/Folder Artist/1999-2004 Greatest Hits.mp3"))
+
+        processor._guess_tags_from_filename(track)
+
+        assert track.disc_number is None
+        assert track.title == "1999-2004 Greatest Hits"
+
+    def test_dj_folder_sets_album_and_album_artist(self, processor: BatchProcessor):
+        track = Track(file_path=Path("/library/DJ Screw/Chapter 012 - June 27th/05 Intro.mp3"))
+
+        processor._guess_tags_from_filename(track)
+
+        assert track.album_artist == "DJ Screw"
+        assert track.album == "Chapter 012 - June 27th"
+
+    def test_folder_tags_computed_once_per_directory(self, processor: BatchProcessor):
+        bp_module._folder_tags.cache_clear()
+        for i in range(5):
+            track = Track(file_path=Path(f"/library/Folder Artist/{i:02d} Song.mp3"))
+            processor._guess_tags_from_filename(track)
+            assert track.artist == "Folder Artist"
+
+        info = bp_module._folder_tags.cache_info()
+        assert (info.misses, info.hits) == (1, 4)
+
+
+class TestRetryUnmatched:
+    def test_only_existing_files_are_retried(self, processor: BatchProcessor, tmp_path: Path):
+        present = [tmp_path / f"{i:02d}.mp3" for i in range(40)]
+        for path in present:
+            path.write_bytes(b"data")
+        missing = tmp_path / "gone.mp3"
+        report = {
+            "unmatched": [{"file_path": str(p)} for p in [*present[:30], missing]],
+            "errors": [{"file_path": str(p)} for p in present[30:]],
+        }
+        processor.process_files = MagicMock(return_value="result")  # type: ignore[method-assign]
+
+        with patch.object(bp_module.ReportWriter, "load_unmatched_report", return_value=report):
+            assert processor.retry_unmatched(tmp_path) == "result"
+
+        processor.process_files.assert_called_once_with(present)
+
+    def test_nothing_to_retry(self, processor: BatchProcessor, tmp_path: Path):
+        report = {"unmatched": [{"file_path": str(tmp_path / "gone.mp3")}], "errors": []}
+
+        with patch.object(bp_module.ReportWriter, "load_unmatched_report", return_value=report):
+            assert processor.retry_unmatched(tmp_path) is None
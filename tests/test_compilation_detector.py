@@ -10,6 +10,7 @@ import pytest
 from src.core.compilation_detector import CompilationDetector
 from src.core.dj_screw_handler import DJScrewHandler
 from src.models.track import Track
+from src.utils import constants
 
 
 @pytest.fixture
@@ -74,6 +75,61 @@ class TestCompilationDetection:
         detector.detect(track)
         assert track.is_compilation is True
 
+    @pytest.mark.parametrize("album_artist", ["djscrew", "The DJ_Screw Collection"])
+    def test_dj_screw_spellings_in_album_artist(
+        self, detector: CompilationDetector, album_artist: str
+    ):
+        track = Track(file_path=Path("/fake.mp3"), album_artist=album_artist)
+        detector.detect(track)
+        assert track.is_compilation is True
+        assert track.album_artist == "DJ Screw"
+
+    @pytest.mark.parametrize(
+        ("folder", "album_artist"),
+        [
+            ("DJ_Screw_Discography", "DJ Screw"),
+            ("Screwed-Up Click", "DJ Screw"),
+            ("DJ Michael 5000 Watts", "DJ Michael 5000 Watts"),
+        ],
+    )
+    def test_folder_path_detection(
+        self, detector: CompilationDetector, folder: str, album_artist: str
+    ):
+        track = Track(
+            file_path=Path("/fake.mp3"),
+            original_path=Path(f"/Music/{folder}/Tape 1/01.mp3"),
+        )
+        detector.detect(track)
+        assert track.is_compilation is True
+        assert track.album_artist == album_artist
+
+
+class TestRepeatDetection:
+    def test_unchanged_track_skips_rerun(self, detector: CompilationDetector):
+        track = Track(file_path=Path("/music/UGK/Ridin Dirty/01.mp3"), artist="UGK", album="X")
+        detector.detect(track)
+        detector._detect = MagicMock()  # type: ignore[method-assign]
+
+        detector.detect(track)
+
+        detector._detect.assert_not_called()
+
+    def test_changed_tags_rerun(self, detector: CompilationDetector):
+        track = Track(file_path=Path("/music/a.mp3"), artist="UGK", album="Ridin Dirty")
+        detector.detect(track)
+        assert track.is_compilation is False
+
+        track.album_artist = "Various Artists"
+        detector.detect(track)
+
+        assert track.is_compilation is True
+
+    def test_run_that_changes_track_is_not_cached(self, detector: CompilationDetector):
+        track = Track(file_path=Path("/music/a.mp3"), album_artist="Various Artists")
+        detector.detect(track)
+
+        assert track.compilation_state is None
+
 
 class TestAlbumLooksLikeCompilation:
     def test_dj_prefix(self):
@@ -82,6 +138,13 @@ class TestAlbumLooksLikeCompilation:
     def test_chapter_pattern(self):
         assert CompilationDetector.album_looks_like_compilation("Chapter 051 - Some Title") is True
 
+    @pytest.mark.parametrize(
+        ("album", "expected"),
+        [("  DJ Quik Presents", True), ("The Last Chapter 2", False), ("Radj Songs", False)],
+    )
+    def test_prefixes_only_match_at_start(self, album: str, expected: bool):
+        assert CompilationDetector.album_looks_like_compilation(album) is expected
+
     def test_bootleg(self):
         assert CompilationDetector.album_looks_like_compilation("Bootleg Tape") is True
 
@@ -94,3 +157,34 @@ class TestAlbumLooksLikeCompilation:
     def test_none(self):
         # Should not crash
         assert CompilationDetector.album_looks_like_compilation(None) is False
+
+    @pytest.mark.parametrize(
+        "album",
+        ["Presents: DJ Khaled", "3 'N The Mornin Part Two", "Movie OST", "Greatest Hits 1990"],
+    )
+    def test_any_keyword_matches(self, album: str):
+        assert CompilationDetector.album_looks_like_compilation(album) is True
+
+    def test_result_is_memoized(self):
+        CompilationDetector.album_looks_like_compilation.cache_clear()
+        CompilationDetector.album_looks_like_compilation("Ridin Dirty")
+        CompilationDetector.album_looks_like_compilation("Ridin Dirty")
+        assert CompilationDetector.album_looks_like_compilation.cache_info().hits == 1
+
+
+class TestKeywordConstants:
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "COMPILATION_INDICATORS",
+            "KNOWN_DJS",
+            "SCREW_ALBUM_KEYWORDS",
+            "DJ_SCREW_FOLDER_VARIANTS",
+            "SKIP_FOLDER_NAMES",
+        ],
+    )
+    def test_lookup_sets_are_prenormalized(self, name: str):
+        # Callers compare against already-lowered input and never re-lower these
+        values = getattr(constants, name)
+        assert isinstance(values, frozenset)
+        assert all(v == v.strip().lower() for v in values)
@@ -0,0 +1,116 @@
+"""Tests for ConfidenceScorer -- weighted scoring and album consistency."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.confidence_scorer import ConfidenceScorer
+from src.models.match_result import MatchCandidate, MatchResult
+from src.models.track import Track
+
+
+@pytest.fixture
+def scorer() -> ConfidenceScorer:
+    return ConfidenceScorer()
+
+
+def _tracks(*albums: str | None) -> list[Track]:
+    return [Track(file_path=Path(f"/music/{i}.mp3"), album=a) for i, a in enumerate(albums)]
+
+
+class TestAlbumConsistency:
+    def test_fraction_of_matching_tracks(self, scorer: ConfidenceScorer):
+        batch = _tracks("Ridin Dirty", "Ridin Dirty", "Ridin Dirty", "Super Tight", None)
+        counts = scorer.count_albums(batch)
+        assert scorer._calculate_album_consistency("Ridin Dirty", counts) == pytest.approx(75.0)
+
+    def test_neutral_without_context(self, scorer: ConfidenceScorer):
+        counts = scorer.count_albums(_tracks("Ridin Dirty"))
+
+        assert scorer._calculate_album_consistency("Ridin Dirty", scorer.count_albums(None)) == 50.0
+        assert (
+            scorer._calculate_album_consistency("Ridin Dirty", scorer.count_albums(_tracks(None)))
+            == 50.0
+        )
+        assert scorer._calculate_album_consistency(None, counts) == 50.0
+
+    def test_score_match_result_matches_per_candidate_scoring(self, scorer: ConfidenceScorer):
+        track = Track(file_path=Path("/music/x.mp3"), title="Murder", artist="UGK")
+        batch = _tracks("Ridin Dirty", "Ridin Dirty", "Too Hard to Swallow")
+        candidates = [
+            MatchCandidate(title="Murder", artist="UGK", album="Ridin Dirty"),
+            MatchCandidate(title="Murda", artist="U.G.K.", album="Other"),
+        ]
+        expected = sorted(
+            (scorer.score_candidate(track, c, batch) for c in candidates), reverse=True
+        )
+
+        result = scorer.score_match_result(track, MatchResult(candidates=candidates), batch)
+
+        assert [c.confidence for c in result.candidates] == pytest.approx(expected)
+        assert result.best_match_index == 0
+
+    def test_precounted_albums_replace_batch(self, scorer: ConfidenceScorer):
+        track = Track(file_path=Path("/music/x.mp3"), title="Murder", artist="UGK")
+        batch = _tracks("Ridin Dirty", "Ridin Dirty", "Too Hard to Swallow")
+        expected = scorer.score_candidate(
+            track, MatchCandidate(title="Murder", artist="UGK", album="Ridin Dirty"), batch
+        )
+        candidates = [MatchCandidate(title="Murder", artist="UGK", album="Ridin Dirty")]
+
+        scorer.score_match_result(
+            track,
+            MatchResult(candidates=candidates),
+            _tracks("Other", "Other"),
+            album_counts=scorer.count_albums(batch),
+        )
+
+        assert candidates[0].confidence == pytest.approx(expected)
+
+    def test_shared_candidate_album_scored_once(self, scorer: ConfidenceScorer):
+        track = Track(file_path=Path("/music/x.mp3"), title="Murder", artist="UGK")
+        candidates = [
+            MatchCandidate(title="Murder", artist="UGK", album="Ridin Dirty"),
+            MatchCandidate(title="Murder (Remix)", artist="UGK", album="Ridin Dirty"),
+            MatchCandidate(title="Murder", artist="UGK", album="Underground Kingz"),
+        ]
+        batch = _tracks("Ridin Dirty", "Ridin Dirty")
+
+        with patch.object(
+            scorer, "_calculate_album_consistency", wraps=scorer._calculate_album_consistency
+        ) as consistency:
+            scorer.score_match_result(track, MatchResult(candidates=candidates), batch)
+
+        assert consistency.call_count == 2
+
+
+class TestScoreMatchResult:
+    def test_scores_all_candidates_in_one_pass(self, scorer: ConfidenceScorer):
+        track = Track(file_path=Path("/music/x.mp3"), title="Murder", artist="UGK", duration=300.0)
+        candidates = [
+            MatchCandidate(title="Murder", artist="UGK", duration=301.0, fingerprint_score=0.9),
+            MatchCandidate(title=None, artist="UGK", duration=330.0),
+            MatchCandidate(title="Murda", artist=None, fingerprint_score=0.4),
+        ]
+        expected = {id(c): scorer.score_candidate(track, c) for c in candidates}
+
+        with patch.object(scorer._fuzzy, "similarity", side_effect=AssertionError):
+            scorer.score_match_result(track, MatchResult(candidates=candidates))
+
+        assert {id(c): c.confidence for c in candidates} == pytest.approx(expected)
+
+    def test_albumless_candidates_skip_consistency_check(self, scorer: ConfidenceScorer):
+        track = Track(file_path=Path("/music/x.mp3"), title="Murder", artist="UGK")
+        candidates = [MatchCandidate(title="Murder", artist="UGK") for _ in range(3)]
+        batch = _tracks("Ridin Dirty", "Ridin Dirty")
+
+        with patch.object(scorer, "_calculate_album_consistency") as consistency:
+            scorer.score_match_result(track, MatchResult(candidates=candidates), batch)
+
+        consistency.assert_not_called()
+        assert candidates[0].confidence == pytest.approx(
+            scorer.score_candidate(track, candidates[0])
+        )
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.core import dj_screw_handler
 from src.core.dj_screw_handler import DJScrewHandler
+from src.core.fuzzy_matcher import FuzzyMatcher
+from src.models.match_result import MatchCandidate
 from src.models.track import Track
+from src.utils import constants
 
 
 @pytest.fixture
@@ -47,6 +51,24 @@ class TestIsDJScrewTrack:
         )
         assert DJScrewHandler.is_dj_screw_track(track) is True
 
+    def test_folder_separators_match_spaces(self):
+        for folder in ("DJ_Screw", "dj-screw", "Screwed_Up-Click"):
+            track = Track(file_path=Path(f"/Music/{folder}/track.mp3"))
+            assert DJScrewHandler.is_dj_screw_track(track) is True
+
+    def test_folder_match_does_not_span_parts(self):
+        # "dj" and "screw" in adjacent folders must not read as "dj screw"
+        track = Track(file_path=Path("/Music/dj/screw/track.mp3"))
+        assert DJScrewHandler.is_dj_screw_track(track) is False
+
+    def test_folder_variants_all_contain_screw(self):
+        # is_dj_screw_track skips the folder scan for paths without "screw"
+        assert all("screw" in v for v in constants.DJ_SCREW_FOLDER_VARIANTS)
+
+    def test_chapter_prefix_needs_number(self):
+        track = Track(file_path=Path("/f.mp3"), album="Chapters of Life")
+        assert DJScrewHandler.is_dj_screw_track(track) is False
+
 
 class TestNormalizeScrewAlbum:
     def test_chapter_with_title(self, handler: DJScrewHandler):
@@ -89,3 +111,127 @@ class TestNormalizeScrewAlbum:
         handler.normalize_screw_album(track)
         assert "DJ Screw" in track.album
         assert "Only Rollin Red" in track.album
+
+    @pytest.mark.parametrize(
+        ("album", "expected"),
+        [
+            ("doto chapter 3 - sky", ("Chapter 003 - Sky", "legacy prefix")),
+            ("d.o.t.o. [chapter 3 - sky] bootleg", ("Chapter 003 - Sky", "D.O.T.O.")),
+            ("dj screw: chapter 3. sky bootleg", ("Chapter 003 - Sky", "dj screw prefix")),
+            ("chapter 3 - (sky)", ("Chapter 003 - Sky", "chapter")),
+            ("chapter 3", None),
+        ],
+    )
+    def test_album_forms(self, album: str, expected: tuple[str, str] | None):
+        assert DJScrewHandler._canonical_screw_album(album) == expected
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (" 9 fo shit (1994) ", "9 fo shit"),
+            ("southside still holdin BOOTLEG", "southside still holdin"),
+            ("tape bootleg (1995)", "tape"),
+            ("tape (1995) bootleg", "tape (1995)"),
+            ("(leanin on a switch)", "leanin on a switch"),
+            ("(1994)", ""),
+            ("()", "()"),
+        ],
+    )
+    def test_clean_chapter_title(self, raw: str, expected: str):
+        assert DJScrewHandler._clean_chapter_title(raw) == expected
+
+    def test_album_parse_is_memoized(self, handler: DJScrewHandler):
+        DJScrewHandler._canonical_screw_album.cache_clear()
+        for i in range(3):
+            track = Track(file_path=Path(f"/{i}.mp3"), album="Chapter 51 - 9 Fo Shit")
+            handler.normalize_screw_album(track)
+            assert track.album == "Chapter 051 - 9 Fo Shit"
+
+        assert DJScrewHandler._canonical_screw_album.cache_info().hits == 2
+
+    def test_spellings_share_one_album_string(self, handler: DJScrewHandler):
+        tracks = [
+            Track(file_path=Path("/1.mp3"), album="Chapter 51 - 9 Fo Shit"),
+            Track(file_path=Path("/2.mp3"), album="DJ Screw - Chapter 51 - 9 Fo Shit"),
+        ]
+        for track in tracks:
+            handler.normalize_screw_album(track)
+
+        assert tracks[0].album == "Chapter 051 - 9 Fo Shit"
+        assert tracks[0].album is tracks[1].album
+
+
+class TestExtractScrewChapterInfo:
+    def test_chapter_in_album(self, handler: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), album="Chapter 051 - 9 Fo Shit")
+        assert handler.extract_screw_chapter_info(track) == (51, "9 fo shit")
+
+    def test_bare_chapter(self, handler: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), album="Chapter 7")
+        assert handler.extract_screw_chapter_info(track) == (7, None)
+
+    def test_chapter_from_folder(self, handler: DJScrewHandler):
+        track = Track(
+            file_path=Path("/f.mp3"),
+            album="Tapes",
+            album_artist="DJ Screw",
+            original_path=Path("/Music/DJ_Screw/Chapter_012-June_27th/01.mp3"),
+        )
+        assert handler.extract_screw_chapter_info(track) == (12, "june 27th")
+
+    def test_tape_title_looked_up_once(self, handler: DJScrewHandler):
+        lookup = handler._archive_org.lookup_chapter_by_title
+        lookup.return_value = 88
+        tracks = [
+            Track(
+                file_path=Path(f"/{i}.mp3"),
+                album="DJ Screw - Only Rollin Red",
+                album_artist="DJ Screw",
+            )
+            for i in range(4)
+        ]
+
+        results = {handler.extract_screw_chapter_info(t) for t in tracks}
+
+        assert results == {(88, "only rollin red")}
+        lookup.assert_called_once_with("only rollin red")
+
+
+class TestMatchTrackToIaCandidates:
+    @pytest.fixture
+    def matcher(self) -> DJScrewHandler:
+        return DJScrewHandler(MagicMock(), FuzzyMatcher())
+
+    def test_picks_title_match(self, matcher: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), title="Tops Drop", artist="Fat Pat", duration=240.0)
+        candidates = [
+            MatchCandidate(title="Intro", artist="DJ Screw", duration=60.0, track_number=1),
+            MatchCandidate(title="Tops Drop", artist="Fat Pat", duration=241.0, track_number=2),
+        ]
+        assert matcher.match_track_to_ia_candidates(track, candidates) is candidates[1]
+
+    def test_first_of_equal_scores_wins(self, matcher: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), title="Intro")
+        candidates = [MatchCandidate(title="Intro"), MatchCandidate(title="Intro")]
+        assert matcher.match_track_to_ia_candidates(track, candidates) is candidates[0]
+
+    def test_weak_match_rejected(self, matcher: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), title="Tops Drop", artist="Fat Pat")
+        candidates = [MatchCandidate(title="Wood Grain", artist="Big Pokey", duration=100.0)]
+        assert matcher.match_track_to_ia_candidates(track, candidates) is None
+        assert matcher.match_track_to_ia_candidates(track, []) is None
+
+    def test_similarities_computed_in_batch(self, matcher: DJScrewHandler):
+        track = Track(file_path=Path("/f.mp3"), title="Tops Drop", artist="Fat Pat")
+        candidates = [MatchCandidate(title=f"Song {i}", artist="Fat Pat") for i in range(10)]
+        candidates.append(MatchCandidate(title="Tops Drop", artist="Fat Pat"))
+
+        with patch.object(matcher._fuzzy, "similarity", side_effect=AssertionError):
+            assert matcher.match_track_to_ia_candidates(track, candidates) is candidates[-1]
+
+    @pytest.mark.parametrize(
+        ("candidate_duration", "expected"),
+        [(None, 50.0), (201.5, 100.0), (210.0, 80.0), (230.0, 50.0), (260.0, 10.0)],
+    )
+    def test_duration_steps(self, candidate_duration: float | None, expected: float):
+        assert dj_screw_handler._duration_similarity(200.0, candidate_duration) == expected
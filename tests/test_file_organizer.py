@@ -118,6 +118,63 @@ class TestBuildDestination:
         # Without track number, filename should just be the title
         assert dest.stem == "No Number"
 
+    @pytest.mark.parametrize(
+        ("folder_template", "file_template"),
+        [
+            ("{artist}/{albm}", "{track:02d} - {name}"),  # unknown fields
+            ("{}/{0}", "{track:0{width}d} - {title}"),  # positional / nested unknown
+            ("{artist/{album}", "{track:02d - {title}"),  # malformed braces
+        ],
+    )
+    def test_invalid_templates_use_defaults(
+        self, tmp_lib: Path, folder_template: str, file_template: str
+    ):
+        organizer = FileOrganizer(
+            library_path=tmp_lib, folder_template=folder_template, file_template=file_template
+        )
+        track = Track(
+            file_path=Path("/fake/song.mp3"),
+            title="My Song",
+            artist="The Artist",
+            album="Great Album",
+            year=2024,
+            track_number=3,
+        )
+
+        dest = organizer.preview_destination(track)
+
+        assert dest == tmp_lib / "The Artist" / "Great Album (2024)" / "03 - My Song.mp3"
+
+    def test_custom_templates(self, tmp_lib: Path):
+        organizer = FileOrganizer(
+            library_path=tmp_lib,
+            folder_template="{artist!s}/{year} - {album}",
+            file_template="{disc}-{track:03d} {title}",
+        )
+        track = Track(
+            file_path=Path("/fake/song.flac"),
+            title="Intro",
+            artist="UGK",
+            album="Ridin Dirty",
+            year=1996,
+            track_number=1,
+            disc_number=1,
+        )
+
+        dest = organizer.preview_destination(track)
+
+        assert dest == tmp_lib / "UGK" / "1996 - Ridin Dirty" / "1-001 Intro.flac"
+
+    def test_value_dependent_template_error_falls_back(self, tmp_lib: Path):
+        organizer = FileOrganizer(library_path=tmp_lib, folder_template="{artist}/{year:04d}")
+        track = Track(
+            file_path=Path("/fake/song.mp3"), title="Song", artist="Artist", album="Album"
+        )
+
+        dest = organizer.preview_destination(track)
+
+        assert dest.parent == tmp_lib / "Artist" / "Album (Unknown Year)"
+
 
 # ------------------------------------------------------------------
 # organize / rollback tests
@@ -190,6 +247,57 @@ class TestOrganize:
         result = organizer.organize(track2)
         assert result.error_message and "Duplicate" in result.error_message
 
+    def test_already_organized_is_skipped(self, organizer: FileOrganizer, tmp_path: Path):
+        track = Track(
+            file_path=_make_audio_file(tmp_path / "input"),
+            title="Song",
+            artist="Artist",
+            album="Album",
+            year=2024,
+            track_number=1,
+        )
+        organizer.organize(track)
+        organized = track.file_path
+
+        result = organizer.organize(track)
+
+        assert result.file_path == organized
+        assert organized.exists()
+        assert result.error_message is None
+        assert len(organizer.move_history) == 1
+
+    def test_already_organized_through_symlinked_library(self, tmp_path: Path):
+        real_lib = tmp_path / "real"
+        real_lib.mkdir()
+        alias = tmp_path / "alias"
+        try:
+            alias.symlink_to(real_lib, target_is_directory=True)
+        except OSError:
+            pytest.skip("cannot create symlinks here")
+        song = _make_audio_file(real_lib / "Artist" / "Album (2024)", "01 - Song.mp3")
+        organizer = FileOrganizer(library_path=alias, keep_originals=False)
+        track = Track(
+            file_path=song, title="Song", artist="Artist", album="Album", year=2024, track_number=1
+        )
+
+        result = organizer.organize(track)
+
+        assert result.file_path == song
+        assert result.error_message is None
+        assert organizer.move_history == []
+
+    def test_cleanup_stops_at_library_root(self, tmp_path: Path):
+        lib = tmp_path / "library"
+        organizer = FileOrganizer(library_path=lib, keep_originals=False)
+        lib.mkdir()
+        src = _make_audio_file(lib / "Incoming" / "Batch", "song.mp3")
+        track = Track(file_path=src, title="Song", artist="Artist", album="Album", year=2024)
+
+        organizer.organize(track)
+
+        assert not (lib / "Incoming").exists()
+        assert lib.is_dir()
+
     def test_rollback_last(self, organizer: FileOrganizer, tmp_lib: Path, tmp_path: Path):
         src = _make_audio_file(tmp_path / "input")
         original_path = src
@@ -333,6 +441,20 @@ class TestSafety:
         # The external directory should still exist (not cleaned up)
         assert (tmp_path / "external").exists()
 
+    def test_cleanup_removes_junk_but_keeps_real_files(self, tmp_lib: Path):
+        organizer = FileOrganizer(library_path=tmp_lib, keep_originals=False)
+        junk_only = tmp_lib / "Incoming" / "a"
+        with_art = tmp_lib / "Incoming" / "b"
+        for folder, extra in ((junk_only, "Thumbs.db"), (with_art, "folder.jpg")):
+            _make_audio_file(folder, "song.mp3")
+            (folder / extra).write_bytes(b"x")
+            (folder / ".DS_Store").write_bytes(b"x")
+            track = Track(file_path=folder / "song.mp3", title=folder.name, artist="Artist")
+            organizer.organize(track)
+
+        assert not junk_only.exists()
+        assert sorted(p.name for p in with_art.iterdir()) == [".DS_Store", "folder.jpg"]
+
     def test_dry_run_does_not_move_files(
         self,
         tmp_lib: Path,
@@ -9,6 +9,7 @@ from src.utils.file_utils import (
     get_file_size_mb,
     is_audio_file,
     normalize_artist_name,
+    normalize_folder_name,
     safe_copy,
     safe_move,
     sanitize_filename,
@@ -70,6 +71,12 @@ class TestSanitizeFilename:
     def test_unicode_preserved(self):
         assert sanitize_filename("Caf\u00e9 del Mar") == "Caf\u00e9 del Mar"
 
+    def test_result_is_memoized(self):
+        sanitize_filename.cache_clear()
+        for _ in range(3):
+            assert sanitize_filename("AC/DC") == "AC_DC"
+        assert sanitize_filename.cache_info().hits == 2
+
 
 # ---------------------------------------------------------------------------
 # safe_copy
@@ -309,6 +316,36 @@ class TestNormalizeArtistName:
     def test_none(self):
         assert normalize_artist_name(None) is None
 
+    def test_result_is_memoized(self):
+        normalize_artist_name.cache_clear()
+        normalize_artist_name("fat pat")
+        assert normalize_artist_name("fat pat") == "Fat Pat"
+        assert normalize_artist_name.cache_info().hits == 1
+
+
+# ---------------------------------------------------------------------------
+# normalize_folder_name
+# ---------------------------------------------------------------------------
+
+
+class TestNormalizeFolderName:
+    """Tests for normalize_folder_name()."""
+
+    def test_separators_become_spaces(self):
+        assert normalize_folder_name("VA_DJ-Screw") == "va dj screw"
+
+    def test_strips_edges(self):
+        assert normalize_folder_name("_Music- ") == "music"
+
+    def test_unicode_is_lowered(self):
+        assert normalize_folder_name("ÉPOCA_Ñ") == "época ñ"
+
+    def test_result_is_memoized(self):
+        normalize_folder_name.cache_clear()
+        for _ in range(3):
+            normalize_folder_name("DJ_Screw")
+        assert normalize_folder_name.cache_info().hits == 2
+
 
 # ---------------------------------------------------------------------------
 # get_file_size_mb
@@ -0,0 +1,32 @@
+"""Tests for Fingerprinter -- batch worker sizing."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.core import fingerprinter as fp_module
+from src.core.fingerprinter import default_fingerprint_workers
+from src.models.track import Track
+from src.utils.constants import (
+    DEFAULT_MAX_CONCURRENT_FINGERPRINTS,
+    ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS,
+)
+
+
+class TestDefaultFingerprintWorkers:
+    def test_spinning_disk_uses_single_worker(self):
+        tracks = [Track(file_path=Path("/music/a.mp3"))]
+        with patch.object(fp_module, "_is_rotational", return_value=True):
+            assert default_fingerprint_workers(tracks) == ROTATIONAL_MAX_CONCURRENT_FINGERPRINTS
+
+    def test_solid_state_uses_cpu_default(self):
+        tracks = [Track(file_path=Path("/music/a.mp3"))]
+        with patch.object(fp_module, "_is_rotational", return_value=False):
+            assert default_fingerprint_workers(tracks) == DEFAULT_MAX_CONCURRENT_FINGERPRINTS
+
+    def test_empty_batch(self):
+        assert default_fingerprint_workers([]) == DEFAULT_MAX_CONCURRENT_FINGERPRINTS
+
+    def test_unknown_storage_is_not_rotational(self, tmp_path: Path):
+        assert fp_module._is_rotational(tmp_path / "missing.mp3") is False
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.core.fuzzy_matcher import FuzzyMatcher
+from src.core.fuzzy_matcher import FuzzyMatcher, _weighted_similarity
 from src.models.match_result import MatchCandidate
 from src.models.track import Track
 
@@ -59,6 +59,26 @@ class TestSimilarity:
         assert score > 55.0
 
 
+class TestSimilarityCache:
+    def test_normalized_pairs_are_reused(self, matcher: FuzzyMatcher):
+        _weighted_similarity.cache_clear()
+        first = matcher.similarity("Ridin Dirty", "Ridin' Dirty")
+        second = matcher.similarity("  RIDIN DIRTY ", "ridin' dirty")
+        assert first == second
+        assert _weighted_similarity.cache_info().hits == 1
+
+
+class TestSimilarityMany:
+    def test_matches_pairwise_similarity(self, matcher: FuzzyMatcher):
+        choices = ["Ridin Dirty", "ridin' dirty", "RIDIN DIRTY", "", None, "Super Tight", "  x "]
+        expected = [matcher.similarity("Ridin Dirty", c) for c in choices]
+        assert matcher.similarity_many("Ridin Dirty", choices) == pytest.approx(expected)
+
+    def test_empty_query(self, matcher: FuzzyMatcher):
+        assert matcher.similarity_many("", ["a", "b"]) == [0.0, 0.0]
+        assert matcher.similarity_many("a", []) == []
+
+
 # ------------------------------------------------------------------
 # is_match tests
 # ------------------------------------------------------------------
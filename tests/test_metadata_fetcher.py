@@ -0,0 +1,63 @@
+"""Tests for MetadataFetcher -- search caching and result parsing."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import metadata_fetcher as mf_module
+from src.core.metadata_fetcher import MetadataFetcher
+
+_MB_RESULT = {
+    "recording-list": [
+        {
+            "id": "rec-1",
+            "title": "Sitting Sidewayz",
+            "artist-credit": [{"artist": {"name": "Paul Wall"}}],
+            "release-list": [{"id": "rel-1", "title": "The Peoples Champ", "date": "2005"}],
+        }
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit():
+    with patch.object(mf_module.rate_limiter, "wait"):
+        yield
+
+
+class TestSearchCache:
+    def test_repeated_musicbrainz_search_hits_memory(self):
+        fetcher = MetadataFetcher()
+        with patch.object(
+            mf_module.musicbrainzngs, "search_recordings", return_value=_MB_RESULT
+        ) as search:
+            first = fetcher.search_musicbrainz(title="Sitting Sidewayz", artist="Paul Wall")
+            second = fetcher.search_musicbrainz(title="Sitting Sidewayz", artist="Paul Wall")
+
+        assert search.call_count == 1
+        assert [c.title for c in first] == [c.title for c in second]
+        # Each call gets its own candidates so scoring one track can't leak into another
+        assert first[0] is not second[0]
+
+    def test_different_queries_are_not_shared(self):
+        fetcher = MetadataFetcher()
+        with patch.object(
+            mf_module.musicbrainzngs, "search_recordings", return_value=_MB_RESULT
+        ) as search:
+            fetcher.search_musicbrainz(title="Sitting Sidewayz", artist="Paul Wall")
+            fetcher.search_musicbrainz(title="Sittin Sidewayz", artist="Paul Wall")
+
+        assert search.call_count == 2
+
+    def test_api_cache_hit_is_remembered(self):
+        api_cache = MagicMock()
+        api_cache.get.return_value = {"results": [{"id": 7, "title": "UGK - Ridin Dirty"}]}
+        fetcher = MetadataFetcher(discogs_token="token", api_cache=api_cache)
+
+        fetcher.search_discogs(title="Murder", artist="UGK")
+        results = fetcher.search_discogs(title="Murder", artist="UGK")
+
+        assert api_cache.get.call_count == 1
+        assert results[0].album == "Ridin Dirty"
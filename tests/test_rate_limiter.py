@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import threading
 import time
 
@@ -51,3 +52,25 @@ class TestRateLimiter:
             t.join(timeout=5.0)
 
         assert len(results) == 5
+
+    def test_same_service_threads_are_spaced(self):
+        """Concurrent callers of one service must not fire at the same time."""
+        limiter = RateLimiter()
+        stamps: list[float] = []
+        stamps_lock = threading.Lock()
+
+        def worker():
+            limiter.wait("shared", 0.1)
+            with stamps_lock:
+                stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5.0)
+
+        stamps.sort()
+        gaps = [b - a for a, b in itertools.pairwise(stamps)]
+        assert len(stamps) == 4
+        assert all(gap >= 0.05 for gap in gaps)
@@ -0,0 +1,157 @@
+"""Tests for the SQLite repositories."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.db.database import CREATE_TABLES_SQL, SCHEMA_VERSION, Database
+from src.db.repositories import ApiCacheRepository, TrackRepository
+from src.models.track import Track
+from src.utils.constants import API_CACHE_COMPRESS_MIN_BYTES
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Generator[Database, None, None]:
+    database = Database(tmp_path / "test.db")
+    database.connect()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def cache(db: Database) -> ApiCacheRepository:
+    return ApiCacheRepository(db.connection)
+
+
+def _stored(db: Database, key: str) -> str | bytes:
+    row = db.connection.execute(
+        "SELECT response_json FROM api_cache WHERE cache_key = ?", (key,)
+    ).fetchone()
+    return row["response_json"]
+
+
+class TestApiCacheRepository:
+    def test_small_body_stored_as_text(self, db: Database, cache: ApiCacheRepository):
+        cache.put("k", {"a": 1})
+
+        assert isinstance(_stored(db, "k"), str)
+        assert cache.get("k") == {"a": 1}
+
+    def test_large_body_is_compressed(self, db: Database, cache: ApiCacheRepository):
+        data = {"results": [{"title": f"Track {i}", "artist": "DJ Screw"} for i in range(50)]}
+        assert len(json.dumps(data)) > API_CACHE_COMPRESS_MIN_BYTES
+
+        cache.put("big", data)
+
+        stored = _stored(db, "big")
+        assert isinstance(stored, bytes)
+        assert len(stored) < len(json.dumps(data))
+        assert cache.get("big") == data
+
+    def test_reads_legacy_text_rows(self, db: Database, cache: ApiCacheRepository):
+        db.connection.execute(
+            "INSERT INTO api_cache (cache_key, response_json) VALUES (?, ?)",
+            ("old", json.dumps([1, 2, 3])),
+        )
+
+        assert cache.get("old") == [1, 2, 3]
+
+    def test_corrupt_blob_is_a_miss(self, db: Database, cache: ApiCacheRepository):
+        db.connection.execute(
+            "INSERT INTO api_cache (cache_key, response_json) VALUES (?, ?)",
+            ("bad", b"not gzip"),
+        )
+
+        assert cache.get("bad") is None
+        assert cache.get("missing") is None
+
+
+class TestTrackRepository:
+    def test_processed_paths_only_terminal_states(self, db: Database):
+        for path, state in (("/music/done.mp3", "auto_matched"), ("/music/new.mp3", "pending")):
+            db.connection.execute(
+                "INSERT INTO tracks (file_path, state) VALUES (?, ?)", (path, state)
+            )
+
+        paths = TrackRepository(db.connection).get_processed_paths()
+
+        assert isinstance(paths, frozenset)
+        assert paths == {"/music/done.mp3"}
+
+    def test_save_round_trip(self, db: Database):
+        repo = TrackRepository(db.connection)
+        track = Track(file_path=Path("/music/a.mp3"), title="A", is_compilation=True)
+
+        track_id = repo.save(track)
+        loaded = repo.get_by_id(track_id)
+
+        assert loaded is not None
+        assert loaded.title == "A"
+        assert loaded.is_compilation is True
+
+    def test_save_batch_is_one_transaction(self, db: Database):
+        repo = TrackRepository(db.connection)
+        repo.save_batch(
+            [Track(file_path=Path("/music/a.mp3")), Track(file_path=Path("/music/b.mp3"))]
+        )
+        db.connection.rollback()
+        assert [t.file_path.name for t in repo.get_all()] == ["a.mp3", "b.mp3"]
+
+        bad = Track(file_path=Path("/music/c.mp3"))
+        bad.id = 1
+        bad.file_path = Path("/music/b.mp3")  # UNIQUE clash with the second row
+        with pytest.raises(sqlite3.Error):
+            repo.save_batch([Track(file_path=Path("/music/d.mp3")), bad])
+        assert [t.file_path.name for t in repo.get_all()] == ["a.mp3", "b.mp3"]
+
+    def test_writes_wait_for_the_shared_lock(self, db: Database):
+        repo = TrackRepository(db.connection, db.lock)
+        cache = ApiCacheRepository(db.connection, db.lock)
+
+        with db.lock:
+            # Another thread's write must not commit into this open transaction
+            db.connection.execute("INSERT INTO tracks (file_path) VALUES ('/music/x.mp3')")
+            writer = threading.Thread(target=cache.put, args=("k", {"v": 1}))
+            writer.start()
+            writer.join(timeout=0.2)
+            assert writer.is_alive()
+            db.connection.rollback()
+        writer.join()
+
+        assert cache.get("k") == {"v": 1}
+        assert repo.get_all() == []
+
+
+class TestMigrations:
+    def test_v3_database_gains_is_compilation(self, tmp_path: Path):
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        # The v3 schema is the current one without the is_compilation column
+        v3_schema = CREATE_TABLES_SQL.replace(
+            "    is_compilation INTEGER NOT NULL DEFAULT 0,\n", ""
+        )
+        conn.executescript(v3_schema)
+        conn.execute("INSERT INTO schema_version (version) VALUES (3)")
+        conn.commit()
+        conn.close()
+
+        database = Database(path)
+        try:
+            columns = {
+                row["name"] for row in database.connect().execute("PRAGMA table_info(tracks)")
+            }
+            version = database.connection.execute("SELECT version FROM schema_version").fetchone()
+        finally:
+            database.close()
+
+        assert "is_compilation" in columns
+        assert version[0] == SCHEMA_VERSION
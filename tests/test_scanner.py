@@ -0,0 +1,64 @@
+"""Tests for FileScanner -- audio file discovery."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.core.scanner import FileScanner
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    """Build a small tree with audio files, non-audio files, and nested folders."""
+    for rel in (
+        "b/02 - Two.mp3",
+        "b/01 - One.FLAC",
+        "a/Chapter 001/01 Intro.m4a",
+        "a/Chapter 001/cover.jpg",
+        "a/notes.txt",
+        "top.ogg",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"data")
+    return tmp_path
+
+
+class TestDiscoverAudioFiles:
+    def test_matches_rglob_order(self, library: Path):
+        scanner = FileScanner()
+        expected = [
+            p
+            for p in sorted(library.rglob("*"))
+            if p.is_file() and p.suffix.lower() in {".mp3", ".flac", ".m4a", ".ogg"}
+        ]
+
+        assert list(scanner._discover_audio_files(library)) == expected
+
+    def test_count_and_scan(self, library: Path):
+        scanner = FileScanner()
+
+        assert scanner.count_audio_files(library) == 4
+        tracks = scanner.scan(library)
+        assert [t.file_path.name for t in tracks] == [
+            "01 Intro.m4a",
+            "01 - One.FLAC",
+            "02 - Two.mp3",
+            "top.ogg",
+        ]
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+    def test_does_not_follow_directory_symlinks(self, library: Path):
+        try:
+            (library / "loop").symlink_to(library / "b", target_is_directory=True)
+        except OSError:
+            pytest.skip("cannot create symlinks here")
+
+        names = [p.name for p in FileScanner()._discover_audio_files(library)]
+        assert names.count("02 - Two.mp3") == 1